@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the video generation pipeline.
+
+Uses generated scenes, tone audio, synthetic TTS and a local mock TTS
+server, so it runs anywhere without a script, TTS provider or network.
+
+Usage:
+    python benchmark_pipeline.py encode
+    python benchmark_pipeline.py encode --scenes 20 --seconds 30 --resolution 1920x1080
+    python benchmark_pipeline.py tts --workers 1,4,8
+    python benchmark_pipeline.py tts --provider mock --latency 0.3 --rate-limit 10 --error-rate 0.05
+"""
+
+import sys
+import time
+import argparse
+import tempfile
+import threading
+import wave
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from audio.mock_tts_server import MockTTSServer
+from audio.tts_generator import TTSGenerator
+from visuals.scene_generator import SceneGenerator
+from video.compositor import VideoCompositor
+from video.encoder_profiles import PROFILES
+
+
+def _write_tone(path: Path, seconds: float, sample_rate: int = 22050):
+    """Write a quiet mono sine tone as 16-bit WAV."""
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    samples = (0.1 * np.sin(2 * np.pi * 220 * t) * 32767).astype(np.int16)
+    with wave.open(str(path), 'wb') as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(sample_rate)
+        f.writeframes(samples.tobytes())
+
+
+def benchmark_encode(args):
+    """Compare encoding backends on the same synthetic episode."""
+    width, height = map(int, args.resolution.split('x'))
+    work_dir = Path(tempfile.mkdtemp(prefix="bench_encode_"))
+
+    print(f"\n⏱️  Encoder benchmark: {args.scenes} scenes x {args.seconds}s "
+          f"@ {width}x{height} {args.fps}fps, profile {args.profile}")
+    print(f"   Work dir: {work_dir}")
+
+    generator = SceneGenerator(output_dir=str(work_dir / "scenes"), resolution=(width, height),
+                               write_files=False)
+    scenes = []
+    for i in range(args.scenes):
+        scene_path = generator.generate_chart_scene(
+            f"Scene {i + 1}", annotations=[f"Annotation {i + 1}"],
+            output_path=str(work_dir / f"scene_{i:02d}.png")
+        )
+        audio_path = work_dir / f"audio_{i:02d}.wav"
+        _write_tone(audio_path, args.seconds)
+        scenes.append({
+            'title': f"Scene {i + 1}",
+            'image': scene_path,
+            'frame': generator.get_frame(scene_path),
+            'audio': str(audio_path),
+            'duration': args.seconds,
+            'transition': 'fade'
+        })
+
+    compositor = VideoCompositor(output_dir=str(work_dir / "video"), resolution=(width, height),
+                                 fps=args.fps, encoder_profile=args.profile)
+    results = compositor.benchmark_backends(scenes, backends=tuple(args.backends.split(',')))
+
+    print(f"\n{'='*70}")
+    print(f"{'backend':<10} {'encode s':>10} {'x realtime':>12} {'kb/s':>10} {'MB':>8}")
+    print(f"{'-'*70}")
+    for stats in results:
+        print(f"{stats['backend']:<10} {stats['encode_seconds']:>10.2f} {stats['speed']:>12.1f} "
+              f"{stats['bitrate_kbps']:>10.0f} {stats['size_bytes'] / 1e6:>8.2f}")
+    print(f"{'='*70}")
+
+
+def _tts_segments(segments: int, sentences: int, edited: float = 0.0):
+    """Deterministic (segment_id, text) pairs; `edited` rewrites that fraction of sentences."""
+    step = max(1, round(1 / edited)) if edited else 0
+    batch = []
+    for i in range(segments):
+        lines = []
+        for k in range(sentences):
+            edited_line = step and (i * sentences + k) % step == 0
+            when = "that day" if edited_line else "that week"
+            lines.append(f"Segment {i + 1} sentence {k + 1} explains how the market reacted {when}.")
+        batch.append((f"segment_{i + 1:02d}", "\n".join(lines)))
+    return batch
+
+
+def _timed_run(tts: TTSGenerator, batch):
+    """Run a batch; returns (seconds, per-call latencies)."""
+    latencies = []
+    lock = threading.Lock()
+    generate = tts.provider.generate
+
+    def timed(text, output_path):
+        start = time.perf_counter()
+        try:
+            return generate(text, output_path)
+        finally:
+            with lock:
+                latencies.append(time.perf_counter() - start)
+
+    tts.provider.generate = timed
+    start = time.perf_counter()
+    tts.generate_batch(batch, show_progress=False)
+    elapsed = time.perf_counter() - start
+    tts.provider.generate = generate
+    return elapsed, np.array(latencies)
+
+
+def benchmark_tts(args):
+    """Measure sentence-parallel TTS throughput, tail latency and cache reuse."""
+    server = None
+    provider_kwargs = {}
+    if args.provider == "mock":
+        server = MockTTSServer(latency=args.latency, jitter=args.jitter, rate_limit=args.rate_limit,
+                               max_concurrent=args.max_concurrent, error_rate=args.error_rate, seed=args.seed)
+        provider_kwargs = {'api_key': 'benchmark', 'base_url': server.start(), 'retry_delay': 0.2,
+                           'max_retries': args.retries}
+        provider = "elevenlabs"
+    else:
+        provider = "synthetic"
+
+    total = args.segments * args.sentences
+    print(f"\n⏱️  TTS benchmark: {args.segments} segments x {args.sentences} sentences "
+          f"({total} total), provider {args.provider}")
+    if server:
+        print(f"   Mock server {server.base_url}: latency {args.latency}s + jitter {args.jitter}s, "
+              f"rate limit {args.rate_limit or '-'}/s, max concurrent {args.max_concurrent or '-'}, "
+              f"errors {args.error_rate:.0%}")
+
+    cold = _tts_segments(args.segments, args.sentences)
+    warm = _tts_segments(args.segments, args.sentences, edited=args.edited)
+
+    rows = []
+    for workers in map(int, args.workers.split(',')):
+        work_dir = Path(tempfile.mkdtemp(prefix="bench_tts_"))
+        tts = TTSGenerator(provider=provider, output_dir=str(work_dir), workers=workers, **provider_kwargs)
+        before = dict(server.stats) if server else {}
+        try:
+            cold_seconds, latencies = _timed_run(tts, cold)
+            warm_seconds, warm_latencies = _timed_run(tts, warm)
+        except Exception as e:
+            print(f"   ❌ {workers} workers: {e}")
+            continue
+        finally:
+            tts.close()
+        retried = (server.stats['rate_limited'] + server.stats['errors']
+                   - before.get('rate_limited', 0) - before.get('errors', 0)) if server else 0
+        rows.append((workers, cold_seconds, total / cold_seconds, *np.percentile(latencies, [50, 95, 99]),
+                     retried, len(warm_latencies), warm_seconds))
+
+    if server:
+        server.stop()
+
+    print(f"\n{'='*86}")
+    print(f"{'workers':>7} {'cold s':>8} {'sent/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+          f"{'retries':>8} {'resynth':>8} {'edit s':>8}")
+    print(f"{'-'*86}")
+    for workers, seconds, rate, p50, p95, p99, retried, resynth, warm_seconds in rows:
+        print(f"{workers:>7} {seconds:>8.2f} {rate:>8.1f} {p50 * 1000:>8.0f} {p95 * 1000:>8.0f} "
+              f"{p99 * 1000:>8.0f} {retried:>8} {resynth:>8} {warm_seconds:>8.2f}")
+    print(f"{'='*86}")
+    print(f"   'edit' re-runs the batch with {args.edited:.0%} of sentences changed; "
+          f"only those are synthesized again")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pipeline stages")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    encode = subparsers.add_parser("encode", help="Compare video encoding backends")
+    encode.add_argument("--scenes", type=int, default=10, help="Number of scenes (default: 10)")
+    encode.add_argument("--seconds", type=float, default=10.0, help="Seconds per scene (default: 10)")
+    encode.add_argument("--resolution", default="1920x1080", help="Resolution (default: 1920x1080)")
+    encode.add_argument("--fps", type=int, default=30, help="Frames per second (default: 30)")
+    encode.add_argument("--profile", choices=list(PROFILES), default="upload",
+                        help="Encoder profile (default: upload)")
+    encode.add_argument("--backends", default=",".join(VideoCompositor.BACKENDS),
+                        help="Comma-separated backends to compare")
+    encode.set_defaults(func=benchmark_encode)
+
+    tts = subparsers.add_parser("tts", help="Measure TTS batch throughput, latency and caching")
+    tts.add_argument("--provider", choices=["synthetic", "mock"], default="synthetic",
+                     help="synthetic (local, instant) or mock (ElevenLabs API on a local server)")
+    tts.add_argument("--segments", type=int, default=10, help="Number of segments (default: 10)")
+    tts.add_argument("--sentences", type=int, default=8, help="Sentences per segment (default: 8)")
+    tts.add_argument("--workers", default="1,4,8", help="Comma-separated worker counts (default: 1,4,8)")
+    tts.add_argument("--edited", type=float, default=0.1,
+                     help="Fraction of sentences changed for the cache run (default: 0.1)")
+    tts.add_argument("--latency", type=float, default=0.2, help="Mock base latency in seconds (default: 0.2)")
+    tts.add_argument("--jitter", type=float, default=0.1, help="Mock mean extra latency (default: 0.1)")
+    tts.add_argument("--rate-limit", type=float, help="Mock requests per second before 429s")
+    tts.add_argument("--max-concurrent", type=int, help="Mock concurrent requests before 429s")
+    tts.add_argument("--error-rate", type=float, default=0.0, help="Mock fraction of 500s (default: 0)")
+    tts.add_argument("--retries", type=int, default=6, help="Attempts per sentence (default: 6)")
+    tts.add_argument("--seed", type=int, default=0, help="Mock random seed (default: 0)")
+    tts.set_defaults(func=benchmark_tts)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
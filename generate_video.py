@@ -6,6 +6,7 @@ Usage:
     python generate_video.py scripts/my_script.md
     python generate_video.py scripts/my_script.md --tts elevenlabs
     python generate_video.py scripts/my_script.md --skip-video
+    python generate_video.py output/my_script.project.json
 """
 
 import sys
@@ -16,6 +17,10 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from video_generator import VideoGenerator
+from video.renditions import RENDITIONS, parse_renditions
+from video.encoder_profiles import PROFILES
+from video.compositor import VideoCompositor
+from video.transitions import TRANSITIONS
 
 
 def main():
@@ -36,16 +41,45 @@ Examples:
   # Test scene generation only
   python generate_video.py scripts/script_01.md --skip-audio --skip-video
 
+  # Fast 360p proxy preview with a contact sheet of all scenes
+  python generate_video.py scripts/script_01.md --preview
+
+  # High-quality master for the archive
+  python generate_video.py scripts/script_01.md --profile archive
+
+  # YouTube upload, mobile proxy and Shorts cut in one encode pass
+  python generate_video.py scripts/script_01.md --renditions 1080p,360p,vertical
+
+  # Re-render after editing output/script_01.project.json (only changed scenes are re-encoded)
+  python generate_video.py output/script_01.project.json
+
+  # Live preview: re-render changed sections on every save
+  python generate_video.py scripts/script_01.md --watch
+
+  # Pick up an interrupted run where it stopped
+  python generate_video.py scripts/script_01.md --resume
+
+  # Stickman narrator gesturing in the corner of every scene
+  python generate_video.py scripts/script_01.md --narrator
+
+Encoder Profiles:
+  draft       - ultrafast, small and rough (always used by --preview)
+  upload      - tuned for static slides, YouTube upload quality (default)
+  compact     - upload quality in smaller files, slower to encode
+  archive     - near-lossless constant frame rate master
+
 Available TTS Providers:
   system      - macOS built-in TTS (default, free)
   elevenlabs  - ElevenLabs TTS (high quality, requires API key)
   gtts        - Google TTS (free, lower quality)
+  piper       - Piper offline TTS for Linux (free, set PIPER_MODEL)
+  synthetic   - Placeholder tones timed like speech (tests, benchmarks)
         """
     )
 
     parser.add_argument(
         "script",
-        help="Path to markdown script file"
+        help="Path to markdown script file, or a <script>.project.json to re-render after editing"
     )
 
     parser.add_argument(
@@ -61,7 +95,7 @@ Available TTS Providers:
 
     parser.add_argument(
         "--tts",
-        choices=["system", "elevenlabs", "gtts"],
+        choices=["system", "elevenlabs", "gtts", "piper", "synthetic"],
         default="system",
         help="TTS provider (default: system)"
     )
@@ -79,6 +113,96 @@ Available TTS Providers:
         help="Frames per second (default: 30)"
     )
 
+    parser.add_argument(
+        "--profile",
+        choices=list(PROFILES),
+        default="upload",
+        help="Encoder profile (default: upload)"
+    )
+
+    parser.add_argument(
+        "--encoder-backend",
+        choices=list(VideoCompositor.BACKENDS),
+        default="moviepy",
+        help="Video encoding backend (default: moviepy; pyav encodes in-process)"
+    )
+
+    parser.add_argument(
+        "--renditions",
+        help=f"Comma-separated outputs encoded in one pass ({', '.join(RENDITIONS)} or WxH)"
+    )
+
+    parser.add_argument(
+        "--preview",
+        action="store_true",
+        help="Render a fast low-resolution proxy (360p, low frame rate, no fades)"
+    )
+
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and re-render a preview of the changed sections whenever the script is saved"
+    )
+
+    parser.add_argument(
+        "--contact-sheet",
+        action="store_true",
+        help="Write a contact-sheet PNG of all scenes (always on with --preview)"
+    )
+
+    parser.add_argument(
+        "--narrator",
+        action="store_true",
+        help="Add a gesturing stickman narrator to every scene"
+    )
+
+    parser.add_argument(
+        "--transition",
+        choices=list(TRANSITIONS) + ["none"],
+        default="fade",
+        help="Transition into each scene (default: fade)"
+    )
+
+    parser.add_argument(
+        "--motion",
+        action="store_true",
+        help="Slow Ken Burns pan/zoom on still scenes"
+    )
+
+    parser.add_argument(
+        "--burn-captions",
+        action="store_true",
+        help="Draw voiceover captions into the video (SRT/VTT files are always written)"
+    )
+
+    parser.add_argument(
+        "--no-normalize",
+        action="store_true",
+        help="Keep raw TTS audio (no silence trimming or loudness normalization)"
+    )
+
+    parser.add_argument(
+        "--no-scene-files",
+        action="store_true",
+        help="Don't write scene PNGs (scenes go to the encoder in memory)"
+    )
+
+    parser.add_argument(
+        "--scratch-dir",
+        help="Parent of the job's private scratch directory (default: /dev/shm when it has room, else the temp dir)"
+    )
+
+    parser.add_argument(
+        "--catalog",
+        help="Asset catalog shared across episodes (default: <output-dir>/catalog.db)"
+    )
+
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted run from its journal, output/<script>.journal.jsonl (reuses finished scenes, voiceovers and video)"
+    )
+
     parser.add_argument(
         "--skip-audio",
         action="store_true",
@@ -113,11 +237,29 @@ Available TTS Providers:
         print("   Use format: WIDTHxHEIGHT (e.g., 1920x1080)")
         sys.exit(1)
 
+    renditions = None
+    if args.renditions:
+        try:
+            renditions = parse_renditions(args.renditions)
+        except ValueError as e:
+            print(f"❌ Error: {e}")
+            sys.exit(1)
+
     # Initialize generator
     print(f"\n🎬 Initializing Video Generator")
     print(f"   TTS Provider: {args.tts}")
-    print(f"   Resolution: {resolution[0]}x{resolution[1]}")
-    print(f"   FPS: {args.fps}")
+    # Watch mode always renders the preview proxy
+    args.preview = args.preview or args.watch
+
+    if args.preview:
+        print(f"   Mode: PREVIEW ({VideoGenerator.PREVIEW_RESOLUTION[0]}x{VideoGenerator.PREVIEW_RESOLUTION[1]} @ {VideoGenerator.PREVIEW_FPS}fps)")
+    else:
+        print(f"   Resolution: {resolution[0]}x{resolution[1]}")
+        print(f"   FPS: {args.fps}")
+        print(f"   Encoder profile: {args.profile}")
+        print(f"   Encoder backend: {args.encoder_backend}")
+    if renditions and not args.preview:
+        print(f"   Renditions: {', '.join(r.name for r in renditions)}")
 
     try:
         generator = VideoGenerator(
@@ -126,19 +268,52 @@ Available TTS Providers:
             resolution=resolution,
             fps=args.fps,
             use_llm_for_scenes=bool(args.llm_endpoint),
-            llm_endpoint=args.llm_endpoint
+            llm_endpoint=args.llm_endpoint,
+            preview=args.preview,
+            contact_sheet=args.contact_sheet,
+            renditions=renditions,
+            encoder_profile=args.profile,
+            write_scene_files=not args.no_scene_files,
+            encoder_backend=args.encoder_backend,
+            narrator=args.narrator,
+            motion=args.motion,
+            transition=None if args.transition == "none" else args.transition,
+            burn_captions=args.burn_captions,
+            normalize_audio=not args.no_normalize,
+            scratch_root=args.scratch_dir,
+            catalog_path=args.catalog
         )
     except Exception as e:
         print(f"\n❌ Error initializing generator: {e}")
         sys.exit(1)
 
+    if args.watch:
+        try:
+            generator.watch(str(script_path), output_filename=args.output)
+        except KeyboardInterrupt:
+            print("\n\n👋 Stopped watching")
+        return
+
+    # Re-render an edited project file
+    if script_path.suffix == ".json":
+        try:
+            result = generator.render_project(str(script_path), output_filename=args.output)
+        except Exception as e:
+            print(f"\n❌ Error rendering project: {e}")
+            import traceback
+            traceback.print_exc()
+            sys.exit(1)
+        print(f"\n  🎬 Video: {result['video']}")
+        return
+
     # Generate video
     try:
         result = generator.generate_from_script(
             script_path=str(script_path),
             output_filename=args.output,
             skip_audio=args.skip_audio,
-            skip_video=args.skip_video
+            skip_video=args.skip_video,
+            resume=args.resume
         )
 
         print(f"\n{'='*70}")
@@ -151,12 +326,21 @@ Available TTS Providers:
         if result['audio']:
             print(f"  🎤 Audio: {len(result['audio'])} files")
 
-        if result['video']:
+        if result.get('contact_sheet'):
+            print(f"  🗂️  Contact sheet: {result['contact_sheet']}")
+
+        if result.get('captions'):
+            print(f"  💬 Captions: {', '.join(result['captions'].values())}")
+
+        if result.get('renditions'):
+            for name, path in result['renditions'].items():
+                print(f"  🎬 Video ({name}): {path}")
+        elif result['video']:
             print(f"  🎬 Video: {result['video']}")
             print(f"\n▶️  Play video:")
             print(f"     open {result['video']}")
 
-        print(f"\n📋 Full manifest: {Path(result['output_dir']) / 'manifest.json'}")
+        print(f"\n📋 Full manifest: {result['manifest']}")
 
     except KeyboardInterrupt:
         print("\n\n⚠️  Generation cancelled by user")
@@ -165,6 +349,7 @@ Available TTS Providers:
         print(f"\n❌ Error during generation: {e}")
         import traceback
         traceback.print_exc()
+        print(f"\n♻️  Finished work is journaled; rerun with --resume to continue")
         sys.exit(1)
 
 
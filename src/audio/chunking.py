@@ -0,0 +1,162 @@
+"""
+Chunking - Split voiceover into sentences and stitch their audio back.
+
+Voiceover is synthesized sentence by sentence so that each sentence can
+be cached on its own and synthesized in parallel. Line breaks in the
+script are sentence boundaries, blank lines paragraph boundaries, and
+long lines are split after sentence punctuation.
+
+Stitching places the sentences with a short silence between them (a
+longer one between paragraphs). Every chunk fades in and out over a few
+milliseconds and neighbouring chunks overlap by that fade, so the joins
+are crossfades rather than clicks. All of it is NumPy over the sample
+arrays.
+"""
+
+import re
+import wave
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+
+SAMPLE_RATE = 44100
+
+# Silence between chunks, in seconds
+SENTENCE_GAP = 0.15
+PARAGRAPH_GAP = 0.4
+
+# Fade at each chunk edge; neighbours overlap by this much
+CROSSFADE = 0.01
+
+# A period after these doesn't end a sentence ("U.S. President", "Dr. No")
+_ABBREVIATION = re.compile(r'(?:\b(?:[A-Za-z]\.){2,}|\b(?:Mr|Mrs|Ms|Dr|St|vs|etc|Inc|Jr|Sr|No)\.)$')
+_SENTENCE_END = re.compile(r'(?<=[.!?…])["”\')\]]*\s+')
+
+
+def split_sentences(text: str) -> List[Tuple[str, bool]]:
+    """
+    Split voiceover text into sentence chunks.
+
+    Args:
+        text: Voiceover text; line breaks and blank lines are kept as
+            sentence and paragraph boundaries
+
+    Returns:
+        (sentence, ends_paragraph) pairs in reading order
+    """
+    chunks: List[Tuple[str, bool]] = []
+    for paragraph in re.split(r'\n\s*\n', text):
+        sentences = []
+        for line in paragraph.split('\n'):
+            line = ' '.join(line.split())
+            if not line:
+                continue
+            start = 0
+            for match in _SENTENCE_END.finditer(line):
+                if _ABBREVIATION.search(line[start:match.start()]):
+                    continue
+                sentences.append(line[start:match.end()].strip())
+                start = match.end()
+            if line[start:].strip():
+                sentences.append(line[start:].strip())
+        chunks.extend((sentence, i == len(sentences) - 1) for i, sentence in enumerate(sentences))
+    return chunks
+
+
+def load_samples(path: str, rate: int = SAMPLE_RATE) -> np.ndarray:
+    """
+    Decode an audio file to mono float32 samples in -1..1.
+
+    WAV data is read directly (whatever the file extension); other
+    formats go through pydub (ffmpeg).
+
+    Args:
+        path: Audio file
+        rate: Output sample rate
+
+    Returns:
+        Samples (n,)
+    """
+    with open(path, 'rb') as f:
+        is_wav = f.read(12)[8:12] == b'WAVE'
+    if is_wav:
+        with wave.open(str(path), 'rb') as w:
+            width, channels, source_rate = w.getsampwidth(), w.getnchannels(), w.getframerate()
+            raw = w.readframes(w.getnframes())
+        if width == 2:
+            samples = np.frombuffer(raw, dtype='<i2').astype(np.float32) / 32768.0
+        elif width == 4:
+            samples = np.frombuffer(raw, dtype='<i4').astype(np.float32) / 2147483648.0
+        elif width == 1:
+            samples = (np.frombuffer(raw, dtype=np.uint8).astype(np.float32) - 128) / 128.0
+        else:
+            raise ValueError(f"Unsupported WAV sample width: {width}")
+        samples = samples.reshape(-1, channels).mean(axis=1)
+        return resample(samples, source_rate, rate)
+
+    try:
+        from pydub import AudioSegment
+    except ImportError:
+        raise ImportError("pydub package required: pip install pydub")
+    audio = AudioSegment.from_file(str(path)).set_channels(1).set_frame_rate(rate).set_sample_width(2)
+    return np.frombuffer(audio.raw_data, dtype='<i2').astype(np.float32) / 32768.0
+
+
+def resample(samples: np.ndarray, source_rate: int, rate: int) -> np.ndarray:
+    """Linear-interpolation resample (speech only needs to stay intelligible)."""
+    if source_rate == rate or not len(samples):
+        return samples
+    n = int(round(len(samples) * rate / source_rate))
+    positions = np.arange(n) * (source_rate / rate)
+    return np.interp(positions, np.arange(len(samples)), samples).astype(np.float32)
+
+
+def stitch(
+    chunks: Sequence[np.ndarray],
+    gaps: Sequence[float],
+    rate: int = SAMPLE_RATE,
+    crossfade: float = CROSSFADE
+) -> np.ndarray:
+    """
+    Join chunks with silence between them and crossfaded edges.
+
+    Args:
+        chunks: Mono sample arrays in order
+        gaps: Silence after each chunk except the last, in seconds
+        rate: Sample rate
+        crossfade: Fade length at each chunk edge, in seconds; adjacent
+            chunks overlap by this much
+
+    Returns:
+        Stitched samples
+    """
+    if not chunks:
+        return np.zeros(0, dtype=np.float32)
+
+    fade = int(round(crossfade * rate))
+    lengths = np.array([len(chunk) for chunk in chunks])
+    advances = lengths[:-1] + np.round(np.asarray(gaps[:len(chunks) - 1]) * rate).astype(int) - fade
+    starts = np.concatenate([[0], np.cumsum(np.maximum(advances, 0))])
+    out = np.zeros(int((starts + lengths).max()), dtype=np.float32)
+
+    for start, chunk in zip(starts, chunks):
+        chunk = np.array(chunk, dtype=np.float32)
+        n = min(fade, len(chunk) // 2)
+        if n:
+            ramp = np.linspace(0.0, 1.0, n + 2, dtype=np.float32)[1:-1]
+            chunk[:n] *= ramp
+            chunk[-n:] *= ramp[::-1]
+        out[start:start + len(chunk)] += chunk
+    return out
+
+
+def write_wav(path: str, samples: np.ndarray, rate: int = SAMPLE_RATE) -> str:
+    """Write mono float samples as 16-bit PCM WAV."""
+    pcm = (np.clip(samples, -1.0, 1.0) * 32767).astype('<i2')
+    with wave.open(str(path), 'wb') as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(pcm.tobytes())
+    return str(path)
@@ -0,0 +1,215 @@
+"""
+Mock TTS Server - A local stand-in for the ElevenLabs HTTP API.
+
+Serves POST /v1/text-to-speech/<voice_id> like the real API (xi-api-key
+header, JSON body with 'text') and answers with synthetic speech timed at
+a fixed words-per-minute rate, after a configurable delay. It can also
+reject requests the way the real service does under load: 429 when a
+request-rate or concurrency limit is exceeded (with Retry-After), and
+500 at a given error rate. Randomness is seeded, so runs are repeatable.
+
+Point ElevenLabsTTS at it with base_url (or ELEVEN_BASE_URL) to measure
+batch throughput, tail latency, retries and caching without a network:
+
+    cd src
+    python -m audio.mock_tts_server --port 8765 --latency 0.3 --rate-limit 5
+    ELEVEN_API_KEY=test ELEVEN_BASE_URL=http://127.0.0.1:8765 \
+        python ../generate_video.py ../scripts/my_script.md --tts elevenlabs
+"""
+
+import argparse
+import json
+import math
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+from .tts_generator import synthetic_wav
+
+
+_TTS_PATH = re.compile(r'^/v1/text-to-speech/([^/?]+)(?:/stream)?(?:\?.*)?$')
+
+
+class MockTTSServer:
+    """Threaded HTTP server emulating the ElevenLabs text-to-speech endpoint."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.2,
+        jitter: float = 0.1,
+        rate_limit: Optional[float] = None,
+        max_concurrent: Optional[int] = None,
+        error_rate: float = 0.0,
+        wpm: int = 160,
+        seed: int = 0
+    ):
+        """
+        Initialize mock server.
+
+        Args:
+            host: Interface to listen on
+            port: Port (0 picks a free one)
+            latency: Base response delay in seconds
+            jitter: Mean of an exponential extra delay, which gives the
+                long tail real services show
+            rate_limit: Requests per second allowed (token bucket with a
+                one-second burst); None for no limit
+            max_concurrent: Requests served at once; None for no limit
+            error_rate: Fraction of requests answered with a 500
+            wpm: Speaking rate of the returned audio
+            seed: Seed for delays and errors
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit = rate_limit
+        self.max_concurrent = max_concurrent
+        self.error_rate = error_rate
+        self.wpm = wpm
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._tokens = float(rate_limit or 0)
+        self._refilled = time.monotonic()
+        self._active = 0
+        self.stats: Dict[str, int] = {'requests': 0, 'ok': 0, 'rate_limited': 0, 'errors': 0}
+
+        self.httpd = ThreadingHTTPServer((host, port), self._handler())
+        self.httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> str:
+        """Serve in a background thread; returns the base URL."""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def stop(self):
+        """Stop serving."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def _admit(self) -> Optional[float]:
+        """
+        Take a rate-limit token and a concurrency slot.
+
+        Returns:
+            None if admitted, else seconds until a retry could be (sent to
+            the client as Retry-After in whole seconds, like real APIs)
+        """
+        with self._lock:
+            self.stats['requests'] += 1
+            if self.rate_limit:
+                now = time.monotonic()
+                self._tokens = min(self.rate_limit, self._tokens + (now - self._refilled) * self.rate_limit)
+                self._refilled = now
+                if self._tokens < 1:
+                    self.stats['rate_limited'] += 1
+                    return (1 - self._tokens) / self.rate_limit
+            if self.max_concurrent and self._active >= self.max_concurrent:
+                self.stats['rate_limited'] += 1
+                return max(self.latency, 0.1)
+            if self.rate_limit:
+                self._tokens -= 1
+            self._active += 1
+            return None
+
+    def _release(self):
+        with self._lock:
+            self._active -= 1
+
+    def _draw(self):
+        """(delay in seconds, fail?) for one request."""
+        with self._lock:
+            delay = self.latency + (self._random.expovariate(1 / self.jitter) if self.jitter > 0 else 0.0)
+            return delay, self._random.random() < self.error_rate
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def _reply(self, status: int, body: bytes, content_type: str, headers: Optional[Dict] = None):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _error(self, status: int, message: str, headers: Optional[Dict] = None):
+                body = json.dumps({'detail': {'status': status, 'message': message}}).encode()
+                self._reply(status, body, "application/json", headers)
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                if not _TTS_PATH.match(self.path):
+                    return self._error(404, "Not found")
+                if not self.headers.get('xi-api-key'):
+                    return self._error(401, "Missing xi-api-key header")
+                try:
+                    text = json.loads(body or b'{}')['text']
+                except (ValueError, KeyError):
+                    return self._error(422, "Body must be JSON with a 'text' field")
+
+                wait = server._admit()
+                if wait is not None:
+                    return self._error(429, "Too many requests", {'Retry-After': str(max(1, math.ceil(wait)))})
+                try:
+                    delay, fail = server._draw()
+                    time.sleep(delay)
+                    if fail:
+                        with server._lock:
+                            server.stats['errors'] += 1
+                        return self._error(500, "Internal server error")
+                    with server._lock:
+                        server.stats['ok'] += 1
+                    self._reply(200, synthetic_wav(text, server.wpm), "audio/wav")
+                finally:
+                    server._release()
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mock ElevenLabs TTS server for load testing")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Port (default: 8765)")
+    parser.add_argument("--latency", type=float, default=0.2, help="Base delay in seconds (default: 0.2)")
+    parser.add_argument("--jitter", type=float, default=0.1, help="Mean extra delay in seconds (default: 0.1)")
+    parser.add_argument("--rate-limit", type=float, help="Requests per second before 429s")
+    parser.add_argument("--max-concurrent", type=int, help="Concurrent requests before 429s")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of 500 responses (default: 0)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    args = parser.parse_args()
+
+    server = MockTTSServer(args.host, args.port, args.latency, args.jitter, args.rate_limit,
+                           args.max_concurrent, args.error_rate, seed=args.seed)
+    print(f"🔊 Mock TTS server on {server.base_url} (ELEVEN_BASE_URL={server.base_url})")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        print(f"\n📊 {server.stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,317 @@
+"""
+Processing - Loudness normalization and silence trimming for voiceovers.
+
+Each TTS provider speaks at its own level and pads its output with its
+own amount of silence. The processor evens that out after synthesis:
+
+1. Trim leading and trailing silence, keeping a short pad. Silence is
+   any 10 ms frame more than `trim_db` below the loudest frame.
+2. Measure integrated loudness as in ITU-R BS.1770 / EBU R128: K-weighted
+   mean square over 400 ms blocks (75% overlap), gated at -70 LUFS and
+   then 10 LU below the ungated level.
+3. Apply the gain that brings it to `target_lufs`, lowered if needed so
+   the sample peak stays under `peak_db`.
+
+Everything is NumPy over the whole buffer. The K-weighting biquads are
+applied as one FFT convolution with their impulse response, so no
+sample-by-sample IIR loop is needed, and block energies come from a
+running sum of squares. Results are cached under a hash of the source
+audio and the settings, so re-runs only hash files.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .chunking import SAMPLE_RATE, load_samples, write_wav
+from utils.scratch import partial_path
+
+
+# YouTube plays back at -14 LUFS; -16 leaves headroom for music beds
+TARGET_LUFS = -16.0
+PEAK_DB = -1.0
+
+ABSOLUTE_GATE = -70.0
+RELATIVE_GATE = -10.0
+BLOCK_SECONDS = 0.4
+BLOCK_OVERLAP = 0.75
+
+
+def _biquad_response(b: Tuple[float, float, float], a: Tuple[float, float, float], w: np.ndarray) -> np.ndarray:
+    """Complex response H(e^jw) of a biquad at angular frequencies w."""
+    z = np.exp(-1j * w)
+    numerator = b[0] + b[1] * z + b[2] * z * z
+    denominator = a[0] + a[1] * z + a[2] * z * z
+    return numerator / denominator
+
+
+def k_weighting(freqs: np.ndarray, rate: int) -> np.ndarray:
+    """
+    Complex response of the BS.1770 K-weighting filter.
+
+    The filter is a +4 dB high shelf above ~1.7 kHz (head effects)
+    followed by a ~38 Hz high-pass (RLB curve). The analog parameters
+    below, mapped through the bilinear transform as in libebur128,
+    reproduce the standard's 48 kHz coefficients and carry over to any
+    rate.
+
+    Args:
+        freqs: Frequencies in Hz
+        rate: Sample rate
+
+    Returns:
+        Complex gain at each frequency
+    """
+    w = 2 * np.pi * freqs / rate
+
+    # High shelf
+    K = np.tan(np.pi * 1681.974450955533 / rate)
+    Q = 0.7071752369554196
+    Vh = 10 ** (3.999843853973347 / 20)
+    Vb = Vh ** 0.4996667741545416
+    shelf = _biquad_response(
+        (Vh + Vb * K / Q + K * K, 2 * (K * K - Vh), Vh - Vb * K / Q + K * K),
+        (1 + K / Q + K * K, 2 * (K * K - 1), 1 - K / Q + K * K),
+        w
+    )
+
+    # High-pass
+    K = np.tan(np.pi * 38.13547087602444 / rate)
+    Q = 0.5003270373238773
+    highpass = _biquad_response(
+        (1.0, -2.0, 1.0),
+        (1.0, 2 * (K * K - 1) / (1 + K / Q + K * K), (1 - K / Q + K * K) / (1 + K / Q + K * K)),
+        w
+    )
+    return shelf * highpass
+
+
+def k_weight(samples: np.ndarray, rate: int = SAMPLE_RATE) -> np.ndarray:
+    """
+    Run audio through the K-weighting filter (the two biquads in cascade).
+
+    The IIR is applied as a convolution with its impulse response, cut
+    after a quarter second (60 time constants of the high-pass, far below
+    float precision), so the result matches filtering sample by sample
+    from rest. The convolution is overlap-add with every chunk's FFT
+    taken in one batch.
+
+    Args:
+        samples: Mono samples
+        rate: Sample rate
+
+    Returns:
+        Filtered samples (float64, same length)
+    """
+    samples = np.asarray(samples, dtype=np.float64)
+    taps = 1 << int(np.ceil(np.log2(rate / 4)))
+    size = 4 * taps
+    hop = size - taps
+    response = np.fft.rfft(np.fft.irfft(k_weighting(np.fft.rfftfreq(taps, 1.0 / rate), rate), taps), size)
+
+    count = max(1, -(-len(samples) // hop))
+    chunks = np.zeros((count, hop))
+    chunks.ravel()[:len(samples)] = samples
+    filtered = np.fft.irfft(np.fft.rfft(chunks, size, axis=1) * response, size, axis=1)
+
+    # Each chunk's filter tail spills into the start of the next one
+    out = np.zeros((count + 1, hop))
+    out[:count] = filtered[:, :hop]
+    out[1:, :taps] += filtered[:, hop:]
+    return out.ravel()[:len(samples)]
+
+
+def integrated_loudness(samples: np.ndarray, rate: int = SAMPLE_RATE) -> float:
+    """
+    Integrated loudness of mono audio in LUFS (-inf for silence).
+
+    Args:
+        samples: Mono samples in -1..1
+        rate: Sample rate
+
+    Returns:
+        Loudness in LUFS
+    """
+    size = int(round(BLOCK_SECONDS * rate))
+    step = int(round(size * (1 - BLOCK_OVERLAP)))
+
+    # Mean square of each K-weighted block, from a running sum of squares
+    weighted = k_weight(samples, rate)
+    if len(weighted) < size:
+        weighted = np.pad(weighted, (0, size - len(weighted)))
+    energy = np.concatenate([[0.0], np.cumsum(weighted * weighted)])
+    starts = np.arange(0, len(weighted) - size + 1, step)
+    power = np.maximum(energy[starts + size] - energy[starts], 0.0) / size
+
+    with np.errstate(divide='ignore'):
+        loudness = -0.691 + 10 * np.log10(power)
+    gated = power[loudness > ABSOLUTE_GATE]
+    if not len(gated):
+        return float('-inf')
+    relative = -0.691 + 10 * np.log10(gated.mean()) + RELATIVE_GATE
+    gated = power[loudness > max(relative, ABSOLUTE_GATE)]
+    return float(-0.691 + 10 * np.log10(gated.mean()))
+
+
+def speech_bounds(samples: np.ndarray, rate: int = SAMPLE_RATE, threshold_db: float = -45.0,
+                  pad: float = 0.05) -> Tuple[int, int]:
+    """
+    Sample range holding the audio between leading and trailing silence.
+
+    Args:
+        samples: Mono samples
+        rate: Sample rate
+        threshold_db: Frames this far below the loudest 10 ms frame are silence
+        pad: Silence kept on each side, in seconds
+
+    Returns:
+        (start, end) sample indices; (0, 0) if everything is silent
+    """
+    size = max(1, int(rate * 0.01))
+    count = len(samples) // size
+    if not count:
+        return 0, len(samples)
+    energy = np.square(samples[:count * size].reshape(count, size), dtype=np.float64).mean(axis=1)
+    loud = np.flatnonzero(energy > energy.max() * 10 ** (threshold_db / 10))
+    if not len(loud) or energy.max() == 0:
+        return 0, 0
+    keep = int(pad * rate)
+    return max(0, loud[0] * size - keep), min(len(samples), (loud[-1] + 1) * size + keep)
+
+
+def trim_silence(samples: np.ndarray, rate: int = SAMPLE_RATE, threshold_db: float = -45.0,
+                 pad: float = 0.05) -> np.ndarray:
+    """Samples without leading/trailing silence beyond `pad` seconds."""
+    start, end = speech_bounds(samples, rate, threshold_db, pad)
+    return samples[start:end]
+
+
+def normalize_loudness(samples: np.ndarray, rate: int = SAMPLE_RATE, target_lufs: float = TARGET_LUFS,
+                       peak_db: float = PEAK_DB) -> Tuple[np.ndarray, float]:
+    """
+    Scale audio to a target integrated loudness under a peak ceiling.
+
+    Args:
+        samples: Mono samples
+        rate: Sample rate
+        target_lufs: Target loudness
+        peak_db: Highest allowed sample peak in dBFS
+
+    Returns:
+        (scaled samples, applied gain in dB)
+    """
+    loudness = integrated_loudness(samples, rate)
+    if not np.isfinite(loudness):
+        return samples, 0.0
+    gain_db = target_lufs - loudness
+    peak = np.abs(samples).max()
+    if peak > 0:
+        gain_db = min(gain_db, peak_db - 20 * np.log10(peak))
+    return (samples * 10 ** (gain_db / 20)).astype(np.float32), float(gain_db)
+
+
+class AudioProcessor:
+    """Cached trim + loudness pass over voiceover files."""
+
+    def __init__(
+        self,
+        cache_dir: str = "output/audio/processed",
+        target_lufs: float = TARGET_LUFS,
+        peak_db: float = PEAK_DB,
+        trim_db: float = -45.0,
+        pad: float = 0.05,
+        rate: int = SAMPLE_RATE
+    ):
+        """
+        Initialize audio processor.
+
+        Args:
+            cache_dir: Where processed files are kept, named by the hash of
+                their source audio and these settings
+            target_lufs: Integrated loudness to normalize to
+            peak_db: Sample peak ceiling in dBFS
+            trim_db: Silence threshold below the loudest 10 ms frame
+            pad: Silence kept before and after the speech, in seconds
+            rate: Output sample rate
+        """
+        self.cache_dir = Path(cache_dir)
+        self.target_lufs = target_lufs
+        self.peak_db = peak_db
+        self.trim_db = trim_db
+        self.pad = pad
+        self.rate = rate
+
+    def settings(self) -> Dict:
+        # 'meter' changes with the loudness measurement, so cached files are redone
+        return {'target_lufs': self.target_lufs, 'peak_db': self.peak_db, 'trim_db': self.trim_db,
+                'pad': self.pad, 'rate': self.rate, 'meter': 2}
+
+    def _cache_path(self, audio_path: str) -> Path:
+        digest = hashlib.sha1(json.dumps(self.settings(), sort_keys=True).encode())
+        with open(audio_path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        return self.cache_dir / f"{digest.hexdigest()}.wav"
+
+    def process(self, audio_path: str) -> Tuple[str, Optional[Dict]]:
+        """
+        Trim and normalize one file.
+
+        Args:
+            audio_path: Source audio
+
+        Returns:
+            (processed WAV path, stats dict, or None when it came from cache)
+        """
+        cache_path = self._cache_path(audio_path)
+        if cache_path.exists():
+            return str(cache_path), None
+
+        samples = load_samples(audio_path, self.rate)
+        start, end = speech_bounds(samples, self.rate, self.trim_db, self.pad)
+        trimmed = samples[start:end]
+        normalized, gain_db = normalize_loudness(trimmed, self.rate, self.target_lufs, self.peak_db)
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Concurrent jobs may process the same source; each writes its own copy
+        partial = partial_path(cache_path)
+        write_wav(partial, normalized, self.rate)
+        partial.replace(cache_path)
+        return str(cache_path), {
+            'trimmed': (len(samples) - len(trimmed)) / self.rate,
+            'gain_db': gain_db,
+        }
+
+    def process_batch(self, audio_paths: List[str], show_progress: bool = True) -> List[str]:
+        """
+        Trim and normalize voiceover files.
+
+        Args:
+            audio_paths: Source audio files
+            show_progress: Show progress messages
+
+        Returns:
+            Processed file paths, in the same order
+        """
+        if show_progress:
+            print(f"\n🔊 Normalizing voiceovers to {self.target_lufs:.0f} LUFS")
+
+        processed, cached, trimmed = [], 0, 0.0
+        for audio_path in audio_paths:
+            path, stats = self.process(audio_path)
+            processed.append(path)
+            if stats is None:
+                cached += 1
+            else:
+                trimmed += stats['trimmed']
+                if show_progress:
+                    print(f"    ✓ {Path(audio_path).name}: {stats['gain_db']:+.1f} dB, "
+                          f"trimmed {stats['trimmed']:.2f}s")
+
+        if show_progress:
+            print(f"✅ Processed {len(processed) - cached} files ({cached} cached), "
+                  f"trimmed {trimmed:.1f}s of silence")
+        return processed
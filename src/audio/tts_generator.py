@@ -5,15 +5,39 @@ Supports multiple TTS providers:
 - ElevenLabs (high quality, paid)
 - gTTS (Google TTS, free but lower quality)
 - System TTS (macOS 'say' command, free)
+- Piper (offline neural TTS for Linux, free)
+- Synthetic (placeholder tone/silence for tests and benchmarks)
 - LLM-based TTS (using your local LLM endpoint if supported)
+
+Batches are synthesized sentence by sentence (see chunking): each
+sentence is cached under a hash of its text and the provider settings,
+uncached sentences are synthesized in parallel, and a segment's
+sentences are stitched into one WAV file. Editing a line of the script
+only re-synthesizes that line.
 """
 
+import hashlib
+import io
+import json
 import os
+import queue
+import random
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+import wave
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Optional, List
 import subprocess
 from abc import ABC, abstractmethod
 
+import numpy as np
+
+from .chunking import PARAGRAPH_GAP, SENTENCE_GAP, load_samples, split_sentences, stitch, write_wav
+
 
 class TTSProvider(ABC):
     """Abstract base class for TTS providers."""
@@ -23,6 +47,14 @@ class TTSProvider(ABC):
         """Generate audio from text."""
         pass
 
+    def settings(self) -> Dict:
+        """Settings that change the audio, part of the sentence cache key."""
+        return {}
+
+    def close(self):
+        """Release anything held between calls (processes, connections)."""
+        pass
+
 
 class SystemTTS(TTSProvider):
     """macOS system TTS using 'say' command."""
@@ -38,6 +70,9 @@ class SystemTTS(TTSProvider):
         self.voice = voice
         self.rate = rate
 
+    def settings(self) -> Dict:
+        return {'voice': self.voice, 'rate': self.rate}
+
     def generate(self, text: str, output_path: str) -> str:
         """Generate audio using macOS 'say' command."""
         output_path = Path(output_path).with_suffix('.aiff')
@@ -53,7 +88,6 @@ class SystemTTS(TTSProvider):
 
         try:
             subprocess.run(cmd, check=True, capture_output=True)
-            print(f"    ✓ Generated audio: {output_path.name}")
             return str(output_path)
         except subprocess.CalledProcessError as e:
             raise Exception(f"System TTS failed: {e.stderr.decode()}")
@@ -64,19 +98,49 @@ class SystemTTS(TTSProvider):
 class ElevenLabsTTS(TTSProvider):
     """ElevenLabs TTS (requires API key)."""
 
-    def __init__(self, api_key: Optional[str] = None, voice_id: str = "21m00Tcm4TlvDq8ikWAM"):
+    MODEL = "eleven_monolingual_v1"
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        voice_id: str = "21m00Tcm4TlvDq8ikWAM",
+        base_url: Optional[str] = None,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        timeout: float = 60.0
+    ):
         """
         Initialize ElevenLabs TTS.
 
         Args:
             api_key: ElevenLabs API key (or set ELEVEN_API_KEY env var)
             voice_id: Voice ID to use
+            base_url: Call this REST endpoint directly instead of using the
+                elevenlabs package, e.g. a proxy or the mock server in
+                audio.mock_tts_server (or set ELEVEN_BASE_URL env var)
+            max_retries: Attempts per text on rate limits and server errors
+                (REST endpoint only)
+            retry_delay: Base wait between attempts in seconds, doubled on
+                each attempt; waits are at least a server's Retry-After and
+                get random jitter so parallel workers don't retry in lockstep
+            timeout: Request timeout in seconds
         """
         self.api_key = api_key or os.getenv('ELEVEN_API_KEY')
         if not self.api_key:
             raise ValueError("ElevenLabs API key required (set ELEVEN_API_KEY env var)")
 
         self.voice_id = voice_id
+        self.base_url = (base_url or os.getenv('ELEVEN_BASE_URL') or '').rstrip('/')
+        self.max_retries = max(1, max_retries)
+        self.retry_delay = retry_delay
+        self.timeout = timeout
+
+        if self.base_url:
+            import requests
+            # Session for connection pooling across sentences
+            self.session = requests.Session()
+            self.session.headers.update({"xi-api-key": self.api_key, "Accept": "audio/mpeg"})
+            return
 
         try:
             from elevenlabs import generate, set_api_key
@@ -85,22 +149,61 @@ class ElevenLabsTTS(TTSProvider):
         except ImportError:
             raise ImportError("ElevenLabs package not installed: pip install elevenlabs")
 
+    def settings(self) -> Dict:
+        return {'voice_id': self.voice_id, 'model': self.MODEL}
+
     def generate(self, text: str, output_path: str) -> str:
         """Generate audio using ElevenLabs."""
         output_path = Path(output_path).with_suffix('.mp3')
 
-        audio = self.generate_func(
-            text=text,
-            voice=self.voice_id,
-            model="eleven_monolingual_v1"
-        )
+        if self.base_url:
+            audio = self._request(text)
+        else:
+            audio = self.generate_func(
+                text=text,
+                voice=self.voice_id,
+                model=self.MODEL
+            )
 
         with open(output_path, 'wb') as f:
             f.write(audio)
 
-        print(f"    ✓ Generated audio: {output_path.name}")
         return str(output_path)
 
+    def _request(self, text: str) -> bytes:
+        """POST /v1/text-to-speech/<voice_id>, retrying rate limits and server errors."""
+        import requests
+
+        url = f"{self.base_url}/v1/text-to-speech/{self.voice_id}"
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                response = self.session.post(
+                    url,
+                    json={"text": text, "model_id": self.MODEL},
+                    timeout=self.timeout
+                )
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+                if attempt == self.max_retries:
+                    raise Exception(f"ElevenLabs request failed after {self.max_retries} attempts: {e}")
+                retry_after = 0.0
+            else:
+                if response.ok:
+                    return response.content
+                retryable = response.status_code == 429 or response.status_code >= 500
+                if not retryable or attempt == self.max_retries:
+                    raise Exception(f"ElevenLabs HTTP error {response.status_code}: {response.text[:200]}")
+                try:
+                    retry_after = float(response.headers.get('Retry-After', 0))
+                except ValueError:
+                    # An HTTP date; the exponential backoff stands in for it
+                    retry_after = 0.0
+            wait_time = max(retry_after, self.retry_delay * 2 ** attempt)
+            wait_time += random.uniform(0, wait_time)
+            print(f"    ⚠️  ElevenLabs busy, retrying in {wait_time:.1f}s... (attempt {attempt}/{self.max_retries})")
+            time.sleep(wait_time)
+
+        raise Exception("ElevenLabs request failed after all retries")
+
 
 class GTTSProvider(TTSProvider):
     """Google TTS (free, lower quality)."""
@@ -122,6 +225,9 @@ class GTTSProvider(TTSProvider):
         except ImportError:
             raise ImportError("gTTS package not installed: pip install gtts")
 
+    def settings(self) -> Dict:
+        return {'lang': self.lang, 'slow': self.slow}
+
     def generate(self, text: str, output_path: str) -> str:
         """Generate audio using gTTS."""
         output_path = Path(output_path).with_suffix('.mp3')
@@ -129,10 +235,220 @@ class GTTSProvider(TTSProvider):
         tts = self.gTTS(text=text, lang=self.lang, slow=self.slow)
         tts.save(str(output_path))
 
-        print(f"    ✓ Generated audio: {output_path.name}")
         return str(output_path)
 
 
+class PiperTTS(TTSProvider):
+    """Offline neural TTS (Piper) served by persistent processes."""
+
+    def __init__(
+        self,
+        model: Optional[str] = None,
+        binary: Optional[str] = None,
+        speaker: Optional[int] = None,
+        length_scale: float = 1.0,
+        processes: int = 2,
+        timeout: float = 120.0
+    ):
+        """
+        Initialize Piper TTS.
+
+        Each process loads the voice model once and then synthesizes any
+        number of texts sent as JSON lines on its stdin, so a batch pays
+        the startup cost once per process instead of once per sentence.
+        Concurrent generate() calls are spread over up to `processes`
+        processes.
+
+        Args:
+            model: Path to a Piper voice (.onnx, or set PIPER_MODEL env var)
+            binary: Piper executable (or set PIPER_BIN, default 'piper')
+            speaker: Speaker id for multi-speaker voices
+            length_scale: Speech duration scale (>1 is slower)
+            processes: Maximum number of resident piper processes
+            timeout: Seconds to wait for one text before the process is
+                considered stalled and killed
+        """
+        self.model = model or os.getenv('PIPER_MODEL')
+        if not self.model:
+            raise ValueError("Piper voice model required (set PIPER_MODEL env var to a .onnx file)")
+        if not Path(self.model).exists():
+            raise ValueError(f"Piper voice model not found: {self.model}")
+
+        self.binary = binary or os.getenv('PIPER_BIN', 'piper')
+        if not shutil.which(self.binary):
+            raise Exception(f"'{self.binary}' not found. Install Piper: https://github.com/rhasspy/piper")
+
+        self.speaker = speaker
+        self.length_scale = length_scale
+        self.processes = max(1, processes)
+        self.timeout = timeout
+
+        self._idle: "queue.Queue[subprocess.Popen]" = queue.Queue()
+        self._started: List[subprocess.Popen] = []
+        # Lines piper prints, read by one thread per process so a stalled
+        # process can't block generate() forever
+        self._output: Dict[subprocess.Popen, "queue.Queue[str]"] = {}
+        self._lock = threading.Lock()
+
+    def settings(self) -> Dict:
+        return {'model': Path(self.model).name, 'speaker': self.speaker, 'length_scale': self.length_scale}
+
+    def _start_process(self) -> subprocess.Popen:
+        """Start a piper process that reads JSON lines and writes WAV files."""
+        cmd = [
+            self.binary,
+            '--model', str(self.model),
+            '--length_scale', str(self.length_scale),
+            '--json-input',
+            # Needed for per-line 'output_file'; piper prints each written path
+            '--output_dir', tempfile.gettempdir(),
+        ]
+        if self.speaker is not None:
+            cmd += ['--speaker', str(self.speaker)]
+        process = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1
+        )
+        lines: "queue.Queue[str]" = queue.Queue()
+        self._output[process] = lines
+        threading.Thread(target=self._read_lines, args=(process, lines), daemon=True).start()
+        return process
+
+    @staticmethod
+    def _read_lines(process: subprocess.Popen, lines: "queue.Queue[str]"):
+        """Forward a process's stdout lines to a queue; '' marks the end."""
+        try:
+            for line in process.stdout:
+                lines.put(line)
+        except (OSError, ValueError):
+            pass
+        lines.put('')
+
+    def _acquire(self) -> subprocess.Popen:
+        """An idle process, starting one while below the limit."""
+        while True:
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+            with self._lock:
+                # Failed processes free their slot
+                self._started = [p for p in self._started if p.poll() is None]
+                if len(self._started) < self.processes:
+                    process = self._start_process()
+                    self._started.append(process)
+                    return process
+            try:
+                return self._idle.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+    def generate(self, text: str, output_path: str) -> str:
+        """Generate audio by streaming the text through a resident piper process."""
+        output_path = Path(output_path).with_suffix('.wav').resolve()
+
+        process = self._acquire()
+        try:
+            process.stdin.write(json.dumps({'text': text, 'output_file': str(output_path)}) + '\n')
+            process.stdin.flush()
+            written = self._output[process].get(timeout=self.timeout)
+        except (BrokenPipeError, OSError):
+            written = ''
+        except queue.Empty:
+            process.kill()
+            process.wait()
+            self._output.pop(process, None)
+            raise Exception(f"Piper TTS stalled for {self.timeout:.0f}s on: {text[:60]}")
+
+        if not written or process.poll() is not None:
+            # Don't hand a dead process to the next caller
+            process.kill()
+            process.wait()
+            self._output.pop(process, None)
+            raise Exception(f"Piper TTS failed (exit code {process.poll()}) for: {text[:60]}")
+
+        self._idle.put(process)
+        return str(output_path)
+
+    def close(self):
+        """Stop the resident processes."""
+        with self._lock:
+            for process in self._started:
+                if process.stdin:
+                    process.stdin.close()
+            for process in self._started:
+                try:
+                    process.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.wait()
+            self._started = []
+            self._idle = queue.Queue()
+            self._output = {}
+
+
+class SyntheticTTS(TTSProvider):
+    """Instant placeholder speech for tests and benchmarks (no voice)."""
+
+    def __init__(self, wpm: int = 160, tone: bool = True, sample_rate: int = 22050):
+        """
+        Initialize synthetic TTS.
+
+        Audio is silence or a quiet tone lasting as long as the text would
+        take to read at `wpm`, so timing, caching and stitching behave as
+        with a real voice. The same text always gives the same file.
+
+        Args:
+            wpm: Speaking rate in words per minute
+            tone: Write a tone instead of silence
+            sample_rate: Sample rate of the WAV output
+        """
+        self.wpm = wpm
+        self.tone = tone
+        self.sample_rate = sample_rate
+
+    def settings(self) -> Dict:
+        return {'wpm': self.wpm, 'tone': self.tone, 'sample_rate': self.sample_rate}
+
+    def generate(self, text: str, output_path: str) -> str:
+        """Write synthetic audio for the text."""
+        output_path = Path(output_path).with_suffix('.wav')
+        output_path.write_bytes(synthetic_wav(text, self.wpm, self.tone, self.sample_rate))
+        return str(output_path)
+
+
+def synthetic_wav(text: str, wpm: int = 160, tone: bool = True, sample_rate: int = 22050) -> bytes:
+    """
+    WAV bytes lasting as long as `text` takes to read at `wpm`.
+
+    Args:
+        text: Text to time
+        wpm: Words per minute
+        tone: Quiet 220 Hz tone instead of silence
+        sample_rate: Sample rate
+
+    Returns:
+        16-bit mono WAV file contents
+    """
+    seconds = max(len(text.split()), 1) * 60.0 / wpm
+    n = int(seconds * sample_rate)
+    if tone:
+        samples = 0.1 * np.sin(2 * np.pi * 220 * np.arange(n) / sample_rate)
+    else:
+        samples = np.zeros(n)
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(sample_rate)
+        w.writeframes((samples * 32767).astype('<i2').tobytes())
+    return buffer.getvalue()
+
+
 class TTSGenerator:
     """Main TTS generator with provider management."""
 
@@ -140,18 +456,22 @@ class TTSGenerator:
         self,
         provider: str = "system",
         output_dir: str = "output/audio",
+        workers: int = 4,
         **provider_kwargs
     ):
         """
         Initialize TTS generator.
 
         Args:
-            provider: TTS provider ('system', 'elevenlabs', 'gtts')
+            provider: TTS provider ('system', 'elevenlabs', 'gtts', 'piper', 'synthetic')
             output_dir: Output directory for audio files
+            workers: Sentences synthesized in parallel by generate_batch
             **provider_kwargs: Additional arguments for the provider
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_dir = self.output_dir / "cache"
+        self.workers = max(1, workers)
 
         # Initialize provider
         if provider == "system":
@@ -160,11 +480,21 @@ class TTSGenerator:
             self.provider = ElevenLabsTTS(**provider_kwargs)
         elif provider == "gtts":
             self.provider = GTTSProvider(**provider_kwargs)
+        elif provider == "piper":
+            # One resident process per worker
+            provider_kwargs.setdefault('processes', self.workers)
+            self.provider = PiperTTS(**provider_kwargs)
+        elif provider == "synthetic":
+            self.provider = SyntheticTTS(**provider_kwargs)
         else:
             raise ValueError(f"Unknown TTS provider: {provider}")
 
         self.provider_name = provider
 
+    def close(self):
+        """Release the provider's resources (e.g. resident Piper processes)."""
+        self.provider.close()
+
     def generate_voiceover(
         self,
         text: str,
@@ -189,46 +519,101 @@ class TTSGenerator:
 
         # Generate audio
         audio_path = self.provider.generate(text, str(output_path))
+        print(f"    ✓ Generated audio: {Path(audio_path).name}")
 
         return audio_path
 
     def generate_batch(
         self,
         segments: List[tuple],
-        show_progress: bool = True
+        show_progress: bool = True,
+        output_dir: Optional[str] = None
     ) -> List[str]:
         """
         Generate voiceovers for multiple segments.
 
+        Each segment is split into sentences; sentences already in the
+        cache are reused, the rest are synthesized in parallel, and every
+        segment is stitched into 'voiceover_<segment_id>.wav'.
+
         Args:
-            segments: List of (segment_id, text) tuples
+            segments: List of (segment_id, text) tuples; line breaks and
+                blank lines in the text mark sentence and paragraph ends
             show_progress: Show progress messages
+            output_dir: Where the stitched voiceovers go (default: the
+                generator's output directory)
 
         Returns:
             List of generated audio file paths
         """
-        audio_files = []
-
         if show_progress:
             print(f"\n🎤 Generating voiceovers using {self.provider_name.upper()} TTS")
             print(f"{'='*60}")
 
-        for i, (segment_id, text) in enumerate(segments, 1):
-            if show_progress:
-                print(f"  [{i}/{len(segments)}] Segment: {segment_id}")
+        # Sentences of every segment, with the gap after each
+        plans = []
+        for segment_id, text in segments:
+            chunks = [(self._clean_text_for_tts(sentence), paragraph) for sentence, paragraph in split_sentences(text)]
+            chunks = [(sentence, paragraph) for sentence, paragraph in chunks if sentence]
+            plans.append((segment_id, chunks))
+
+        # One synthesis per distinct uncached sentence, across all segments
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        paths: Dict[str, Optional[str]] = {}
+        for _, chunks in plans:
+            for sentence, _ in chunks:
+                if sentence not in paths:
+                    paths[sentence] = self._cached_sentence(sentence)
+        missing = [sentence for sentence, path in paths.items() if path is None]
 
-            # Clean text for TTS
-            clean_text = self._clean_text_for_tts(text)
+        if show_progress:
+            print(f"  {len(paths)} sentences: {len(paths) - len(missing)} cached, "
+                  f"{len(missing)} to synthesize ({self.workers} workers)")
 
-            # Generate audio
-            audio_path = self.generate_voiceover(clean_text, segment_id)
-            audio_files.append(audio_path)
+        if missing:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                for sentence, path in zip(missing, pool.map(self._synthesize_sentence, missing)):
+                    paths[sentence] = path
+
+        output_dir = Path(output_dir) if output_dir else self.output_dir
+        audio_files = []
+        for i, (segment_id, chunks) in enumerate(plans, 1):
+            if show_progress:
+                print(f"  [{i}/{len(plans)}] Segment: {segment_id} ({len(chunks)} sentences)")
+            samples = stitch(
+                [load_samples(paths[sentence]) for sentence, _ in chunks],
+                [PARAGRAPH_GAP if paragraph else SENTENCE_GAP for _, paragraph in chunks]
+            )
+            audio_files.append(write_wav(output_dir / f"voiceover_{segment_id}.wav", samples))
 
         if show_progress:
             print(f"\n✅ Generated {len(audio_files)} voiceover files")
 
         return audio_files
 
+    def _sentence_key(self, sentence: str) -> str:
+        """Cache key of a sentence: its text and everything that changes its audio."""
+        settings = json.dumps([self.provider_name, self.provider.settings(), sentence], sort_keys=True)
+        return hashlib.sha1(settings.encode('utf-8')).hexdigest()
+
+    def _cached_sentence(self, sentence: str) -> Optional[str]:
+        """Cached audio of a sentence, if any (providers pick the extension)."""
+        return next((str(path) for path in self.cache_dir.glob(f"{self._sentence_key(sentence)}.*")), None)
+
+    def _synthesize_sentence(self, sentence: str) -> str:
+        """Synthesize one sentence into the cache."""
+        key = self._sentence_key(sentence)
+        # Synthesize beside the cache and move in when complete, so an
+        # interrupted run never leaves a truncated file under a cache key.
+        # Partial names are unique, so concurrent jobs sharing the cache
+        # can synthesize the same sentence without clobbering each other.
+        partial_dir = self.cache_dir / "partial"
+        partial_dir.mkdir(exist_ok=True)
+        audio_path = Path(self.provider.generate(sentence, str(partial_dir / f"{key}_{uuid.uuid4().hex[:8]}")))
+        cached_path = self.cache_dir / f"{key}{audio_path.suffix}"
+        os.replace(audio_path, cached_path)
+        return str(cached_path)
+
     def _clean_text_for_tts(self, text: str) -> str:
         """
         Clean text for TTS generation.
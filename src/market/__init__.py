@@ -0,0 +1,8 @@
+"""Market data module."""
+
+from .market_data import MarketDataStore, MarketSeries, parse_date_range
+from .downsample import lttb_downsample, minmax_downsample, minmax_indices, resample_ohlc, sum_between
+
+__all__ = ['MarketDataStore', 'MarketSeries', 'parse_date_range',
+           'lttb_downsample', 'minmax_downsample', 'minmax_indices', 'resample_ohlc',
+           'sum_between']
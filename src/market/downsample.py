@@ -0,0 +1,189 @@
+"""
+Pixel-aware downsampling for chart series.
+
+A chart can't show more than a couple of points per horizontal pixel, so
+series are reduced to the plot width before they reach matplotlib:
+- minmax_downsample: keeps each bucket's min and max (exact envelope,
+  fully vectorized, best for dense tick data); minmax_indices and
+  sum_between reduce a series' other columns onto the same points
+- lttb_downsample: Largest-Triangle-Three-Buckets (keeps visual shape
+  with one point per bucket)
+- resample_ohlc: aggregates OHLCV bars into fewer, wider candles
+"""
+
+from typing import Dict, Tuple
+
+import numpy as np
+
+
+def minmax_indices(y: np.ndarray, n_buckets: int) -> np.ndarray:
+    """
+    Indices of the min and max point of each bucket of a series.
+
+    Other columns of the same series can be reduced with these indices so
+    they stay aligned with it point for point.
+
+    Args:
+        y: Y values
+        n_buckets: Number of buckets (usually the plot width in pixels)
+
+    Returns:
+        Sorted, unique indices; at most 2 * n_buckets of them
+    """
+    n = len(y)
+    if n_buckets <= 0 or n <= 2 * n_buckets:
+        return np.arange(n)
+
+    bucket_size = n // n_buckets
+    usable = bucket_size * n_buckets
+    buckets = np.asarray(y[:usable]).reshape(n_buckets, bucket_size)
+
+    offsets = np.arange(n_buckets) * bucket_size
+    idx_min = offsets + buckets.argmin(axis=1)
+    idx_max = offsets + buckets.argmax(axis=1)
+
+    # Emit each bucket's pair in x order so the line doesn't zigzag backwards
+    indices = np.stack([idx_min, idx_max], axis=1).ravel()
+    if usable < n:
+        # Fold the remainder into the output as its own extremes
+        tail_y = np.asarray(y[usable:])
+        indices = np.concatenate([indices, usable + np.array([tail_y.argmin(), tail_y.argmax()])])
+
+    # Flat buckets have the same index for min and max
+    return np.unique(indices)
+
+
+def minmax_downsample(x: np.ndarray, y: np.ndarray, n_buckets: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce a series to the min and max point of each bucket.
+
+    Args:
+        x: X values (sorted)
+        y: Y values
+        n_buckets: Number of buckets (usually the plot width in pixels)
+
+    Returns:
+        Tuple of (x, y) with at most 2 * n_buckets points, in x order
+    """
+    indices = minmax_indices(y, n_buckets)
+    return np.asarray(x)[indices], np.asarray(y)[indices]
+
+
+def sum_between(values: np.ndarray, indices: np.ndarray) -> np.ndarray:
+    """
+    Sum a column over the spans that end at each kept index.
+
+    Point k gets values[indices[k-1] + 1 : indices[k] + 1]; the first
+    span starts at 0 and the last runs to the end of the series. Used for
+    columns like volume, which must add up rather than be sampled, when a
+    series is reduced with minmax_indices.
+
+    Args:
+        values: Column values
+        indices: Sorted, unique indices of the kept points
+
+    Returns:
+        One sum per kept point; together they equal values.sum()
+    """
+    values = np.asarray(values)
+    if not len(indices):
+        return values[:0]
+    # reduceat's last span already runs to the end of the series
+    starts = np.concatenate([[0], np.asarray(indices[:-1]) + 1])
+    return np.add.reduceat(values, starts)
+
+
+def lttb_downsample(x: np.ndarray, y: np.ndarray, n_out: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+
+    The first and last points are kept; every bucket in between keeps the
+    point forming the largest triangle with the previously kept point and
+    the mean of the next bucket. The per-bucket search is vectorized.
+
+    Args:
+        x: X values (sorted; datetime64 is supported)
+        y: Y values
+        n_out: Number of output points
+
+    Returns:
+        Tuple of (x, y) with n_out points
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.asarray(x), np.asarray(y)
+
+    x_arr = np.asarray(x)
+    xs = x_arr.astype('datetime64[s]').astype(np.float64) if np.issubdtype(x_arr.dtype, np.datetime64) \
+        else x_arr.astype(np.float64)
+    ys = np.asarray(y, dtype=np.float64)
+
+    # Bucket edges over the interior points [1, n-1)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    # Mean of every bucket, computed in one pass with cumulative sums
+    cx = np.concatenate([[0.0], np.cumsum(xs)])
+    cy = np.concatenate([[0.0], np.cumsum(ys)])
+    counts = np.maximum(edges[1:] - edges[:-1], 1)
+    mean_x = (cx[edges[1:]] - cx[edges[:-1]]) / counts
+    mean_y = (cy[edges[1:]] - cy[edges[:-1]]) / counts
+    mean_x = np.append(mean_x, xs[-1])
+    mean_y = np.append(mean_y, ys[-1])
+
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], max(edges[i + 1], edges[i] + 1)
+        bx, by = xs[start:end], ys[start:end]
+        # Twice the triangle area; the constant factor doesn't change argmax
+        area = np.abs((xs[a] - mean_x[i + 1]) * (by - ys[a]) - (xs[a] - bx) * (mean_y[i + 1] - ys[a]))
+        a = start + int(area.argmax())
+        indices[i + 1] = a
+
+    return x_arr[indices], np.asarray(y)[indices]
+
+
+def resample_ohlc(
+    timestamp: np.ndarray,
+    columns: Dict[str, np.ndarray],
+    n_buckets: int
+) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """
+    Aggregate an OHLCV series into at most n_buckets candles.
+
+    Uses ufunc.reduceat over bucket boundaries, so the whole series is
+    aggregated in a few vectorized passes. Open is the first value of a
+    bucket, high the max, low the min, close the last, volume the sum;
+    any other column takes the bucket's last value.
+
+    Args:
+        timestamp: Sorted timestamps
+        columns: Column arrays ('open', 'high', 'low', 'close', 'volume', ...)
+        n_buckets: Maximum number of candles (e.g. plot width / 4 pixels)
+
+    Returns:
+        Tuple of (bucket start timestamps, aggregated columns)
+    """
+    n = len(timestamp)
+    if n_buckets <= 0 or n <= n_buckets:
+        return np.asarray(timestamp), {name: np.asarray(values) for name, values in columns.items()}
+
+    starts = np.linspace(0, n, n_buckets, endpoint=False).astype(np.int64)
+    ends = np.append(starts[1:], n)
+
+    aggregated = {}
+    for name, values in columns.items():
+        values = np.asarray(values)
+        if name == 'open':
+            aggregated[name] = values[starts]
+        elif name == 'high':
+            aggregated[name] = np.maximum.reduceat(values, starts)
+        elif name == 'low':
+            aggregated[name] = np.minimum.reduceat(values, starts)
+        elif name == 'volume':
+            aggregated[name] = np.add.reduceat(values, starts)
+        else:
+            aggregated[name] = values[ends - 1]
+
+    return np.asarray(timestamp)[starts], aggregated
@@ -0,0 +1,336 @@
+"""
+Market Data Store - Local OHLCV series for chart scenes.
+
+Loads series from CSV or Parquet files in a data directory (one file per
+symbol, e.g. data/market/BTC.csv). On first load each file is converted
+to one .npy file per column under <data_dir>/.cache; later loads
+memory-map those columns, so opening a multi-year tick series is
+instant and only the slice a chart needs is ever paged in.
+
+Also parses date hints from [SCREEN] text ("July 18, 2025",
+"May-June 2025", "over next 4 months") into timestamp ranges.
+"""
+
+import csv
+import json
+import os
+import re
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from utils.scratch import partial_path
+
+
+@dataclass
+class MarketSeries:
+    """Columnar OHLCV series (columns may be memory-mapped)."""
+    symbol: str
+    timestamp: np.ndarray  # datetime64[s], sorted ascending
+    columns: Dict[str, np.ndarray]
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        return self.columns[column]
+
+    def slice(self, start: Optional[np.datetime64] = None, end: Optional[np.datetime64] = None) -> 'MarketSeries':
+        """
+        Select a date range with a binary search on the timestamp index.
+
+        Returns views, so nothing outside the range is read from disk.
+        """
+        lo = 0 if start is None else int(np.searchsorted(self.timestamp, np.datetime64(start, 's'), side='left'))
+        hi = len(self) if end is None else int(np.searchsorted(self.timestamp, np.datetime64(end, 's'), side='right'))
+        return MarketSeries(
+            symbol=self.symbol,
+            timestamp=self.timestamp[lo:hi],
+            columns={name: values[lo:hi] for name, values in self.columns.items()}
+        )
+
+
+class MarketDataStore:
+    """Local market data directory with memory-mapped columnar caching."""
+
+    VALUE_COLUMNS = ('open', 'high', 'low', 'close', 'volume', 'funding', 'open_interest')
+    TIME_COLUMNS = ('timestamp', 'datetime', 'date', 'time')
+    COLUMN_ALIASES = {'price': 'close', 'vol': 'volume', 'o': 'open', 'h': 'high', 'l': 'low', 'c': 'close', 'v': 'volume',
+                      'funding_rate': 'funding', 'oi': 'open_interest', 'open interest': 'open_interest'}
+
+    # Words in [SCREEN] text that refer to a symbol file
+    SYMBOL_ALIASES = {
+        'BTC': ['bitcoin', 'btc'],
+        'ETH': ['ethereum', 'eth'],
+        'BANKNIFTY': ['banknifty', 'bank nifty'],
+        'NIFTY': ['nifty'],
+        'SPX': ['s&p 500', 's&p', 'spx'],
+        'DXY': ['dxy', 'dollar index'],
+        'GOLD': ['gold'],
+    }
+
+    def __init__(self, data_dir: str = "data/market", cache_dir: Optional[str] = None):
+        """
+        Initialize market data store.
+
+        Args:
+            data_dir: Directory with <SYMBOL>.csv / <SYMBOL>.parquet files
+            cache_dir: Column cache directory (default: <data_dir>/.cache)
+        """
+        self.data_dir = Path(data_dir)
+        self.cache_dir = Path(cache_dir) if cache_dir else self.data_dir / ".cache"
+        self._series: Dict[str, MarketSeries] = {}
+
+    def symbols(self) -> List[str]:
+        """List symbols available in the data directory."""
+        if not self.data_dir.exists():
+            return []
+        files = list(self.data_dir.glob("*.csv")) + list(self.data_dir.glob("*.parquet"))
+        return sorted({f.stem.upper() for f in files})
+
+    def find_symbol(self, text: str) -> Optional[str]:
+        """Find the first available symbol mentioned in free text."""
+        available = set(self.symbols())
+        text = text.lower()
+        for symbol, aliases in self.SYMBOL_ALIASES.items():
+            if symbol in available and any(re.search(rf'\b{re.escape(a)}\b', text) for a in aliases):
+                return symbol
+        for symbol in available:
+            if re.search(rf'\b{re.escape(symbol.lower())}\b', text):
+                return symbol
+        return None
+
+    def load(self, symbol: str) -> MarketSeries:
+        """
+        Load a symbol's series (memory-mapped from the column cache).
+
+        Args:
+            symbol: Symbol name (file stem, case-insensitive)
+
+        Returns:
+            MarketSeries
+        """
+        symbol = symbol.upper()
+        if symbol in self._series:
+            return self._series[symbol]
+
+        source = self._find_source(symbol)
+        cache = self.cache_dir / symbol
+        signature = {'source': source.name, 'mtime': source.stat().st_mtime, 'size': source.stat().st_size}
+
+        meta_path = cache / "meta.json"
+        fresh = False
+        if meta_path.exists():
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                fresh = json.load(f).get('signature') == signature
+
+        if not fresh:
+            print(f"    Indexing market data: {source.name}")
+            columns = self._read_source(source)
+            self._write_cache(cache, columns, signature)
+
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            names = json.load(f)['columns']
+
+        columns = {name: np.load(cache / f"{name}.npy", mmap_mode='r') for name in names}
+        timestamp = columns.pop('timestamp')
+        series = MarketSeries(symbol=symbol, timestamp=timestamp, columns=columns)
+        self._series[symbol] = series
+        return series
+
+    def _find_source(self, symbol: str) -> Path:
+        for suffix in ('.parquet', '.csv'):
+            for path in self.data_dir.glob(f"*{suffix}"):
+                if path.stem.upper() == symbol:
+                    return path
+        raise FileNotFoundError(f"No market data for {symbol} in {self.data_dir}")
+
+    def _normalize_name(self, name: str) -> str:
+        name = name.strip().lower()
+        return self.COLUMN_ALIASES.get(name, name)
+
+    def _read_source(self, path: Path) -> Dict[str, np.ndarray]:
+        """Read a CSV/Parquet file into sorted columns."""
+        if path.suffix == '.parquet':
+            try:
+                import pyarrow.parquet as pq
+            except ImportError:
+                raise ImportError("pyarrow package required for Parquet files: pip install pyarrow")
+            table = pq.read_table(path)
+            raw = {self._normalize_name(name): table.column(name).to_numpy(zero_copy_only=False)
+                   for name in table.column_names}
+        else:
+            with open(path, 'r', encoding='utf-8', newline='') as f:
+                reader = csv.reader(f)
+                header = [self._normalize_name(h) for h in next(reader)]
+                rows = list(reader)
+            values = list(zip(*rows)) if rows else [[] for _ in header]
+            raw = dict(zip(header, values))
+
+        time_column = next((c for c in self.TIME_COLUMNS if c in raw), None)
+        if time_column is None:
+            raise ValueError(f"{path.name}: no timestamp column (expected one of {', '.join(self.TIME_COLUMNS)})")
+
+        columns = {'timestamp': self._parse_timestamps(np.asarray(raw[time_column]))}
+        for name in self.VALUE_COLUMNS:
+            if name in raw:
+                columns[name] = np.asarray(raw[name], dtype=np.float64)
+        if 'close' not in columns:
+            raise ValueError(f"{path.name}: no close/price column")
+
+        order = np.argsort(columns['timestamp'], kind='stable')
+        if not np.all(order[:-1] < order[1:]):
+            columns = {name: values[order] for name, values in columns.items()}
+        return columns
+
+    def _parse_timestamps(self, values: np.ndarray) -> np.ndarray:
+        """Parse ISO strings or epoch seconds/milliseconds to datetime64[s]."""
+        if np.issubdtype(values.dtype, np.datetime64):
+            return values.astype('datetime64[s]')
+        try:
+            numeric = values.astype(np.float64)
+        except ValueError:
+            return np.array([v.strip().replace(' ', 'T') for v in values], dtype='datetime64[s]')
+        # Epoch milliseconds are > 1e11 for any date after 1973
+        if len(numeric) and np.nanmax(numeric) > 1e11:
+            numeric = numeric / 1000.0
+        return numeric.astype(np.int64).astype('datetime64[s]')
+
+    def _write_cache(self, cache: Path, columns: Dict[str, np.ndarray], signature: Dict):
+        """
+        Write the column cache, each file through a temporary and a rename.
+
+        Other jobs may have the old columns memory-mapped; a renamed-over
+        file is a new inode, so their maps stay valid. meta.json goes last,
+        so it never names columns that aren't complete yet.
+        """
+        cache.mkdir(parents=True, exist_ok=True)
+        for name, values in columns.items():
+            path = cache / f"{name}.npy"
+            partial = partial_path(path)
+            with open(partial, 'wb') as f:
+                np.save(f, np.ascontiguousarray(values))
+            os.replace(partial, path)
+
+        meta_path = cache / "meta.json"
+        partial = partial_path(meta_path)
+        with open(partial, 'w', encoding='utf-8') as f:
+            json.dump({'signature': signature, 'columns': list(columns), 'rows': len(columns['timestamp'])}, f, indent=2)
+        os.replace(partial, meta_path)
+
+
+MONTHS = {name: i for i, name in enumerate(
+    ['january', 'february', 'march', 'april', 'may', 'june', 'july',
+     'august', 'september', 'october', 'november', 'december'], 1)}
+MONTHS.update({name[:3]: i for name, i in list(MONTHS.items())})
+MONTHS['sept'] = 9
+
+_MONTH = r'\b(jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?|sept?(?:ember)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\b'
+_DAY_PATTERN = re.compile(_MONTH + r'\.?\s+(\d{1,2})(?:st|nd|rd|th)?\b(?:,?\s+(\d{4}))?', re.IGNORECASE)
+_RANGE_SEPARATOR = r'\s*(?:-|–|—|to|through|until)\s*'
+_MONTH_YEAR_RANGE_PATTERN = re.compile(_MONTH + r'\s+(\d{4})' + _RANGE_SEPARATOR + _MONTH + r'\s+(\d{4})', re.IGNORECASE)
+_YEAR_RANGE_PATTERN = re.compile(r'\b(20\d{2}|19\d{2})' + _RANGE_SEPARATOR + r'(20\d{2}|19\d{2})\b', re.IGNORECASE)
+_MONTH_RANGE_PATTERN = re.compile(_MONTH + r'\s*(?:-|–|to)\s*' + _MONTH + r'\s+(\d{4})', re.IGNORECASE)
+_MONTH_PATTERN = re.compile(_MONTH + r'\s+(\d{4})', re.IGNORECASE)
+_RELATIVE_PATTERN = re.compile(r'(?:next|following|over)\s+(?:the\s+)?(?:next\s+)?(\d+|one|two|three|four|five|six)\s+(day|week|month|year)s?', re.IGNORECASE)
+_YEAR_PATTERN = re.compile(r'\b(20\d{2}|19\d{2})\b')
+_NUMBER_WORDS = {'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5, 'six': 6}
+
+
+def _month_end(year: int, month: int) -> date:
+    first_next = date(year + month // 12, month % 12 + 1, 1)
+    return first_next - timedelta(days=1)
+
+
+def parse_date_range(
+    text: str,
+    anchor: Optional[date] = None
+) -> Optional[Tuple[np.datetime64, np.datetime64]]:
+    """
+    Extract a date range from a visual description.
+
+    Supports "March 2020 to June 2021" and "2020-2022" (the whole
+    span), "July 18, 2025" (that day), "May-June 2025" (both months),
+    "June 2025" (that month), "over next 4 months" (relative to anchor)
+    and a bare year. Dates without a year use the anchor's year.
+
+    Args:
+        text: Free text, e.g. a [SCREEN] description
+        anchor: Reference date for relative and year-less hints
+
+    Returns:
+        Tuple of (start, end) as datetime64[s] (end inclusive, end of
+        day), or None if the text has no date hint
+    """
+    def as_range(start: date, end: date) -> Tuple[np.datetime64, np.datetime64]:
+        return (np.datetime64(start, 's'),
+                np.datetime64(end, 's') + np.timedelta64(86399, 's'))
+
+    # Explicit spans first, so they aren't read as their first month or year
+    match = _MONTH_YEAR_RANGE_PATTERN.search(text)
+    if match:
+        start = date(int(match.group(2)), MONTHS[match.group(1).lower()[:3]], 1)
+        end_year, end_month = int(match.group(4)), MONTHS[match.group(3).lower()[:3]]
+        if (end_year, end_month) >= (start.year, start.month):
+            return as_range(start, _month_end(end_year, end_month))
+
+    match = _YEAR_RANGE_PATTERN.search(text)
+    if match and int(match.group(2)) >= int(match.group(1)):
+        return as_range(date(int(match.group(1)), 1, 1), date(int(match.group(2)), 12, 31))
+
+    match = _MONTH_RANGE_PATTERN.search(text)
+    if match:
+        year = int(match.group(3))
+        first = MONTHS[match.group(1).lower()[:3]]
+        last = MONTHS[match.group(2).lower()[:3]]
+        end_year = year if last >= first else year + 1
+        return as_range(date(year, first, 1), _month_end(end_year, last))
+
+    match = _DAY_PATTERN.search(text)
+    if match and (match.group(3) or anchor):
+        year = int(match.group(3)) if match.group(3) else anchor.year
+        try:
+            day = date(year, MONTHS[match.group(1).lower()[:3]], int(match.group(2)))
+        except ValueError:
+            day = None
+        if day:
+            relative = _RELATIVE_PATTERN.search(text)
+            if relative:
+                return as_range(day, _add_span(day, relative))
+            return as_range(day, day)
+
+    match = _MONTH_PATTERN.search(text)
+    if match:
+        year, month = int(match.group(2)), MONTHS[match.group(1).lower()[:3]]
+        return as_range(date(year, month, 1), _month_end(year, month))
+
+    match = _RELATIVE_PATTERN.search(text)
+    if match and anchor:
+        return as_range(anchor, _add_span(anchor, match))
+
+    match = _YEAR_PATTERN.search(text)
+    if match:
+        year = int(match.group(1))
+        return as_range(date(year, 1, 1), date(year, 12, 31))
+
+    return None
+
+
+def _add_span(start: date, match: re.Match) -> date:
+    """Add a relative span like 'next 4 months' to a date."""
+    count = match.group(1).lower()
+    count = _NUMBER_WORDS.get(count) or int(count)
+    unit = match.group(2).lower()
+    if unit == 'day':
+        return start + timedelta(days=count)
+    if unit == 'week':
+        return start + timedelta(weeks=count)
+    if unit == 'year':
+        return start.replace(year=start.year + count)
+    month = start.month - 1 + count
+    year = start.year + month // 12
+    month = month % 12 + 1
+    return date(year, month, min(start.day, _month_end(year, month).day))
@@ -1,5 +1,6 @@
 """Script parsers module."""
 
 from .script_parser import ScriptParser, ScriptSegment
+from .timeline import Timeline, TimelineCue
 
-__all__ = ['ScriptParser', 'ScriptSegment']
+__all__ = ['ScriptParser', 'ScriptSegment', 'Timeline', 'TimelineCue']
@@ -6,11 +6,17 @@ Parses the custom script format with:
 - [SCREEN]: Visual descriptions
 - (VOICEOVER): Audio content
 - {EDITING NOTE}: Production notes
+
+Each section gets a stable ID: an explicit `{#tag}` at the end of its
+header (`### [0:20-0:50] THE REVEAL {#reveal}`), or else a fingerprint
+of its title and cues. Artifacts are named by ID, not by position, so
+inserting or moving a section leaves every other section's files valid.
 """
 
+import hashlib
 import re
 from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 
@@ -23,6 +29,8 @@ class ScriptSegment:
     screen: List[str]  # Visual descriptions
     voiceover: List[str]  # Voiceover text
     editing_notes: List[str]  # Editing notes
+    cues: List[Tuple[str, List[str]]] = field(default_factory=list)  # (screen, voiceover) in script order
+    id: str = ''       # Stable ID: header {#tag} or content fingerprint
 
     @property
     def duration(self) -> float:
@@ -34,6 +42,29 @@ class ScriptSegment:
         return " ".join(self.voiceover)
 
 
+def segment_fingerprint(title: str, cues: List[Tuple[str, List[str]]]) -> str:
+    """
+    Content-derived segment ID, independent of position and timestamps.
+
+    A slug of the first words of the title (for readable file names)
+    plus a hash of the title and every cue's screen and voiceover text.
+
+    Args:
+        title: Section title
+        cues: (screen, voiceover blocks) pairs
+
+    Returns:
+        ID like 'the-reveal-3fa2b1c0'
+    """
+    normalized = [" ".join(title.lower().split())]
+    for screen, voiceover in cues:
+        normalized.append(" ".join(screen.split()))
+        normalized.extend(" ".join(block.split()) for block in voiceover)
+    digest = hashlib.sha1("\n".join(normalized).encode('utf-8')).hexdigest()[:8]
+    slug = "-".join(re.findall(r'[a-z0-9]+', title.lower())[:3])
+    return f"{slug}-{digest}" if slug else digest
+
+
 class ScriptParser:
     """Parser for markdown video scripts."""
 
@@ -42,6 +73,11 @@ class ScriptParser:
     SCREEN_PATTERN = r'\[SCREEN\]:\s*(.*?)(?=\(VOICEOVER\)|\{EDITING|$)'
     VOICEOVER_PATTERN = r'\(VOICEOVER\):\s*(.*?)(?=\[SCREEN\]|\{EDITING|$)'
     EDITING_PATTERN = r'\{EDITING[^}]*\}:\s*(.*?)(?=\[SCREEN\]|\(VOICEOVER\)|$)'
+    ID_TAG_PATTERN = r'\{#([A-Za-z0-9_-]+)\}'
+
+    # Block patterns used by the parser: a block runs until the next marker
+    SCREEN_BLOCK_PATTERN = r'\[SCREEN\]:\s*([^\n]+(?:\n(?!\[SCREEN\]|\(VOICEOVER\)|\{EDITING)[^\n]+)*)'
+    VOICEOVER_BLOCK_PATTERN = r'\(VOICEOVER\):\s*([^\n]+(?:\n+(?!\[SCREEN\]|\(VOICEOVER\)|\{EDITING)[^\n]+)*)'
 
     def __init__(self, script_path: str):
         self.script_path = Path(script_path)
@@ -79,9 +115,15 @@ class ScriptParser:
 
         for match in re.finditer(section_pattern, self.raw_text, re.DOTALL):
             timestamp_str = match.group(1)
-            title = match.group(2).strip()
+            # The lazy match runs to the next section; the title is its first line
+            title = match.group(2).strip().split('\n')[0].strip()
             content = match.group(0)
 
+            # An explicit {#tag} in the header is the section's ID
+            tag = re.search(self.ID_TAG_PATTERN, title)
+            if tag:
+                title = re.sub(self.ID_TAG_PATTERN, '', title).strip()
+
             # Find the code block with the actual script content
             code_block_match = re.search(r'```\n(.*?)\n```', content, re.DOTALL)
             if code_block_match:
@@ -92,6 +134,7 @@ class ScriptParser:
             sections.append({
                 'timestamp_str': f"[{timestamp_str}]",
                 'title': title,
+                'id': tag.group(1) if tag else None,
                 'content': script_content
             })
 
@@ -109,14 +152,15 @@ class ScriptParser:
         editing_notes = []
 
         # Extract all [SCREEN]: blocks
-        screen_matches = re.finditer(r'\[SCREEN\]:\s*([^\n]+(?:\n(?!\[SCREEN\]|\(VOICEOVER\)|\{EDITING)[^\n]+)*)', content)
+        screen_matches = re.finditer(self.SCREEN_BLOCK_PATTERN, content)
         for match in screen_matches:
             text = match.group(1).strip()
             if text:
                 screen_descriptions.append(text)
 
         # Extract all (VOICEOVER): blocks
-        voiceover_matches = re.finditer(r'\(VOICEOVER\):\s*([^\n]+(?:\n(?!\[SCREEN\]|\(VOICEOVER\)|\{EDITING)[^\n]+)*)', content)
+        # Paragraphs separated by blank lines belong to the same block
+        voiceover_matches = re.finditer(self.VOICEOVER_BLOCK_PATTERN, content)
         for match in voiceover_matches:
             text = match.group(1).strip()
             if text:
@@ -131,6 +175,33 @@ class ScriptParser:
 
         return screen_descriptions, voiceover_lines, editing_notes
 
+    def _parse_cues(self, content: str) -> List[Tuple[str, List[str]]]:
+        """
+        Pair each [SCREEN] description with the voiceover blocks that follow it.
+
+        Voiceover before the first [SCREEN] gets a cue with an empty
+        description, and a section without [SCREEN] lines is one such cue.
+
+        Returns:
+            List of (screen_description, voiceover_blocks) in script order
+        """
+        blocks = []
+        for kind, pattern in (('screen', self.SCREEN_BLOCK_PATTERN), ('voiceover', self.VOICEOVER_BLOCK_PATTERN)):
+            for match in re.finditer(pattern, content):
+                text = match.group(1).strip()
+                if text:
+                    blocks.append((match.start(), kind, text))
+
+        cues: List[Tuple[str, List[str]]] = []
+        for _, kind, text in sorted(blocks):
+            if kind == 'screen':
+                cues.append((text, []))
+            elif not cues:
+                cues.append(('', [text]))
+            else:
+                cues[-1][1].append(text)
+        return cues
+
     def parse(self) -> List[ScriptSegment]:
         """
         Parse the entire script into segments.
@@ -140,11 +211,13 @@ class ScriptParser:
         """
         sections = self._extract_sections()
         self.segments = []
+        seen_ids = set()
 
         for section in sections:
             try:
                 start_time, end_time = self._parse_timestamp(section['timestamp_str'])
                 screen, voiceover, editing = self._parse_section_content(section['content'])
+                cues = self._parse_cues(section['content'])
 
                 segment = ScriptSegment(
                     start_time=start_time,
@@ -152,9 +225,22 @@ class ScriptParser:
                     title=section['title'],
                     screen=screen,
                     voiceover=voiceover,
-                    editing_notes=editing
+                    editing_notes=editing,
+                    cues=cues,
+                    id=section['id'] or segment_fingerprint(section['title'], cues)
                 )
 
+                # Repeated IDs (identical sections, reused tags) get a suffix
+                if segment.id in seen_ids:
+                    base = segment.id
+                    n = 2
+                    while f"{base}-{n}" in seen_ids:
+                        n += 1
+                    segment.id = f"{base}-{n}"
+                    if section['id']:
+                        print(f"Warning: Duplicate section ID '{base}', using '{segment.id}'")
+                seen_ids.add(segment.id)
+
                 self.segments.append(segment)
 
             except Exception as e:
@@ -203,7 +289,7 @@ class ScriptParser:
         print(f"\nSegments:")
 
         for i, seg in enumerate(self.segments, 1):
-            print(f"\n{i}. [{seg.start_time:.0f}s - {seg.end_time:.0f}s] {seg.title}")
+            print(f"\n{i}. [{seg.start_time:.0f}s - {seg.end_time:.0f}s] {seg.title} ({seg.id})")
             print(f"   Duration: {seg.duration:.1f}s")
             print(f"   Screen descriptions: {len(seg.screen)}")
             print(f"   Voiceover length: {len(seg.voiceover_text)} chars")
@@ -0,0 +1,145 @@
+"""
+Timeline - One visual cue per [SCREEN] description, placed in time.
+
+Each [SCREEN] description and the voiceover blocks after it form a cue.
+Within a segment the cues share the spoken audio in proportion to their
+voiceover length (a cue without narration still gets MIN_CUE_CHARS worth
+of time); the last cue also covers any silence up to the segment end.
+Before audio exists the script timestamps stand in for it.
+
+Cues are kept sorted by start time, so looking up what is on screen at a
+given time, or everything overlapping a range, is a binary search.
+"""
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Sequence
+
+from .script_parser import ScriptSegment
+
+
+# Weight of a cue with little or no narration, in characters
+MIN_CUE_CHARS = 24
+
+
+@dataclass
+class TimelineCue:
+    """A [SCREEN] description with its voiceover and its place on the timeline."""
+    segment: int          # Index of the segment in the script
+    index: int            # Position of the cue within its segment
+    screen: str
+    voiceover: List[str] = field(default_factory=list)
+    start: float = 0.0    # Seconds from the start of the video
+    end: float = 0.0
+    scene: Optional[str] = None  # Scene path once rendered
+    segment_id: str = ''  # Stable ID of the segment (see ScriptSegment.id)
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+    @property
+    def voiceover_text(self) -> str:
+        return " ".join(self.voiceover)
+
+    def to_dict(self) -> Dict:
+        return {
+            'segment': self.segment,
+            'segment_id': self.segment_id,
+            'index': self.index,
+            'start': round(self.start, 3),
+            'end': round(self.end, 3),
+            'screen': self.screen,
+            'scene': self.scene,
+        }
+
+
+class Timeline:
+    """Screen cues of a script as a sorted interval index."""
+
+    def __init__(self, cues: Sequence[TimelineCue]):
+        """
+        Initialize timeline.
+
+        Args:
+            cues: Cues with start/end times (any order)
+        """
+        self.cues: List[TimelineCue] = sorted(cues, key=lambda c: (c.start, c.segment, c.index))
+        self._starts = [cue.start for cue in self.cues]
+
+    @classmethod
+    def from_segments(
+        cls,
+        segments: Sequence[ScriptSegment],
+        scene_lengths: Optional[Sequence[float]] = None,
+        speech_lengths: Optional[Sequence[Optional[float]]] = None
+    ) -> 'Timeline':
+        """
+        Build the timeline of a parsed script.
+
+        Args:
+            segments: Parsed segments, in order
+            scene_lengths: Length of each segment's scene on the video
+                (defaults to the script timestamps)
+            speech_lengths: Spoken audio length of each segment, which the
+                cues share; None (or a missing entry) uses the scene length
+
+        Returns:
+            Timeline
+        """
+        cues = []
+        offset = 0.0
+        for i, segment in enumerate(segments):
+            length = scene_lengths[i] if scene_lengths is not None else segment.duration
+            speech = speech_lengths[i] if speech_lengths is not None else None
+            pairs = segment.cues or [(segment.screen[0] if segment.screen else '', list(segment.voiceover))]
+            placed = cls._place(i, pairs, offset, length, min(speech or length, length))
+            for cue in placed:
+                cue.segment_id = segment.id
+            cues.extend(placed)
+            offset += length
+        return cls(cues)
+
+    @staticmethod
+    def _place(segment: int, pairs, offset: float, length: float, speech: float) -> List[TimelineCue]:
+        weights = [max(len(" ".join(voiceover)), MIN_CUE_CHARS) for _, voiceover in pairs]
+        total = float(sum(weights))
+        cues, elapsed = [], 0.0
+        for k, ((screen, voiceover), weight) in enumerate(zip(pairs, weights)):
+            start = offset + speech * elapsed / total
+            elapsed += weight
+            end = offset + (length if k == len(pairs) - 1 else speech * elapsed / total)
+            cues.append(TimelineCue(segment, k, screen, list(voiceover), start, end))
+        return cues
+
+    def __len__(self) -> int:
+        return len(self.cues)
+
+    def __iter__(self) -> Iterator[TimelineCue]:
+        return iter(self.cues)
+
+    @property
+    def duration(self) -> float:
+        return max((cue.end for cue in self.cues), default=0.0)
+
+    def at(self, t: float) -> Optional[TimelineCue]:
+        """Cue on screen at time t (None outside the timeline)."""
+        i = bisect_right(self._starts, t) - 1
+        if i < 0 or t >= self.cues[i].end:
+            return None
+        return self.cues[i]
+
+    def between(self, start: float, end: float) -> List[TimelineCue]:
+        """Cues overlapping [start, end)."""
+        # Cues don't overlap each other, so only the one before `start` can reach into it
+        first = max(bisect_right(self._starts, start) - 1, 0)
+        last = bisect_left(self._starts, end)
+        return [cue for cue in self.cues[first:last] if cue.end > start]
+
+    def for_segment(self, segment: int) -> List[TimelineCue]:
+        """Cues of one segment, in order."""
+        return [cue for cue in self.cues if cue.segment == segment]
+
+    def to_list(self) -> List[Dict]:
+        """JSON-serializable cue list."""
+        return [cue.to_dict() for cue in self.cues]
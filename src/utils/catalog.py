@@ -0,0 +1,314 @@
+"""
+Catalog - SQLite index of every rendered artifact, across episodes.
+
+Each scene, voiceover, encoded segment and final video is recorded with
+its content hash, the hash of its inputs (see utils.journal.input_hash),
+episode, provider, resolution, duration, size and render time. Final
+videos reference the assets they were made from.
+
+The catalog is used to:
+- reuse work across episodes: an intro card or outro voiceover with the
+  same inputs is found by find() instead of being rendered again
+- garbage-collect files no video references any more (collect_garbage)
+- report cost and render performance across the whole catalog (report)
+
+Several jobs can share one catalog: it runs in WAL mode and every write
+is its own short transaction.
+
+Usage:
+    cd src && python -m utils.catalog report --by episode
+    cd src && python -m utils.catalog gc --older-than 7 --apply
+"""
+
+import argparse
+import os
+import sqlite3
+import time
+import wave
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .journal import file_hash
+
+
+KINDS = ('scene', 'voiceover', 'segment', 'video')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS assets (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    path TEXT NOT NULL,
+    content_hash TEXT,
+    inputs TEXT,
+    episode TEXT,
+    unit TEXT,
+    provider TEXT,
+    width INTEGER,
+    height INTEGER,
+    duration REAL,
+    size_bytes INTEGER,
+    render_seconds REAL,
+    created REAL NOT NULL,
+    UNIQUE (kind, path)
+);
+CREATE INDEX IF NOT EXISTS assets_content_hash ON assets (content_hash);
+CREATE INDEX IF NOT EXISTS assets_episode ON assets (episode);
+CREATE INDEX IF NOT EXISTS assets_inputs ON assets (kind, inputs);
+CREATE TABLE IF NOT EXISTS refs (
+    video INTEGER NOT NULL REFERENCES assets (id) ON DELETE CASCADE,
+    asset INTEGER NOT NULL REFERENCES assets (id) ON DELETE CASCADE,
+    PRIMARY KEY (video, asset)
+);
+CREATE INDEX IF NOT EXISTS refs_asset ON refs (asset);
+"""
+
+
+def wav_duration(path: str) -> Optional[float]:
+    """Length of a WAV file from its header (None for other formats)."""
+    if Path(path).suffix.lower() != '.wav':
+        return None
+    try:
+        with wave.open(str(path), 'rb') as w:
+            return w.getnframes() / float(w.getframerate())
+    except (wave.Error, EOFError, OSError):
+        return None
+
+
+class AssetCatalog:
+    """SQLite-backed catalog of rendered artifacts."""
+
+    def __init__(self, path: str = "output/catalog.db"):
+        """
+        Open (or create) a catalog.
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA foreign_keys=ON")
+        with self.db:
+            self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def add(
+        self,
+        kind: str,
+        path: str,
+        inputs: Optional[str] = None,
+        episode: Optional[str] = None,
+        unit: Optional[str] = None,
+        provider: Optional[str] = None,
+        resolution: Optional[Tuple[int, int]] = None,
+        duration: Optional[float] = None,
+        render_seconds: Optional[float] = None
+    ) -> Optional[int]:
+        """
+        Record a rendered file (replaces an earlier record of the same path).
+
+        A file reused unchanged by another episode stays with the episode
+        that rendered it, and keeps its duration and render time when they
+        are not given again.
+
+        Args:
+            kind: 'scene', 'voiceover', 'segment' or 'video'
+            path: File path (its content hash and size are read here)
+            inputs: Hash of what it was rendered from
+            episode: Episode (script) name
+            unit: Section ID or scene label within the episode
+            provider: Scene type, TTS provider or encoder backend/profile
+            resolution: (width, height) of images and video
+            duration: Length in seconds of audio and video
+            render_seconds: Time spent producing it
+
+        Returns:
+            Asset ID, or None if the file doesn't exist
+        """
+        if kind not in KINDS:
+            raise ValueError(f"Unknown asset kind: {kind} (use {', '.join(KINDS)})")
+        if not os.path.exists(path):
+            return None
+        # Absolute, so jobs started from different directories agree
+        path = str(Path(path).resolve())
+        width, height = resolution or (None, None)
+        with self.db:
+            self.db.execute(
+                """
+                INSERT INTO assets (kind, path, content_hash, inputs, episode, unit, provider,
+                                    width, height, duration, size_bytes, render_seconds, created)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (kind, path) DO UPDATE SET
+                    episode = CASE WHEN assets.content_hash = excluded.content_hash
+                                   THEN assets.episode ELSE excluded.episode END,
+                    unit = CASE WHEN assets.content_hash = excluded.content_hash
+                                THEN assets.unit ELSE excluded.unit END,
+                    content_hash = excluded.content_hash, inputs = excluded.inputs,
+                    provider = excluded.provider,
+                    width = excluded.width, height = excluded.height,
+                    duration = COALESCE(excluded.duration, assets.duration),
+                    size_bytes = excluded.size_bytes,
+                    render_seconds = COALESCE(excluded.render_seconds, assets.render_seconds),
+                    created = excluded.created
+                """,
+                (kind, str(path), file_hash(path), inputs, episode, unit, provider, width, height,
+                 duration, os.path.getsize(path), render_seconds, time.time())
+            )
+            row = self.db.execute("SELECT id FROM assets WHERE kind = ? AND path = ?", (kind, str(path))).fetchone()
+        return row['id']
+
+    def link(self, video_id: int, asset_paths: Iterable[str]):
+        """
+        Record the files a video was made from.
+
+        Replaces the video's earlier links: a re-rendered video keeps its
+        record, and files edited out of it must become collectable.
+        """
+        paths = sorted({str(Path(path).resolve()) for path in asset_paths if path})
+        with self.db:
+            self.db.execute("DELETE FROM refs WHERE video = ?", (video_id,))
+            for path in paths:
+                self.db.execute(
+                    "INSERT OR IGNORE INTO refs (video, asset) "
+                    "SELECT ?, id FROM assets WHERE path = ? AND kind != 'video'",
+                    (video_id, path)
+                )
+
+    def find(self, kind: str, inputs: str) -> Optional[str]:
+        """
+        Newest file of a kind rendered from the same inputs, in any episode.
+
+        Args:
+            kind: Asset kind
+            inputs: Input hash
+
+        Returns:
+            Path of an existing file, or None
+        """
+        rows = self.db.execute(
+            "SELECT path FROM assets WHERE kind = ? AND inputs = ? ORDER BY created DESC",
+            (kind, inputs)
+        )
+        return next((row['path'] for row in rows if os.path.exists(row['path'])), None)
+
+    def by_hash(self, content_hash: str) -> List[Dict]:
+        """Every record of files with the given content hash."""
+        rows = self.db.execute("SELECT * FROM assets WHERE content_hash = ? ORDER BY created", (content_hash,))
+        return [dict(row) for row in rows]
+
+    def collect_garbage(self, older_than_days: float = 7.0, dry_run: bool = True) -> List[str]:
+        """
+        Delete files no video references, and forget files that are gone.
+
+        Only scenes, voiceovers and segments are collected; final videos
+        are kept. Recent assets are left alone, since a running job may
+        not have linked them to its video yet.
+
+        Args:
+            older_than_days: Minimum age of a collected asset
+            dry_run: Only list what would be deleted
+
+        Returns:
+            Paths deleted (or that would be)
+        """
+        cutoff = time.time() - older_than_days * 86400
+        rows = self.db.execute(
+            """
+            SELECT id, path FROM assets
+            WHERE kind != 'video' AND created < ?
+              AND NOT EXISTS (SELECT 1 FROM refs WHERE refs.asset = assets.id)
+            """,
+            (cutoff,)
+        ).fetchall()
+        # The same file can be recorded more than once (e.g. as two kinds)
+        shared = {row['path'] for row in self.db.execute(
+            "SELECT DISTINCT a.path FROM assets a JOIN refs r ON r.asset = a.id"
+        )}
+
+        deleted = [row['path'] for row in rows if row['path'] not in shared]
+        if dry_run:
+            return deleted
+
+        for path in deleted:
+            Path(path).unlink(missing_ok=True)
+        with self.db:
+            self.db.executemany("DELETE FROM assets WHERE id = ?", [(row['id'],) for row in rows])
+            missing = [(row['id'],) for row in self.db.execute("SELECT id, path FROM assets")
+                       if not os.path.exists(row['path'])]
+            self.db.executemany("DELETE FROM assets WHERE id = ?", missing)
+        return deleted
+
+    def report(self, by: str = 'kind') -> List[Dict]:
+        """
+        Totals per kind, episode or provider.
+
+        Args:
+            by: 'kind', 'episode' or 'provider'
+
+        Returns:
+            One row per group: count, size, media duration, render time
+            and render speed (seconds of media per second of rendering)
+        """
+        if by not in ('kind', 'episode', 'provider'):
+            raise ValueError(f"Unknown grouping: {by}")
+        group = "kind" if by == 'kind' else f"{by}, kind"
+        rows = self.db.execute(
+            f"""
+            SELECT {group}, COUNT(*) AS count, SUM(size_bytes) AS size_bytes,
+                   SUM(duration) AS duration, SUM(render_seconds) AS render_seconds,
+                   AVG(render_seconds) AS avg_render_seconds
+            FROM assets GROUP BY {group} ORDER BY {group}
+            """
+        )
+        result = []
+        for row in rows:
+            row = dict(row)
+            media, render = row['duration'], row['render_seconds']
+            row['speed'] = round(media / render, 2) if media and render else None
+            result.append(row)
+        return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Asset catalog reports and garbage collection")
+    parser.add_argument("--db", default="output/catalog.db", help="Catalog file (default: output/catalog.db)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    report = commands.add_parser("report", help="Cost and render performance totals")
+    report.add_argument("--by", choices=["kind", "episode", "provider"], default="kind")
+
+    gc = commands.add_parser("gc", help="Delete files no video references")
+    gc.add_argument("--older-than", type=float, default=7.0, help="Minimum age in days (default: 7)")
+    gc.add_argument("--apply", action="store_true", help="Delete (default: only list)")
+
+    find = commands.add_parser("find", help="Records of a content hash")
+    find.add_argument("hash")
+
+    args = parser.parse_args()
+    catalog = AssetCatalog(args.db)
+    try:
+        if args.command == "report":
+            for row in catalog.report(args.by):
+                label = " / ".join(str(row[key]) for key in (args.by, 'kind') if key in row and row[key] is not None)
+                speed = f", {row['speed']:.1f}x realtime" if row['speed'] else ""
+                print(f"{label:40} {row['count']:6d} files  {(row['size_bytes'] or 0) / 1e6:10.1f} MB  "
+                      f"{row['duration'] or 0:9.1f}s media  {row['render_seconds'] or 0:9.1f}s render{speed}")
+        elif args.command == "gc":
+            paths = catalog.collect_garbage(args.older_than, dry_run=not args.apply)
+            for path in paths:
+                print(("🗑️  " if args.apply else "   ") + path)
+            action = "Deleted" if args.apply else "Would delete (use --apply)"
+            print(f"{action}: {len(paths)} files")
+        elif args.command == "find":
+            for row in catalog.by_hash(args.hash):
+                print(f"{row['kind']:10} {row['episode'] or '-':30} {row['path']}")
+    finally:
+        catalog.close()
+
+
+if __name__ == "__main__":
+    main()
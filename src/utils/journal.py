@@ -0,0 +1,135 @@
+"""
+Job Journal - Crash-safe record of completed pipeline work.
+
+Every finished unit of work (a scene, a voiceover, the encoded video) is
+recorded with a hash of its inputs and the files it produced. A run that
+dies halfway leaves the journal behind, and a resumed run skips every
+unit whose inputs hash the same and whose outputs are still on disk.
+
+The journal is append-only JSON lines: a later record for the same unit
+supersedes an earlier one. Each record is one O_APPEND write followed by
+an fsync, so other writers' records are never overwritten; a line torn
+by a crash mid-write is skipped when the journal is read back.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .scratch import partial_path
+
+
+def file_hash(path: str) -> str:
+    """SHA-1 of a file's contents."""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def input_hash(*parts) -> str:
+    """Stable hash of JSON-serializable inputs (dict key order doesn't matter)."""
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+class JobJournal:
+    """Append-only journal of completed units in an output directory."""
+
+    def __init__(self, path: str, resume: bool = False):
+        """
+        Initialize journal.
+
+        Args:
+            path: Journal file (JSON lines)
+            resume: Keep the records of a previous run; otherwise the
+                journal starts empty
+        """
+        self.path = Path(path)
+        self.records: List[Dict] = []
+        self._latest: Dict[Tuple[str, str], Dict] = {}
+
+        if resume and self.path.exists():
+            with open(self.path, 'r', encoding='utf-8') as f:
+                text = f.read()
+            for line in text.splitlines():
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    self._add(json.loads(line))
+                except json.JSONDecodeError:
+                    continue  # Torn by a crash
+            if text and not text.endswith('\n'):
+                # Keep the next record off the torn line
+                self._append_bytes(b'\n')
+        else:
+            self._truncate()
+
+    def _add(self, record: Dict):
+        self.records.append(record)
+        self._latest[(record['kind'], record['key'])] = record
+
+    def _truncate(self):
+        """Start an empty journal (atomically replacing an old one)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        partial = partial_path(self.path)
+        with open(partial, 'w', encoding='utf-8'):
+            pass
+        os.replace(partial, self.path)
+
+    def _append_bytes(self, data: bytes):
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            # A single write: concurrent appends never interleave within a line
+            os.write(fd, data)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def completed(self, kind: str, key: str, inputs: str) -> Optional[Dict]:
+        """
+        Record of a finished unit, if it can be reused.
+
+        Args:
+            kind: Unit kind ('scene', 'voiceover', 'video')
+            key: Unit name within its kind
+            inputs: Input hash the unit must have been produced from
+
+        Returns:
+            The record, or None if the unit has to be (re)done
+        """
+        record = self._latest.get((kind, key))
+        if record is None or record['inputs'] != inputs:
+            return None
+        if not all(Path(path).exists() for path in record['outputs']):
+            return None
+        return record
+
+    def record(self, kind: str, key: str, inputs: str, outputs: List[str], **extra) -> Dict:
+        """
+        Record a finished unit.
+
+        Args:
+            kind: Unit kind
+            key: Unit name within its kind
+            inputs: Hash of the unit's inputs
+            outputs: Files the unit produced
+            **extra: Additional JSON-serializable fields
+
+        Returns:
+            The record
+        """
+        record = dict(extra, kind=kind, key=key, inputs=inputs,
+                      outputs=[str(path) for path in outputs], time=round(time.time(), 3))
+        self._add(record)
+        self._append_bytes((json.dumps(record) + '\n').encode('utf-8'))
+        return record
+
+    def count(self, kind: str) -> int:
+        """Number of distinct units of a kind on record."""
+        return sum(1 for k, _ in self._latest if k == kind)
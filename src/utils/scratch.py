@@ -0,0 +1,115 @@
+"""
+Scratch - Private working directory for one generation job.
+
+Intermediates (stitched voiceovers, temporary audio tracks, encodes in
+progress) go to a directory no other job can see, on RAM-backed storage
+(/dev/shm) when it has room, otherwise in the system temp directory.
+Finished artifacts are published into the output tree with
+publish_file(), which only ever exposes complete files, and the scratch
+directory is removed when the job ends, whether it succeeded or not.
+
+Set YT_SCRATCH_DIR to put scratch directories somewhere else.
+"""
+
+import errno
+import os
+import shutil
+import tempfile
+import uuid
+from pathlib import Path
+from typing import Optional
+
+
+# RAM-backed filesystems tried before the system temp directory
+TMPFS_ROOTS = ('/dev/shm',)
+
+# Free space a RAM-backed root needs before jobs use it
+MIN_FREE_BYTES = 2 * 1024 ** 3
+
+
+def partial_path(path) -> Path:
+    """Unique temporary sibling of `path` to write before renaming into place."""
+    path = Path(path)
+    return path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.partial")
+
+
+def publish_file(source: str, dest: str) -> str:
+    """
+    Move a finished file to its final path atomically.
+
+    Within one filesystem this is a rename. Across filesystems (scratch on
+    tmpfs) the file is copied next to the destination first and renamed
+    over it, so readers see either the old file or the complete new one.
+
+    Args:
+        source: Finished file (removed afterwards)
+        dest: Final path
+
+    Returns:
+        Final path
+    """
+    source, dest = Path(source), Path(dest)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.replace(source, dest)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        partial = partial_path(dest)
+        try:
+            shutil.copyfile(source, partial)
+            os.replace(partial, dest)
+        finally:
+            partial.unlink(missing_ok=True)
+        source.unlink()
+    return str(dest)
+
+
+def scratch_root(min_free_bytes: int = MIN_FREE_BYTES) -> str:
+    """Where scratch directories are created (YT_SCRATCH_DIR, tmpfs, or temp)."""
+    override = os.getenv('YT_SCRATCH_DIR')
+    if override:
+        return override
+    for root in TMPFS_ROOTS:
+        if os.path.isdir(root) and os.access(root, os.W_OK):
+            if shutil.disk_usage(root).free >= min_free_bytes:
+                return root
+    return tempfile.gettempdir()
+
+
+class ScratchSpace:
+    """A private scratch directory, removed on cleanup() or leaving a with block."""
+
+    def __init__(self, root: Optional[str] = None, prefix: str = "yt-job-",
+                 min_free_bytes: int = MIN_FREE_BYTES):
+        """
+        Create a scratch directory.
+
+        Args:
+            root: Parent directory (default: see scratch_root())
+            prefix: Directory name prefix
+            min_free_bytes: Free space a RAM-backed root needs to be used
+        """
+        self.root = root or scratch_root(min_free_bytes)
+        Path(self.root).mkdir(parents=True, exist_ok=True)
+        self.path = Path(tempfile.mkdtemp(prefix=prefix, dir=self.root))
+
+    @property
+    def in_memory(self) -> bool:
+        return str(self.root) in TMPFS_ROOTS
+
+    def subdir(self, name: str) -> Path:
+        """A directory inside the scratch space (created if needed)."""
+        path = self.path / name
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def cleanup(self):
+        """Remove the scratch directory and everything in it."""
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def __enter__(self) -> 'ScratchSpace':
+        return self
+
+    def __exit__(self, *exc):
+        self.cleanup()
@@ -0,0 +1,166 @@
+"""
+Captions - Caption cues from voiceover lines, SRT/VTT sidecars.
+
+Each voiceover line of a segment becomes a cue; lines longer than two
+rows of MAX_LINE_CHARS are split into several cues. A segment's cues
+share its spoken audio in proportion to their character counts, which
+tracks speech closely enough for narration read at an even pace.
+
+A scene's 'captions' setting holds its cues relative to the scene start:
+
+    [{'start': 0.0, 'end': 2.4, 'text': 'Markets are not\\nmoved by news'}]
+
+Encoders burn them in from a caption renderer (see visuals.captions)
+that rasterizes each distinct text once; the sidecars get absolute times.
+"""
+
+import re
+import textwrap
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from utils.scratch import partial_path
+
+
+# Broadcast subtitle guidelines: ~42 characters per row, two rows per cue
+MAX_LINE_CHARS = 42
+MAX_ROWS = 2
+
+
+@dataclass
+class CaptionCue:
+    """One caption on the timeline; rows are separated by newlines."""
+    start: float
+    end: float
+    text: str
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+def caption_lines(voiceover: Sequence[str], max_chars: int = MAX_LINE_CHARS, max_rows: int = MAX_ROWS) -> List[str]:
+    """
+    Split voiceover blocks into caption texts.
+
+    Args:
+        voiceover: Voiceover blocks (ScriptSegment.voiceover); their
+            line breaks are kept as cue boundaries
+        max_chars: Characters per row
+        max_rows: Rows per cue
+
+    Returns:
+        Cue texts with rows joined by newlines
+    """
+    texts = []
+    for block in voiceover:
+        for line in block.split('\n'):
+            # Markdown emphasis/code marks are read, not shown
+            line = ' '.join(re.sub(r'[*_`]+', '', line).split())
+            if not line:
+                continue
+            rows = textwrap.wrap(line, max_chars, break_on_hyphens=False)
+            texts.extend('\n'.join(rows[i:i + max_rows]) for i in range(0, len(rows), max_rows))
+    return texts
+
+
+def time_cues(texts: Sequence[str], duration: float, offset: float = 0.0) -> List[CaptionCue]:
+    """
+    Spread cue texts over a span in proportion to their character counts.
+
+    Args:
+        texts: Cue texts, in reading order
+        duration: Length of the span (the spoken audio) in seconds
+        offset: Start of the span
+
+    Returns:
+        Back-to-back cues covering the span
+    """
+    weights = np.array([len(text.replace('\n', ' ')) for text in texts], dtype=np.float64)
+    if not len(weights) or duration <= 0:
+        return []
+    bounds = offset + duration * np.concatenate([[0.0], np.cumsum(weights)]) / weights.sum()
+    return [
+        CaptionCue(round(float(start), 3), round(float(end), 3), text)
+        for start, end, text in zip(bounds[:-1], bounds[1:], texts)
+    ]
+
+
+def parse_cues(captions: Optional[Sequence[Dict]]) -> List[CaptionCue]:
+    """Cues from a scene's 'captions' setting."""
+    return [CaptionCue(float(c['start']), float(c['end']), c['text']) for c in captions or []]
+
+
+def caption_track(cues: Sequence[CaptionCue], fps: int, num_frames: int) -> Tuple[np.ndarray, List[str]]:
+    """
+    Caption shown on each frame of a scene.
+
+    Cue edges are rounded to frame ticks the same way scene boundaries
+    are, so every backend switches captions on the same frame.
+
+    Args:
+        cues: Cues relative to the scene start
+        fps: Frames per second
+        num_frames: Frames in the scene
+
+    Returns:
+        (index into texts per frame, -1 for none; distinct texts)
+    """
+    track = np.full(num_frames, -1, dtype=np.intp)
+    index: Dict[str, int] = {}
+    for cue in cues:
+        first = max(0, int(round(cue.start * fps)))
+        last = min(num_frames, int(round(cue.end * fps)))
+        track[first:last] = index.setdefault(cue.text, len(index))
+    return track, list(index)
+
+
+def _timestamp(seconds: float, separator: str) -> str:
+    ms = int(round(seconds * 1000))
+    hours, ms = divmod(ms, 3600000)
+    minutes, ms = divmod(ms, 60000)
+    secs, ms = divmod(ms, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{separator}{ms:03d}"
+
+
+def format_srt(cues: Sequence[CaptionCue]) -> str:
+    """Cues as a SubRip (.srt) document."""
+    blocks = [
+        f"{i}\n{_timestamp(cue.start, ',')} --> {_timestamp(cue.end, ',')}\n{cue.text}\n"
+        for i, cue in enumerate(cues, 1)
+    ]
+    return '\n'.join(blocks)
+
+
+def format_vtt(cues: Sequence[CaptionCue]) -> str:
+    """Cues as a WebVTT (.vtt) document."""
+    blocks = [
+        f"{_timestamp(cue.start, '.')} --> {_timestamp(cue.end, '.')}\n{cue.text}\n"
+        for cue in cues
+    ]
+    return '\n'.join(['WEBVTT\n'] + blocks)
+
+
+def write_sidecars(cues: Sequence[CaptionCue], video_path: str) -> Dict[str, str]:
+    """
+    Write .srt and .vtt files next to a video.
+
+    Args:
+        cues: Cues with absolute times
+        video_path: Video the captions belong to ('<stem>.srt'/'<stem>.vtt')
+
+    Returns:
+        Dictionary of format -> path
+    """
+    video_path = Path(video_path)
+    paths = {}
+    for fmt, formatter in (('srt', format_srt), ('vtt', format_vtt)):
+        path = video_path.with_suffix(f'.{fmt}')
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = partial_path(path)
+        partial.write_text(formatter(cues), encoding='utf-8')
+        partial.replace(path)
+        paths[fmt] = str(path)
+    return paths
@@ -8,19 +8,45 @@ Uses MoviePy to:
 - Export final video
 """
 
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Iterator, List, Dict, Optional, Tuple
 import json
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+
+import numpy as np
+
+from .captions import caption_track, parse_cues
+from .encoder_profiles import EncoderProfile, get_profile
+from .ffmpeg_utils import get_ffmpeg_binary
+from .motion import KenBurns
+from .shots import ShotSequence
+from .transitions import parse_transition, rgb_color
+from .renditions import Rendition, build_filter_graph
+from utils.scratch import partial_path, publish_file
 
 
 class VideoCompositor:
     """Compose final video from scenes and audio."""
 
+    # In-memory scene config keys that are not written to project files
+    RUNTIME_KEYS = ('frame', 'animation')
+
+    BACKENDS = ('moviepy', 'pyav')
+
     def __init__(
         self,
         output_dir: str = "output/video",
         resolution: Tuple[int, int] = (1920, 1080),
-        fps: int = 30
+        fps: int = 30,
+        encoder_profile: str = "upload",
+        backend: str = "moviepy",
+        caption_renderer=None,
+        scratch_dir: Optional[str] = None
     ):
         """
         Initialize video compositor.
@@ -29,22 +55,41 @@ class VideoCompositor:
             output_dir: Output directory for videos
             resolution: Video resolution (width, height)
             fps: Frames per second
+            encoder_profile: Encoder profile name ('draft', 'upload',
+                'compact', 'archive') or an EncoderProfile
+            backend: Encoding backend - 'moviepy' (MoviePy + ffmpeg
+                subprocess) or 'pyav' (in-process libav, see PyAVEncoder)
+            caption_renderer: Burns scene 'captions' into the video when
+                set (see visuals.captions.CaptionRenderer)
+            scratch_dir: Where encodes and temporary audio are written
+                before finished videos are moved into output_dir (default:
+                a private temporary directory inside output_dir)
         """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown encoding backend: {backend} (use {', '.join(self.BACKENDS)})")
+
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.resolution = resolution
         self.fps = fps
+        self.encoder_profile: EncoderProfile = get_profile(encoder_profile)
+        self.backend = backend
+        self.caption_renderer = caption_renderer
+        self.scratch_dir = scratch_dir
+        self.rendition_outputs: Dict[str, str] = {}
+        self.export_stats: List[Dict] = []
 
         # Lazy import moviepy (heavy dependency)
         try:
             # Try new import structure (moviepy 2.0+)
             try:
-                from moviepy import ImageClip, AudioFileClip, CompositeVideoClip, concatenate_videoclips, VideoFileClip
+                from moviepy import ImageClip, VideoClip, AudioFileClip, CompositeVideoClip, concatenate_videoclips, VideoFileClip
             except ImportError:
                 # Fall back to old import structure (moviepy 1.x)
-                from moviepy.editor import ImageClip, AudioFileClip, CompositeVideoClip, concatenate_videoclips, VideoFileClip
+                from moviepy.editor import ImageClip, VideoClip, AudioFileClip, CompositeVideoClip, concatenate_videoclips, VideoFileClip
 
             self.ImageClip = ImageClip
+            self.VideoClip = VideoClip
             self.AudioFileClip = AudioFileClip
             self.CompositeVideoClip = CompositeVideoClip
             self.concatenate_videoclips = concatenate_videoclips
@@ -79,13 +124,18 @@ class VideoCompositor:
         Create a video clip from an image.
 
         Args:
-            image_path: Path to image file
+            image_path: Path to image file, or an in-memory RGB(A) pixel
+                buffer (height, width, channels) as returned by SceneGenerator
             duration: Clip duration in seconds
             audio_path: Optional audio file to attach
 
         Returns:
             MoviePy VideoClip
         """
+        if not isinstance(image_path, (str, Path)) and image_path.shape[-1] == 4:
+            # Scene buffers are opaque; drop alpha so MoviePy doesn't build a mask
+            image_path = image_path[:, :, :3]
+
         # MoviePy 2.x uses duration parameter in constructor
         try:
             clip = self.ImageClip(image_path, duration=duration)
@@ -109,6 +159,115 @@ class VideoCompositor:
 
         return clip
 
+    def create_clip_from_animation(
+        self,
+        animation,
+        duration: float,
+        audio_path: Optional[str] = None
+    ):
+        """
+        Create a video clip that renders its frames on demand.
+
+        Frames are pulled from the animation one at a time while the
+        video is written, so nothing is buffered between scenes.
+
+        Args:
+            animation: Frame source with frame_at(t) (e.g. AnimatedChart);
+                it holds its last frame past its own duration
+            duration: Clip duration in seconds
+            audio_path: Optional audio file to attach
+
+        Returns:
+            MoviePy VideoClip
+        """
+        audio = self.AudioFileClip(audio_path) if audio_path else None
+        if audio is not None:
+            duration = max(duration, audio.duration)
+
+        clip = self.VideoClip(animation.frame_at, duration=duration)
+        if audio is not None:
+            try:
+                clip = clip.with_audio(audio)  # MoviePy 2.x
+            except AttributeError:
+                clip = clip.set_audio(audio)  # MoviePy 1.x
+
+        return clip
+
+    def create_clip_from_motion(
+        self,
+        image_path,
+        motion,
+        duration: float,
+        audio_path: Optional[str] = None
+    ):
+        """
+        Create a Ken Burns clip (pan/zoom) from a still.
+
+        The crop windows for every frame are computed once up front
+        (see KenBurns), and ffmpeg's zoompan filter renders them while
+        the clip is written; Python only passes the frames on.
+
+        Args:
+            image_path: Path to image file, or an in-memory RGB(A) buffer
+            motion: Motion preset name or dictionary (see video.motion)
+            duration: Clip duration in seconds
+            audio_path: Optional audio file to attach
+
+        Returns:
+            MoviePy VideoClip
+        """
+        if isinstance(image_path, (str, Path)):
+            from PIL import Image
+            with Image.open(image_path) as img:
+                image = np.asarray(img.convert('RGB'))
+        else:
+            image = image_path
+
+        if audio_path:
+            audio = self.AudioFileClip(audio_path)
+            duration = max(duration, audio.duration)
+            audio.close()
+
+        animation = KenBurns(image, motion, duration, self.fps, size=self.resolution)
+        return self.create_clip_from_animation(animation, duration, audio_path)
+
+    def create_clip_from_shots(
+        self,
+        shots: List[Dict],
+        duration: float,
+        audio_path: Optional[str] = None
+    ):
+        """
+        Create a clip that cuts between still shots (see video.shots).
+
+        Args:
+            shots: [{'image': path, 'start': seconds, 'motion': optional}]
+            duration: Clip duration in seconds
+            audio_path: Optional audio file to attach
+
+        Returns:
+            MoviePy VideoClip
+        """
+        if audio_path:
+            audio = self.AudioFileClip(audio_path)
+            duration = max(duration, audio.duration)
+            audio.close()
+
+        animation = ShotSequence.from_config(
+            shots, duration, self.fps, self._load_still, size=self.resolution
+        )
+        return self.create_clip_from_animation(animation, duration, audio_path)
+
+    def _load_still(self, shot: Dict) -> np.ndarray:
+        """A shot's RGB pixels at the output resolution."""
+        from PIL import Image
+
+        with Image.open(shot['image']) as img:
+            img = img.convert('RGB')
+            if img.size != tuple(self.resolution):
+                img = img.resize(tuple(self.resolution), Image.LANCZOS)
+            return np.asarray(img)
+
     def create_scene_clip(
         self,
         scene_config: Dict,
@@ -121,35 +280,179 @@ class VideoCompositor:
             scene_config: Dictionary with scene parameters
                 {
                     'image': 'path/to/image.png',
+                    'frame': ndarray,  # optional in-memory scene, used instead of 'image'
+                    'animation': AnimatedChart,  # optional frame source, used instead of both
                     'duration': 5.0,
                     'audio': 'path/to/audio.mp3',  # optional
-                    'transition': 'fade'  # optional
+                    'transition': 'fade',  # optional, see video.transitions
+                    'motion': 'zoom_in',  # optional Ken Burns preset or dict (stills only)
+                    'shots': [{'image': ..., 'start': 0.0}, ...],  # optional cuts, see video.shots
+                    'captions': [{'start': 0.0, 'end': 2.5, 'text': '...'}]  # optional, see video.captions
                 }
             default_duration: Default duration if not specified
 
         Returns:
             MoviePy VideoClip
         """
-        image_path = scene_config.get('image')
+        image_path = scene_config.get('frame')
+        if image_path is None:
+            image_path = scene_config.get('image')
         duration = scene_config.get('duration', default_duration)
         audio_path = scene_config.get('audio')
         transition = scene_config.get('transition')
 
-        clip = self.create_clip_from_image(image_path, duration, audio_path)
-
-        # Apply transitions
-        if transition == 'fade':
+        if scene_config.get('animation') is not None:
+            clip = self.create_clip_from_animation(scene_config['animation'], duration, audio_path)
+        elif scene_config.get('shots'):
+            clip = self.create_clip_from_shots(scene_config['shots'], duration, audio_path)
+        elif scene_config.get('motion'):
+            clip = self.create_clip_from_motion(image_path, scene_config['motion'], duration, audio_path)
+        else:
+            clip = self.create_clip_from_image(image_path, duration, audio_path)
+
+        # Per-scene fade; boundary transitions are applied in _apply_transitions()
+        if transition == 'fade' or (isinstance(transition, dict) and transition.get('type') == 'fade'):
             clip = self.fadein(clip, 0.5)
             clip = self.fadeout(clip, 0.5)
 
         return clip
 
+    def _apply_transitions(self, clips: List, scenes: List[Dict]) -> List:
+        """
+        Apply boundary transitions (crossfade, dip, wipe, slide) to clips.
+
+        Each transition is centered on the cut: the outgoing clip mixes
+        with the incoming clip's first frame over its last frames, the
+        incoming clip with the outgoing clip's last frame over its first
+        frames. Clip durations don't change, and frames outside the
+        transition windows are passed through untouched.
+
+        Args:
+            clips: Scene clips, in timeline order
+            scenes: Scene configuration of each clip
+
+        Returns:
+            Clips with transitions applied
+        """
+        transitions = [parse_transition(scene.get('transition')) for scene in scenes]
+        num_frames = [max(1, int(round(clip.duration * self.fps))) for clip in clips]
+        in_frames = self._transition_windows(transitions, num_frames)
+
+        if not any(in_frames):
+            return clips
+
+        # Edge frames are taken from the untouched clips
+        first_frames = [
+            np.array(clip.get_frame(0))[:, :, :3] if in_frames[i] else None
+            for i, clip in enumerate(clips)
+        ]
+        last_frames = [
+            np.array(clip.get_frame((num_frames[i] - 1) / self.fps))[:, :, :3]
+            if i + 1 < len(clips) and in_frames[i + 1] else None
+            for i, clip in enumerate(clips)
+        ]
+
+        result = []
+        for i, clip in enumerate(clips):
+            incoming = in_frames[i]
+            outgoing = in_frames[i + 1] if i + 1 < len(clips) else 0
+            if not incoming and not outgoing:
+                result.append(clip)
+                continue
+
+            def transition_frame(get_frame, t, i=i, incoming=incoming, outgoing=outgoing):
+                frame = get_frame(t)
+                n = int(round(t * self.fps))
+                if n < incoming:
+                    transition = transitions[i]
+                    fill = [rgb_color(transition.color)]
+                    previous = [last_frames[i - 1]] if i > 0 else fill
+                    p = (incoming + n + 0.5) / (2 * incoming)
+                    return transition.render(previous, [frame[:, :, :3]], p, fill)[0]
+                if n >= num_frames[i] - outgoing:
+                    transition = transitions[i + 1]
+                    p = (n - (num_frames[i] - outgoing) + 0.5) / (2 * outgoing)
+                    return transition.render(
+                        [frame[:, :, :3]], [first_frames[i + 1]], p, [rgb_color(transition.color)]
+                    )[0]
+                return frame
+
+            try:
+                result.append(clip.transform(transition_frame))  # MoviePy 2.x
+            except AttributeError:
+                result.append(clip.fl(transition_frame))  # MoviePy 1.x
+
+        return result
+
+    def _transition_windows(self, transitions: List, num_frames: List[int]) -> List[int]:
+        """
+        Frames of each scene's incoming transition on either side of its cut.
+
+        Args:
+            transitions: Parsed transition of each scene (None for a cut)
+            num_frames: Frame count of each scene
+
+        Returns:
+            Window half-length in frames per scene (0 without one)
+        """
+        in_frames = [0] * len(transitions)
+        for i, transition in enumerate(transitions):
+            if transition is None or not transition.at_boundary:
+                continue
+            if i == 0:
+                if transition.kind == 'dip':
+                    in_frames[i] = min(transition.half_frames(self.fps), num_frames[i] // 2)
+                continue
+            in_frames[i] = min(transition.half_frames(self.fps), num_frames[i] // 2, num_frames[i - 1] // 2)
+        return in_frames
+
+    def _apply_captions(self, clips: List, scenes: List[Dict]) -> List:
+        """
+        Burn each scene's captions into its clip.
+
+        Captions are drawn after transitions, so they stay readable over
+        the mixed frames. Frames without a caption pass through untouched.
+
+        Args:
+            clips: Scene clips, in timeline order
+            scenes: Scene configuration of each clip
+
+        Returns:
+            Clips with captions drawn on
+        """
+        result = []
+        for clip, scene in zip(clips, scenes):
+            cues = parse_cues(scene.get('captions'))
+            if not cues:
+                result.append(clip)
+                continue
+            num_frames = max(1, int(round(clip.duration * self.fps)))
+            track, texts = caption_track(cues, self.fps, num_frames)
+
+            def caption_frame(get_frame, t, track=track, texts=texts):
+                frame = get_frame(t)
+                n = min(int(round(t * self.fps)), len(track) - 1)
+                if track[n] < 0:
+                    return frame
+                # Still clips hand out the same buffer every frame; draw on a copy
+                frame = np.array(frame[:, :, :3], dtype=np.uint8)
+                self.caption_renderer.draw(frame, texts[track[n]])
+                return frame
+
+            try:
+                result.append(clip.transform(caption_frame))  # MoviePy 2.x
+            except AttributeError:
+                result.append(clip.fl(caption_frame))  # MoviePy 1.x
+
+        return result
+
     def compose_video(
         self,
         scenes: List[Dict],
         output_filename: str = "final_video.mp4",
         background_music: Optional[str] = None,
-        bg_music_volume: float = 0.1
+        bg_music_volume: float = 0.1,
+        renditions: Optional[List[Rendition]] = None
     ) -> str:
         """
         Compose final video from multiple scenes.
@@ -159,14 +462,25 @@ class VideoCompositor:
             output_filename: Output video filename
             background_music: Optional background music file
             bg_music_volume: Background music volume (0.0 to 1.0)
+            renditions: Optional output renditions. All of them are
+                encoded in one pass from the same master timeline; each
+                file is named '<stem>_<rendition>.mp4'. Paths of every
+                output are kept in self.rendition_outputs.
 
         Returns:
-            Path to output video file
+            Path to output video file (the first rendition, if any)
         """
         print(f"\n🎬 Composing video from {len(scenes)} scenes")
         print(f"{'='*60}")
 
+        if self.backend == 'pyav':
+            if renditions or background_music:
+                print("  ⚠️  PyAV backend doesn't support renditions/background music yet, using MoviePy")
+            else:
+                return self._compose_with_pyav(scenes, output_filename)
+
         clips = []
+        clip_scenes = []
 
         for i, scene in enumerate(scenes, 1):
             print(f"  [{i}/{len(scenes)}] Processing scene: {scene.get('title', 'Untitled')}")
@@ -174,6 +488,7 @@ class VideoCompositor:
             try:
                 clip = self.create_scene_clip(scene)
                 clips.append(clip)
+                clip_scenes.append(scene)
             except Exception as e:
                 print(f"    ⚠️  Warning: Failed to create clip for scene {i}: {e}")
                 continue
@@ -181,6 +496,17 @@ class VideoCompositor:
         if not clips:
             raise Exception("No clips were successfully created")
 
+        clips = self._apply_transitions(clips, clip_scenes)
+        if self.caption_renderer is not None:
+            clips = self._apply_captions(clips, clip_scenes)
+
+        # Scene boundaries get forced keyframes
+        keyframe_times = []
+        elapsed = 0.0
+        for clip in clips:
+            keyframe_times.append(elapsed)
+            elapsed += clip.duration
+
         # Concatenate all clips
         print(f"\n  Concatenating {len(clips)} clips...")
         final_clip = self.concatenate_videoclips(clips, method="compose")
@@ -209,35 +535,55 @@ class VideoCompositor:
             except Exception as e:
                 print(f"    ⚠️  Warning: Failed to add background music: {e}")
 
-        # Export video
+        # Export video: encode in the work directory, then publish
         output_path = self.output_dir / output_filename
-        print(f"\n  Exporting video to: {output_path}")
-        print(f"  Resolution: {self.resolution[0]}x{self.resolution[1]} @ {self.fps}fps")
-        print(f"  Duration: {final_clip.duration:.1f} seconds")
-
-        # Get number of CPU cores
-        import os
-        num_cores = os.cpu_count() or 4
-
-        # FFmpeg parameters for multi-threading
-        ffmpeg_params = [
-            '-threads', str(num_cores),
-            '-preset', 'ultrafast',
-            '-crf', '28',  # Lower quality = faster encoding
-            '-tune', 'fastdecode'
-        ]
-
-        final_clip.write_videofile(
-            str(output_path),
-            fps=self.fps,
-            codec='libx264',
-            audio_codec='aac',
-            temp_audiofile='temp-audio.m4a',
-            remove_temp=True,
-            ffmpeg_params=ffmpeg_params,
-            threads=num_cores,
-            logger=None  # Disable verbose output
-        )
+        self.rendition_outputs = {}
+        self.export_stats = []
+        profile = self.encoder_profile
+        duration = final_clip.duration
+        start = time.perf_counter()
+
+        with self._work_dir() as work_dir:
+            work_path = work_dir / output_filename
+            if renditions:
+                outputs = self._write_renditions(final_clip, work_path, renditions, keyframe_times)
+                outputs = {name: publish_file(path, self.output_dir / Path(path).name)
+                           for name, path in outputs.items()}
+                self.rendition_outputs = outputs
+                encode_time = time.perf_counter() - start
+                for name, path in outputs.items():
+                    self._record_export(path, name, duration, encode_time)
+                output_path = Path(next(iter(outputs.values())))
+            else:
+                print(f"\n  Exporting video to: {output_path}")
+                print(f"  Resolution: {self.resolution[0]}x{self.resolution[1]} @ {self.fps}fps")
+                print(f"  Encoder profile: {profile.name} (preset {profile.preset}, crf {profile.crf})")
+                print(f"  Duration: {duration:.1f} seconds")
+
+                num_cores = os.cpu_count() or 4
+                ffmpeg_params = self._encoder_params(keyframe_times)
+                filters = profile.video_filters()
+                if filters:
+                    ffmpeg_params = ['-vf', ','.join(filters)] + ffmpeg_params
+
+                final_clip.write_videofile(
+                    str(work_path),
+                    fps=self.fps,
+                    codec='libx264',
+                    audio_codec='aac',
+                    audio_bitrate=profile.audio_bitrate,
+                    temp_audiofile=str(work_dir / f"{work_path.stem}_temp-audio.m4a"),
+                    remove_temp=True,
+                    ffmpeg_params=ffmpeg_params,
+                    threads=num_cores,
+                    logger=None  # Disable verbose output
+                )
+                publish_file(work_path, output_path)
+                self._record_export(str(output_path), 'main', duration, time.perf_counter() - start)
+
+        for stats in self.export_stats:
+            print(f"  📊 {stats['rendition']}: {stats['speed']:.1f}x realtime, "
+                  f"{stats['bitrate_kbps']:.0f} kb/s, {stats['size_bytes'] / 1e6:.1f} MB")
 
         # Clean up
         final_clip.close()
@@ -247,6 +593,206 @@ class VideoCompositor:
         print(f"\n✅ Video exported successfully: {output_path}")
         return str(output_path)
 
+    def _compose_with_pyav(self, scenes: List[Dict], output_filename: str) -> str:
+        """Encode scenes in-process with PyAV (audio and video in one pass)."""
+        from .pyav_backend import PyAVEncoder
+
+        output_path = self.output_dir / output_filename
+        profile = self.encoder_profile
+        self.rendition_outputs = {}
+        self.export_stats = []
+
+        print(f"  Backend: PyAV")
+        print(f"  Resolution: {self.resolution[0]}x{self.resolution[1]} @ {self.fps}fps")
+        print(f"  Encoder profile: {profile.name} (preset {profile.preset}, crf {profile.crf})")
+
+        encoder = PyAVEncoder(
+            self.resolution, self.fps, profile,
+            threads=os.cpu_count(), caption_renderer=self.caption_renderer
+        )
+        start = time.perf_counter()
+        with self._work_dir() as work_dir:
+            duration = encoder.encode(scenes, str(work_dir / output_filename))
+            publish_file(work_dir / output_filename, output_path)
+        self._record_export(str(output_path), 'main', duration, time.perf_counter() - start)
+
+        for stats in self.export_stats:
+            print(f"  📊 {stats['rendition']}: {stats['speed']:.1f}x realtime, "
+                  f"{stats['bitrate_kbps']:.0f} kb/s, {stats['size_bytes'] / 1e6:.1f} MB")
+
+        print(f"\n✅ Video exported successfully: {output_path}")
+        return str(output_path)
+
+    def benchmark_backends(
+        self,
+        scenes: List[Dict],
+        backends: Tuple[str, ...] = BACKENDS,
+        output_prefix: str = "benchmark"
+    ) -> List[Dict]:
+        """
+        Encode the same scenes with each backend and collect export stats.
+
+        Args:
+            scenes: Scene configurations
+            backends: Backends to compare
+            output_prefix: Output files are '<prefix>_<backend>.mp4'
+
+        Returns:
+            One export stats dictionary per backend
+        """
+        original_backend = self.backend
+        results = []
+        try:
+            for backend in backends:
+                self.backend = backend
+                self.compose_video(scenes, output_filename=f"{output_prefix}_{backend}.mp4")
+                results.extend(self.export_stats)
+        finally:
+            self.backend = original_backend
+        return results
+
+    @contextmanager
+    def _work_dir(self) -> Iterator[Path]:
+        """
+        Directory outputs are encoded in before publish_file() moves them.
+
+        The scratch directory when there is one (its owner cleans it up);
+        otherwise a private hidden directory in output_dir, removed
+        afterwards, so a reader never sees a half-written video and
+        concurrent jobs never share temporary files.
+        """
+        if self.scratch_dir:
+            work_dir = Path(self.scratch_dir)
+            work_dir.mkdir(parents=True, exist_ok=True)
+            yield work_dir
+            return
+        work_dir = Path(tempfile.mkdtemp(prefix=".encode-", dir=self.output_dir))
+        try:
+            yield work_dir
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    def _encoder_params(self, keyframe_times: Optional[List[float]] = None) -> List[str]:
+        """x264 parameters shared by every export path."""
+        num_cores = os.cpu_count() or 4
+        return self.encoder_profile.ffmpeg_params(
+            self.fps, keyframe_times=keyframe_times, threads=num_cores
+        )
+
+    def _record_export(self, path: str, rendition: str, duration: float, encode_time: float):
+        """Record encode speed and bitrate of a finished export."""
+        size = os.path.getsize(path)
+        # Clip durations can be numpy scalars, which the manifest can't serialize
+        duration = float(duration)
+        self.export_stats.append({
+            'path': path,
+            'rendition': rendition,
+            'backend': self.backend,
+            'profile': self.encoder_profile.name,
+            'duration': round(duration, 3),
+            'encode_seconds': round(encode_time, 3),
+            'speed': round(duration / encode_time, 2) if encode_time > 0 else None,
+            'size_bytes': size,
+            'bitrate_kbps': round(size * 8 / duration / 1000, 1) if duration > 0 else None,
+        })
+
+    def _write_renditions(
+        self,
+        final_clip,
+        output_path: Path,
+        renditions: List[Rendition],
+        keyframe_times: Optional[List[float]] = None
+    ) -> Dict[str, str]:
+        """
+        Encode several renditions from one pass over the master timeline.
+
+        The master frames are rendered once and piped into a single ffmpeg
+        process whose filter graph splits and scales them per rendition.
+        The mixed audio is encoded to AAC once and stream-copied into
+        every output.
+
+        Args:
+            final_clip: Composed master clip
+            output_path: Base output path ('<stem>_<rendition>.mp4' is derived)
+            renditions: Target renditions
+            keyframe_times: Scene boundaries to force keyframes at
+
+        Returns:
+            Dictionary of rendition name -> output path
+        """
+        width, height = final_clip.size
+        outputs = {
+            r.name: str(output_path.with_name(f"{output_path.stem}_{r.name}{output_path.suffix}"))
+            for r in renditions
+        }
+
+        print(f"\n  Exporting {len(renditions)} renditions in one pass")
+        print(f"  Master: {width}x{height} @ {self.fps}fps")
+        print(f"  Encoder profile: {self.encoder_profile.name}")
+        print(f"  Duration: {final_clip.duration:.1f} seconds")
+        for rendition in renditions:
+            print(f"    - {rendition.name}: {rendition.width}x{rendition.height} → {outputs[rendition.name]}")
+
+        audio_path = None
+        if final_clip.audio is not None:
+            audio_path = output_path.with_name(f"{output_path.stem}_audio.m4a")
+            final_clip.audio.write_audiofile(
+                str(audio_path), fps=44100, codec='aac',
+                bitrate=self.encoder_profile.audio_bitrate, logger=None
+            )
+
+        filter_graph, labels = build_filter_graph(
+            renditions, post_filters=self.encoder_profile.video_filters()
+        )
+
+        cmd = [
+            get_ffmpeg_binary(), '-hide_banner', '-loglevel', 'error', '-y',
+            '-f', 'rawvideo', '-pix_fmt', 'rgb24',
+            '-s', f'{width}x{height}', '-r', str(self.fps),
+            '-i', '-'
+        ]
+        if audio_path:
+            cmd += ['-i', str(audio_path)]
+        cmd += ['-filter_complex', filter_graph]
+
+        for rendition, label in zip(renditions, labels):
+            cmd += ['-map', f'[{label}]']
+            if audio_path:
+                cmd += ['-map', '1:a', '-c:a', 'copy']
+            cmd += ['-c:v', 'libx264', '-pix_fmt', 'yuv420p']
+            cmd += self._encoder_params(keyframe_times)
+            cmd += ['-movflags', '+faststart', outputs[rendition.name]]
+
+        # stderr goes to a file: a pipe nobody reads until the end would fill
+        # up with warnings and stall ffmpeg while we block writing frames
+        stderr = tempfile.TemporaryFile()
+        process = subprocess.Popen(cmd, stdin=subprocess.PIPE, stderr=stderr)
+
+        def failure() -> Exception:
+            stderr.seek(0)
+            # The last lines hold the actual error
+            tail = "\n".join(stderr.read().decode(errors='replace').strip().splitlines()[-20:])
+            return Exception(f"FFmpeg rendition export failed: {tail}")
+
+        try:
+            for frame in final_clip.iter_frames(fps=self.fps, dtype='uint8'):
+                process.stdin.write(frame[:, :, :3].tobytes())
+            process.stdin.close()
+            if process.wait() != 0:
+                raise failure()
+        except BrokenPipeError:
+            process.wait()
+            raise failure()
+        finally:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            stderr.close()
+            if audio_path and audio_path.exists():
+                audio_path.unlink()
+
+        return outputs
+
     def create_simple_video(
         self,
         image_paths: List[str],
@@ -293,7 +839,8 @@ class VideoCompositor:
     def export_project_file(
         self,
         scenes: List[Dict],
-        output_path: str = "output/project.json"
+        output_path: str = "output/project.json",
+        output_filename: Optional[str] = None
     ):
         """
         Export project configuration to JSON for later editing.
@@ -301,19 +848,26 @@ class VideoCompositor:
         Args:
             scenes: List of scene configurations
             output_path: Path to save project file
+            output_filename: Video the project renders to (see render_project)
         """
         project = {
             'version': '1.0',
             'resolution': self.resolution,
             'fps': self.fps,
-            'scenes': scenes
+            'output': output_filename,
+            'scenes': [
+                {k: v for k, v in scene.items() if k not in self.RUNTIME_KEYS}
+                for scene in scenes
+            ]
         }
 
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, 'w', encoding='utf-8') as f:
+        partial = partial_path(output_path)
+        with open(partial, 'w', encoding='utf-8') as f:
             json.dump(project, f, indent=2)
+        os.replace(partial, output_path)
 
         print(f"✅ Project file saved: {output_path}")
 
@@ -335,6 +889,29 @@ class VideoCompositor:
 
         return project.get('scenes', [])
 
+    def render_project(self, project_path: str, output_filename: Optional[str] = None) -> str:
+        """
+        Render a (hand-edited) project file, re-encoding only changed scenes.
+
+        See video.incremental: every scene is a cached video segment, and
+        the video is re-joined from them without re-encoding.
+
+        Args:
+            project_path: Path to project file
+            output_filename: Output video filename (default: the one the
+                project was exported for, else '<project stem>.mp4')
+
+        Returns:
+            Path to output video file
+        """
+        from .incremental import IncrementalRenderer
+
+        with open(project_path, 'r', encoding='utf-8') as f:
+            recorded = json.load(f).get('output')
+        scenes = self.load_project_file(project_path)
+        output_filename = output_filename or recorded or f"{Path(project_path).stem}.mp4"
+        return IncrementalRenderer(self).render(scenes, output_filename)
+
 
 if __name__ == "__main__":
     # Test video composition
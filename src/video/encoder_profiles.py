@@ -0,0 +1,90 @@
+"""
+Encoder profiles - named x264 settings for still-image explainer content.
+
+Our videos are mostly static slides held for the length of a voiceover
+line, so the profiles lean on that:
+- tune=stillimage spends bits on detail instead of motion
+- long GOPs, with keyframes forced at scene boundaries for seeking
+- duplicate frames are dropped before the encoder (variable frame rate),
+  so a 40 second hold costs a handful of frames instead of 1200
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+
+@dataclass
+class EncoderProfile:
+    """x264/AAC settings for one kind of export."""
+    name: str
+    preset: str
+    crf: int
+    tune: Optional[str] = 'stillimage'
+    gop_seconds: float = 10.0     # Max distance between keyframes
+    decimate: bool = True         # Drop duplicate frames (VFR output)
+    audio_bitrate: str = '128k'
+
+    def video_filters(self) -> List[str]:
+        """Filters to run on the video stream before encoding."""
+        # mpdecimate drops frames that are (near) identical to the previous one
+        return ['mpdecimate'] if self.decimate else []
+
+    def ffmpeg_params(
+        self,
+        fps: int,
+        keyframe_times: Optional[Sequence[float]] = None,
+        threads: Optional[int] = None
+    ) -> List[str]:
+        """
+        x264 output parameters (filters excluded, see video_filters()).
+
+        Args:
+            fps: Output frame rate
+            keyframe_times: Scene boundaries (seconds) to force keyframes at
+            threads: Encoder thread count
+
+        Returns:
+            List of ffmpeg arguments
+        """
+        keyint = max(1, int(round(self.gop_seconds * fps)))
+        params = ['-preset', self.preset, '-crf', str(self.crf)]
+        if self.tune:
+            params += ['-tune', self.tune]
+        params += ['-g', str(keyint), '-keyint_min', str(min(keyint, fps))]
+
+        if keyframe_times:
+            times = ','.join(f'{t:.3f}' for t in sorted(set(keyframe_times)))
+            params += ['-force_key_frames', times]
+
+        if self.decimate:
+            params += ['-fps_mode', 'vfr']
+
+        if threads:
+            params += ['-threads', str(threads)]
+
+        return params
+
+
+PROFILES = {
+    # Fast turnaround for previews and script iteration
+    'draft': EncoderProfile('draft', preset='ultrafast', crf=30, gop_seconds=20.0,
+                            audio_bitrate='96k'),
+    # YouTube upload: visually transparent for slides, encodes faster than real time
+    'upload': EncoderProfile('upload', preset='veryfast', crf=20, gop_seconds=10.0,
+                             audio_bitrate='192k'),
+    # Same quality as upload in smaller files, for when export time doesn't matter
+    'compact': EncoderProfile('compact', preset='medium', crf=20, gop_seconds=10.0,
+                              audio_bitrate='192k'),
+    # Master copy for re-edits: high quality, constant frame rate
+    'archive': EncoderProfile('archive', preset='slow', crf=14, gop_seconds=5.0,
+                              decimate=False, audio_bitrate='320k'),
+}
+
+
+def get_profile(profile) -> EncoderProfile:
+    """Resolve a profile name (or pass through an EncoderProfile)."""
+    if isinstance(profile, EncoderProfile):
+        return profile
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown encoder profile: {profile} (use {', '.join(PROFILES)})")
+    return PROFILES[profile]
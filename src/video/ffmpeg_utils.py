@@ -0,0 +1,69 @@
+"""
+FFmpeg helpers shared by the encoding paths.
+
+Locates the ffmpeg binary MoviePy is configured with so that every
+encode in the pipeline runs the same build.
+"""
+
+import re
+import shutil
+import subprocess
+from typing import List
+
+
+def get_ffmpeg_binary() -> str:
+    """Return the ffmpeg executable MoviePy uses (falls back to PATH)."""
+    try:
+        from moviepy.config import FFMPEG_BINARY
+        if FFMPEG_BINARY and FFMPEG_BINARY != 'auto-detect':
+            return FFMPEG_BINARY
+    except ImportError:
+        pass
+
+    try:
+        import imageio_ffmpeg
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except ImportError:
+        pass
+
+    binary = shutil.which('ffmpeg')
+    if not binary:
+        raise Exception("FFmpeg not found. Install it (brew install ffmpeg / apt-get install ffmpeg)")
+    return binary
+
+
+def run_ffmpeg(args: List[str]) -> subprocess.CompletedProcess:
+    """
+    Run ffmpeg with the given arguments.
+
+    Args:
+        args: Arguments after the binary name
+
+    Returns:
+        Completed process
+    """
+    cmd = [get_ffmpeg_binary(), '-hide_banner', '-loglevel', 'error', '-y'] + args
+    try:
+        return subprocess.run(cmd, check=True, capture_output=True)
+    except subprocess.CalledProcessError as e:
+        raise Exception(f"FFmpeg failed: {e.stderr.decode(errors='replace').strip()}")
+
+
+def probe_duration(path: str) -> float:
+    """
+    Read a media file's duration from its header (no decoding).
+
+    Args:
+        path: Audio or video file
+
+    Returns:
+        Duration in seconds
+    """
+    # Without an output ffmpeg prints the input info and exits non-zero
+    result = subprocess.run([get_ffmpeg_binary(), '-hide_banner', '-i', str(path)], capture_output=True)
+    info = result.stderr.decode(errors='replace')
+    match = re.search(r'Duration:\s*(\d+):(\d+):(\d+(?:\.\d+)?)', info)
+    if not match:
+        raise Exception(f"Could not read duration of {path}: {info.strip().splitlines()[-1] if info.strip() else 'no output'}")
+    hours, minutes, seconds = match.groups()
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
@@ -0,0 +1,331 @@
+"""
+Incremental - Render a project file, re-encoding only the scenes that changed.
+
+Each scene of a project (see VideoCompositor.export_project_file) is
+encoded as video-only segments, cached under a fingerprint of everything
+their frames depend on:
+
+- the scene's image, shot images and audio, by content hash (the audio
+  sets the scene length)
+- its duration, transition, motion, shots and captions
+- the encoder settings (resolution, fps, profile, burned captions)
+
+A boundary transition mixes the last frame of the previous scene into
+the start of a scene, and the first frame of the next scene into its
+end. Those windows are segments of their own, and only they depend on
+the neighbour, through that one frame's inputs: the image or shot on
+screen, its motion and the neighbour's transition. Re-voicing a scene
+therefore re-encodes the windows next to it, not its neighbours.
+
+Segments whose fingerprint is already cached are reused as they are.
+Segments are encoded at a constant frame rate even when the profile
+drops duplicate frames: the concat demuxer ends each segment at its last
+frame, so a decimated hold at the end of a scene would be cut off.
+The video is joined with ffmpeg's concat demuxer (stream copy, no
+re-encode) and muxed with the audio track, which is encoded from the
+scenes' voiceovers in one pass: cutting AAC per segment would leave
+priming gaps at every join, and audio encodes far faster than video.
+
+Animated charts and the narrator overlay are in-memory only and are not
+part of project files; those scenes render as their still images.
+"""
+
+import dataclasses
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .compositor import VideoCompositor
+from .ffmpeg_utils import run_ffmpeg
+from .transitions import parse_transition
+from utils.journal import file_hash, input_hash
+from utils.scratch import partial_path, publish_file
+
+
+class IncrementalRenderer:
+    """Render project files through a VideoCompositor, one cached segment per scene."""
+
+    def __init__(self, compositor):
+        """
+        Initialize incremental renderer.
+
+        Args:
+            compositor: Configured VideoCompositor; segments are cached in
+                '<output_dir>/segments/<video stem>/'
+        """
+        self.compositor = compositor
+        self._file_hashes: Dict[str, str] = {}
+
+        # Segments of the last render, and the ones it had to encode
+        self.segments: List[Dict] = []
+        self.encoded: List[Dict] = []
+
+    def _hash_file(self, path: Optional[str]) -> Optional[str]:
+        if not path:
+            return None
+        if path not in self._file_hashes:
+            self._file_hashes[path] = file_hash(path)
+        return self._file_hashes[path]
+
+    def settings(self) -> Dict:
+        """Encoder settings every cached segment must share to be joined by stream copy."""
+        compositor = self.compositor
+        return {
+            'resolution': list(compositor.resolution),
+            'fps': compositor.fps,
+            'profile': compositor.encoder_profile.name,
+            'captions': compositor.caption_renderer is not None,
+            'constant_frame_rate': True,
+        }
+
+    def scene_fingerprint(self, scene: Dict) -> str:
+        """Hash of one scene's own inputs (files by content)."""
+        images = [scene.get('image')] + [shot['image'] for shot in scene.get('shots') or []]
+        # Runtime objects (in-memory frames, animations) are drawn from the files
+        ignored = ('title', 'id', 'image', 'audio') + VideoCompositor.RUNTIME_KEYS
+        config = {k: v for k, v in scene.items() if k not in ignored}
+        return input_hash(
+            [self._hash_file(path) for path in images],
+            self._hash_file(scene.get('audio')),
+            config
+        )
+
+    def edge_fingerprint(self, scene: Dict, last: bool, num_frames: int) -> str:
+        """
+        Hash of the inputs of a scene's first or last frame.
+
+        This is all a neighbour's transition window takes from the scene.
+        The first frame doesn't depend on the scene's length; the last
+        one does only while it moves (motion or a fade-out).
+
+        Args:
+            scene: Project scene configuration
+            last: Last frame (True) or first frame (False)
+            num_frames: Frame count of the scene
+
+        Returns:
+            Fingerprint of that frame
+        """
+        shots = sorted(scene.get('shots') or [], key=lambda shot: float(shot.get('start', 0.0)))
+        if shots:
+            shot = shots[-1] if last else shots[0]
+            image, motion = shot['image'], shot.get('motion')
+        else:
+            image, motion = scene.get('image'), scene.get('motion')
+        transition = scene.get('transition')
+        parsed = parse_transition(transition)
+        fading = parsed is not None and not parsed.at_boundary
+        length = num_frames if last and (motion or fading) else None
+        return input_hash(self._hash_file(image), motion, transition, last, length)
+
+    def plan(self, scenes: List[Dict], clips: List) -> List[Dict]:
+        """
+        Segments of a timeline and the fingerprint of each.
+
+        A scene is cut into its incoming transition window ('in'), the
+        frames between ('body') and its outgoing window ('out'); empty
+        parts are left out, so a scene between hard cuts is one segment.
+
+        Args:
+            scenes: Project scene configurations
+            clips: Scene clips (their lengths set the windows)
+
+        Returns:
+            [{'key', 'part', 'fingerprint', 'scene', 'start', 'frames'}] in
+            timeline order; 'start' and 'frames' count frames of the scene
+        """
+        fps = self.compositor.fps
+        own = [self.scene_fingerprint(scene) for scene in scenes]
+        transitions = [parse_transition(scene.get('transition')) for scene in scenes]
+        num_frames = [max(1, int(round(clip.duration * fps))) for clip in clips]
+        windows = self.compositor._transition_windows(transitions, num_frames) + [0]
+        settings = self.settings()
+
+        result = []
+        for i, clip in enumerate(clips):
+            key = str(scenes[i].get('id') or i)
+            # Frames the clip is written with (see VideoClip.iter_frames)
+            written = int(clip.duration * fps)
+            body_start = min(windows[i], written)
+            body_end = min(max(num_frames[i] - windows[i + 1], body_start), written)
+
+            previous = self.edge_fingerprint(scenes[i - 1], True, num_frames[i - 1]) if i > 0 else None
+            following = None
+            if i + 1 < len(scenes):
+                following = (self.edge_fingerprint(scenes[i + 1], False, num_frames[i + 1]),
+                             scenes[i + 1].get('transition'))
+            parts = [('in', 0, body_start, previous),
+                     ('body', body_start, body_end, None),
+                     ('out', body_end, written, following)]
+            for part, start, end, neighbour in parts:
+                if end <= start:
+                    continue
+                result.append({
+                    'key': key,
+                    'part': part,
+                    'fingerprint': input_hash(settings, own[i], part, start, end - start, neighbour),
+                    'scene': i,
+                    'start': start,
+                    'frames': end - start
+                })
+        return result
+
+    def render(self, scenes: List[Dict], output_filename: str) -> str:
+        """
+        Render scenes to a video, re-encoding only changed segments.
+
+        Args:
+            scenes: Project scene configurations (e.g. from load_project_file)
+            output_filename: Output video filename in the compositor's
+                output directory
+
+        Returns:
+            Path to the output video
+        """
+        compositor = self.compositor
+        output_path = compositor.output_dir / output_filename
+        segment_dir = compositor.output_dir / "segments" / output_path.stem
+        segment_dir.mkdir(parents=True, exist_ok=True)
+        state_path = compositor.output_dir / f"{output_path.stem}.segments.json"
+        start = time.perf_counter()
+
+        print(f"\n🎬 Rendering project: {len(scenes)} scenes → {output_path}")
+        print(f"{'='*60}")
+
+        with compositor._work_dir() as work_dir:
+            clips = [compositor.create_scene_clip(scene) for scene in scenes]
+            duration = sum(clip.duration for clip in clips)
+
+            plan = self.plan(scenes, clips)
+            segment_paths = [segment_dir / f"{segment['fingerprint']}.mp4" for segment in plan]
+            stale = [n for n, path in enumerate(segment_paths) if not path.exists()]
+            self.segments = [{'key': segment['key'], 'part': segment['part'],
+                              'fingerprint': segment['fingerprint'], 'path': str(path)}
+                             for segment, path in zip(plan, segment_paths)]
+            self.encoded = []
+
+            # Report the diff against the previous render of this video
+            previous: Dict[str, set] = {}
+            if state_path.exists():
+                with open(state_path, 'r', encoding='utf-8') as f:
+                    for segment in json.load(f).get('segments', []):
+                        previous.setdefault(segment['key'], set()).add(segment['fingerprint'])
+            keys = [str(scene.get('id') or i) for i, scene in enumerate(scenes)]
+            for i, key in enumerate(keys):
+                parts = [n for n, segment in enumerate(plan) if segment['scene'] == i]
+                if key not in previous:
+                    status = "new"
+                elif previous[key] != {plan[n]['fingerprint'] for n in parts}:
+                    status = "changed"
+                else:
+                    status = "unchanged"
+                stale_parts = [plan[n]['part'] for n in parts if n in stale]
+                if not stale_parts:
+                    cached = "reuse"
+                elif len(stale_parts) == len(parts):
+                    cached = "re-encode"
+                else:
+                    cached = f"re-encode {'/'.join(stale_parts)}"
+                print(f"  [{i + 1}/{len(scenes)}] {scenes[i].get('title', 'Untitled')}: {status}, {cached}")
+            removed = set(previous) - set(keys)
+            if removed:
+                print(f"  Removed: {', '.join(sorted(removed))}")
+
+            if stale:
+                print(f"\n  Encoding {len(stale)} of {len(plan)} segments...")
+                self._encode_segments(clips, scenes, plan, stale, segment_paths, work_dir)
+
+            # Audio track of the whole timeline, then a stream-copy join
+            audio_path = self._write_audio(clips, work_dir / f"{output_path.stem}_audio.m4a")
+            concat_list = work_dir / f"{output_path.stem}_segments.txt"
+            concat_list.write_text(
+                "".join(f"file '{path.resolve()}'\n" for path in segment_paths), encoding='utf-8'
+            )
+            work_path = work_dir / output_filename
+            args = ['-f', 'concat', '-safe', '0', '-i', str(concat_list)]
+            if audio_path:
+                args += ['-i', str(audio_path), '-map', '0:v', '-map', '1:a']
+            args += ['-c', 'copy', '-movflags', '+faststart', str(work_path)]
+            run_ffmpeg(args)
+            publish_file(work_path, output_path)
+
+            for clip in clips:
+                clip.close()
+
+        # Segments of earlier versions of this video are no longer needed
+        current = {path.name for path in segment_paths}
+        for path in segment_dir.glob("*.mp4"):
+            if path.name not in current:
+                path.unlink()
+
+        state = {'settings': self.settings(), 'segments': self.segments}
+        partial = partial_path(state_path)
+        with open(partial, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2)
+        os.replace(partial, state_path)
+
+        compositor.rendition_outputs = {}
+        compositor.export_stats = []
+        compositor._record_export(str(output_path), 'main', duration, time.perf_counter() - start)
+        print(f"\n✅ Rendered {output_path}: {len(stale)} re-encoded, "
+              f"{len(plan) - len(stale)} reused, {time.perf_counter() - start:.1f}s")
+        return str(output_path)
+
+    def _encode_segments(self, clips: List, scenes: List[Dict], plan: List[Dict],
+                         indices: List[int], segment_paths: List[Path], work_dir: Path):
+        """Encode the given segments of the plan as video-only files into the cache."""
+        compositor = self.compositor
+        fps = compositor.fps
+        # Transitions and captions need the whole timeline (edge frames of neighbours)
+        clips = compositor._apply_transitions(clips, scenes)
+        if compositor.caption_renderer is not None:
+            clips = compositor._apply_captions(clips, scenes)
+
+        # Constant frame rate: every frame up to the scene's end is kept (see module docs)
+        profile = dataclasses.replace(compositor.encoder_profile, decimate=False)
+        ffmpeg_params = profile.ffmpeg_params(fps, keyframe_times=[0.0],
+                                              threads=os.cpu_count() or 4)
+        filters = profile.video_filters()
+        if filters:
+            ffmpeg_params = ['-vf', ','.join(filters)] + ffmpeg_params
+
+        for n, index in enumerate(indices, 1):
+            segment = plan[index]
+            clip = clips[segment['scene']]
+            print(f"    [{n}/{len(indices)}] {scenes[segment['scene']].get('title', 'Untitled')}"
+                  f" ({segment['part']}, {segment['frames']} frames)")
+
+            # Frames are looked up by index; half a frame of slack keeps
+            # the written count exact (it is the duration rounded down)
+            def part_frame(t, clip=clip, first=segment['start']):
+                return clip.get_frame((first + int(round(t * fps))) / fps)
+
+            part = compositor.VideoClip(part_frame, duration=(segment['frames'] + 0.5) / fps)
+            work_path = work_dir / segment_paths[index].name
+            encode_start = time.perf_counter()
+            part.write_videofile(
+                str(work_path),
+                fps=fps,
+                codec='libx264',
+                audio=False,
+                ffmpeg_params=ffmpeg_params,
+                threads=os.cpu_count() or 4,
+                logger=None
+            )
+            publish_file(work_path, segment_paths[index])
+            self.encoded.append(dict(self.segments[index], duration=segment['frames'] / fps,
+                                     seconds=time.perf_counter() - encode_start))
+
+    def _write_audio(self, clips: List, audio_path: Path) -> Optional[Path]:
+        """Encode the timeline's audio to AAC in one pass (None if silent)."""
+        compositor = self.compositor
+        if not any(clip.audio is not None for clip in clips):
+            return None
+        timeline = compositor.concatenate_videoclips(clips, method="compose")
+        timeline.audio.write_audiofile(
+            str(audio_path), fps=44100, codec='aac',
+            bitrate=compositor.encoder_profile.audio_bitrate, logger=None
+        )
+        return audio_path
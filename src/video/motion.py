@@ -0,0 +1,284 @@
+"""
+Motion - Ken Burns pan/zoom for still scenes.
+
+A scene's 'motion' setting is a preset name or a dictionary:
+
+    {'zoom': [1.0, 1.1], 'pan': 'left', 'easing': 'ease_in_out'}
+
+- zoom: start/end magnification (1.0 = full frame)
+- pan: 'left', 'right', 'up', 'down' or [dx, dy] in -1..1; the view
+  drifts across the margin the zoom leaves around it
+- easing: 'linear', 'ease_in', 'ease_out' or 'ease_in_out'
+
+The whole crop-window sequence is computed up front with NumPy. Per
+frame, the PyAV backend hands an integer crop (a view of the still) to
+libswscale, which scales it while converting to YUV. Other consumers
+(the MoviePy path) read frames in order from one ffmpeg process that
+runs the same windows through its zoompan filter, so no frame is
+resampled in Python; frames asked for out of order (transition edges)
+fall back to a sub-pixel PIL resample of the window.
+"""
+
+import subprocess
+import tempfile
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
+
+from .ffmpeg_utils import get_ffmpeg_binary
+
+
+EASINGS = {
+    'linear': lambda p: p,
+    'ease_in': lambda p: p * p,
+    'ease_out': lambda p: p * (2 - p),
+    'ease_in_out': lambda p: p * p * (3 - 2 * p),
+}
+
+# The same curves as ffmpeg expressions of the progress P
+EASING_EXPRESSIONS = {
+    'linear': 'P',
+    'ease_in': 'P*P',
+    'ease_out': 'P*(2-P)',
+    'ease_in_out': 'P*P*(3-2*P)',
+}
+
+# Frames the ffmpeg stream skips ahead before a request goes to PIL instead
+MAX_STREAM_SKIP = 30
+
+PAN_DIRECTIONS = {
+    'none': (0.0, 0.0),
+    'left': (-1.0, 0.0),
+    'right': (1.0, 0.0),
+    'up': (0.0, -1.0),
+    'down': (0.0, 1.0),
+}
+
+MOTION_PRESETS: Dict[str, Dict] = {
+    'zoom_in': {'zoom': [1.0, 1.1], 'easing': 'ease_in_out'},
+    'zoom_out': {'zoom': [1.1, 1.0], 'easing': 'ease_in_out'},
+    'pan_left': {'zoom': [1.08, 1.08], 'pan': 'left', 'easing': 'linear'},
+    'pan_right': {'zoom': [1.08, 1.08], 'pan': 'right', 'easing': 'linear'},
+    'push_left': {'zoom': [1.0, 1.12], 'pan': 'left', 'easing': 'ease_out'},
+    'push_right': {'zoom': [1.0, 1.12], 'pan': 'right', 'easing': 'ease_out'},
+}
+
+
+def parse_motion(motion: Union[str, Dict]) -> Dict:
+    """
+    Normalize a motion setting to {'zoom': (start, end), 'pan': (dx, dy), 'easing': name}.
+
+    Args:
+        motion: Preset name (see MOTION_PRESETS) or motion dictionary
+
+    Returns:
+        Normalized motion dictionary
+    """
+    if isinstance(motion, str):
+        if motion not in MOTION_PRESETS:
+            raise ValueError(f"Unknown motion preset: {motion} (use {', '.join(MOTION_PRESETS)})")
+        motion = MOTION_PRESETS[motion]
+
+    zoom = motion.get('zoom', [1.0, 1.1])
+    if isinstance(zoom, (int, float)):
+        zoom = [zoom, zoom]
+    zoom = (float(zoom[0]), float(zoom[1]))
+    if min(zoom) < 1.0:
+        raise ValueError(f"Zoom must be >= 1.0: {zoom}")
+
+    pan = motion.get('pan', 'none')
+    if isinstance(pan, str):
+        if pan not in PAN_DIRECTIONS:
+            raise ValueError(f"Unknown pan direction: {pan} (use {', '.join(PAN_DIRECTIONS)})")
+        pan = PAN_DIRECTIONS[pan]
+    pan = (float(np.clip(pan[0], -1, 1)), float(np.clip(pan[1], -1, 1)))
+
+    easing = motion.get('easing', 'ease_in_out')
+    if easing not in EASINGS:
+        raise ValueError(f"Unknown easing: {easing} (use {', '.join(EASINGS)})")
+
+    return {'zoom': zoom, 'pan': pan, 'easing': easing}
+
+
+class KenBurns:
+    """Frame source that pans and zooms across a still image."""
+
+    def __init__(
+        self,
+        image: np.ndarray,
+        motion: Union[str, Dict],
+        duration: float,
+        fps: int,
+        size: Optional[Tuple[int, int]] = None
+    ):
+        """
+        Initialize Ken Burns motion.
+
+        Args:
+            image: Still RGB(A) frame
+            motion: Motion preset name or dictionary (see module docstring)
+            duration: Seconds over which the motion runs (held after)
+            fps: Frames per second the crop windows are computed for
+            size: Output size (width, height), defaults to the image size
+        """
+        self.image = image
+        self.motion = parse_motion(motion)
+        self.duration = duration
+        self.fps = fps
+        height, width = image.shape[:2]
+        self.size = size or (width, height)
+        self._pil_image = None
+
+        # ffmpeg frame stream (see frame_at): next frame index it will emit
+        self._process = None
+        self._stderr = None
+        self._next = 0
+        self._streamed: Optional[Tuple[int, np.ndarray]] = None
+        self._stream_failed = False
+
+        # Crop window (x0, y0, w, h) per frame, centered on the pan path
+        p = np.linspace(0.0, 1.0, max(2, int(round(duration * fps)) + 1))
+        eased = EASINGS[self.motion['easing']](p)
+        start, end = self.motion['zoom']
+        zoom = start + (end - start) * eased
+        w, h = width / zoom, height / zoom
+        dx, dy = self.motion['pan']
+        cx = width / 2 + dx * (eased - 0.5) * (width - w)
+        cy = height / 2 + dy * (eased - 0.5) * (height - h)
+        self.windows = np.stack([cx - w / 2, cy - h / 2, w, h], axis=1)
+
+        # Integer windows for the encoder path; edges are rounded
+        # independently so they stay within half a pixel of the float path
+        x0, y0 = np.round(self.windows[:, 0]), np.round(self.windows[:, 1])
+        x1 = np.round(self.windows[:, 0] + self.windows[:, 2])
+        y1 = np.round(self.windows[:, 1] + self.windows[:, 3])
+        self.crops = np.stack([x0, y0, x1, y1], axis=1).astype(np.intp)
+
+    @property
+    def static_after(self) -> float:
+        """Time after which every frame is identical."""
+        moving = self.motion['zoom'][0] != self.motion['zoom'][1] or any(self.motion['pan'])
+        return self.duration if moving else 0.0
+
+    def _index(self, t: float) -> int:
+        return min(max(int(round(t * self.fps)), 0), len(self.windows) - 1)
+
+    def crop_at(self, t: float) -> np.ndarray:
+        """
+        Crop window at time t as a view of the still (not resized).
+
+        The window has the output aspect ratio; the encoder scales it to
+        the output size during pixel format conversion.
+        """
+        x0, y0, x1, y1 = self.crops[self._index(t)]
+        return self.image[y0:y1, x0:x1, :3]
+
+    def zoompan_filter(self) -> str:
+        """ffmpeg filter chain rendering the crop windows from a single input frame."""
+        last = len(self.windows) - 1
+        eased = '(' + EASING_EXPRESSIONS[self.motion['easing']].replace('P', f'min(on/{last},1)') + ')'
+        start, end = self.motion['zoom']
+        dx, dy = self.motion['pan']
+        width, height = self.size
+        # zoompan truncates x/y; +0.5 rounds like the integer crops
+        zoompan = (
+            f"zoompan=z='{start}+{end - start}*{eased}'"
+            f":x='iw/2+{dx}*({eased}-0.5)*(iw-iw/zoom)-iw/zoom/2+0.5'"
+            f":y='ih/2+{dy}*({eased}-0.5)*(ih-ih/zoom)-ih/zoom/2+0.5'"
+            f":d={last + 1}:s={width}x{height}"
+        )
+        # Scaling in YUV 4:2:0 (what the encoder gets anyway) is far faster than RGB
+        return f"format=yuv420p,{zoompan},format=rgb24"
+
+    def frame_at(self, t: float) -> np.ndarray:
+        """
+        Frame at time t at the output size.
+
+        Frames asked for in order come from an ffmpeg zoompan stream;
+        others are resampled with PIL (sub-pixel accurate).
+        """
+        index = self._index(t)
+        if self._streamed is not None and self._streamed[0] == index:
+            return self._streamed[1]
+        if index < self._next and index < MAX_STREAM_SKIP:
+            # Another pass from the start (e.g. a second encode): restart the stream
+            self._stop_stream()
+            self._next = 0
+        if not self._stream_failed and self._next <= index < self._next + MAX_STREAM_SKIP:
+            frame = self._stream_to(index)
+            if frame is not None:
+                return frame
+        return self._resample(index)
+
+    def _start_stream(self):
+        image = np.ascontiguousarray(self.image[:, :, :3])
+        height, width = image.shape[:2]
+        self._stderr = tempfile.TemporaryFile()
+        self._process = subprocess.Popen(
+            [get_ffmpeg_binary(), '-hide_banner', '-loglevel', 'error',
+             '-f', 'rawvideo', '-pix_fmt', 'rgb24', '-s', f'{width}x{height}', '-i', '-',
+             '-vf', self.zoompan_filter(), '-f', 'rawvideo', '-pix_fmt', 'rgb24', '-'],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=self._stderr
+        )
+        # ffmpeg reads the whole still before it writes the first frame
+        self._process.stdin.write(image.tobytes())
+        self._process.stdin.close()
+
+    def _stream_to(self, index: int) -> Optional[np.ndarray]:
+        """Read the stream up to frame `index` (None if ffmpeg failed)."""
+        width, height = self.size
+        frame_bytes = width * height * 3
+        try:
+            if self._process is None:
+                self._start_stream()
+            while self._next <= index:
+                data = self._process.stdout.read(frame_bytes)
+                if len(data) < frame_bytes:
+                    raise OSError("ffmpeg motion stream ended early")
+                self._streamed = (self._next, np.frombuffer(data, np.uint8).reshape(height, width, 3))
+                self._next += 1
+        except OSError as e:
+            if self._stderr is not None:
+                self._stderr.seek(0)
+                e = self._stderr.read().decode(errors='replace').strip() or e
+            print(f"    ⚠️  ffmpeg motion stream failed ({e}); resampling frames in Python")
+            self._stream_failed = True
+            self._stop_stream()
+            return None
+        if self._next >= len(self.windows):
+            self._stop_stream()
+        return self._streamed[1]
+
+    def _stop_stream(self):
+        if self._process is not None:
+            self._process.stdout.close()
+            if self._process.poll() is None:
+                self._process.kill()
+            self._process.wait()
+            self._process = None
+        if self._stderr is not None:
+            self._stderr.close()
+            self._stderr = None
+
+    def _resample(self, index: int) -> np.ndarray:
+        """Frame `index` resampled from the still with PIL."""
+        from PIL import Image
+
+        if self._pil_image is None:
+            self._pil_image = Image.fromarray(np.ascontiguousarray(self.image[:, :, :3]))
+        x, y, w, h = self.windows[index]
+        return np.asarray(self._pil_image.resize(self.size, Image.BILINEAR, box=(x, y, x + w, y + h)))
+
+    def final_frame(self) -> np.ndarray:
+        """Last frame of the motion."""
+        return self.frame_at(self.duration)
+
+    def close(self):
+        """Stop the ffmpeg stream and drop cached frames."""
+        self._stop_stream()
+        self._streamed = None
+        self._pil_image = None
+
+    def __del__(self):
+        if getattr(self, '_process', None) is not None:
+            self._stop_stream()
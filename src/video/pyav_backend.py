@@ -0,0 +1,375 @@
+"""
+PyAV Encoder - In-process encoding backend for VideoCompositor.
+
+Encodes scenes with libav directly instead of piping frames through
+MoviePy into an ffmpeg subprocess:
+- Each scene is converted to a video frame once and re-submitted with
+  new timestamps, no per-tick frame copies
+- Audio and video are encoded into the same container in one pass,
+  no temp audio file
+- Timestamps are explicit: with a decimating (VFR) encoder profile a
+  static scene is a single frame held until the next change
+- Scenes cut into shots (one per [SCREEN] cue) are still runs: each
+  still shot is converted once and held until the next cut
+- Ken Burns motion is an integer crop of the still per frame, scaled
+  by libswscale in the same pass as the RGB to YUV conversion
+- Transitions are mixed on the encoder's YUV planes, and only for the
+  frames inside the transition window
+- Burned-in captions are blended onto the YUV frame from cached sprites;
+  a still scene is converted once per caption, not once per frame
+"""
+
+from fractions import Fraction
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .captions import caption_track, parse_cues
+from .encoder_profiles import EncoderProfile
+from .motion import KenBurns
+from .shots import ShotSequence, changed_frames
+from .transitions import parse_transition, rgb_color
+
+
+class PyAVEncoder:
+    """Encode a list of scene configurations with PyAV."""
+
+    AUDIO_RATE = 44100
+
+    def __init__(
+        self,
+        resolution: Tuple[int, int],
+        fps: int,
+        profile: EncoderProfile,
+        threads: Optional[int] = None,
+        caption_renderer=None
+    ):
+        """
+        Initialize PyAV encoder.
+
+        Args:
+            resolution: Video resolution (width, height)
+            fps: Frames per second
+            profile: Encoder profile
+            threads: Encoder thread count (0/None = libav default)
+            caption_renderer: Burns in scene 'captions' when set (e.g.
+                visuals.captions.CaptionRenderer, needs draw_yuv())
+        """
+        try:
+            import av
+            self.av = av
+        except ImportError:
+            raise ImportError("PyAV not installed: pip install av")
+
+        self.width, self.height = resolution
+        self.fps = fps
+        self.profile = profile
+        self.threads = threads
+        self.caption_renderer = caption_renderer
+
+    def _load_frame(self, scene: Dict) -> np.ndarray:
+        """Get a scene's RGB pixels at the output resolution."""
+        frame = scene.get('frame')
+        if frame is None:
+            from PIL import Image
+            with Image.open(scene['image']) as img:
+                img = img.convert('RGB')
+                if img.size != (self.width, self.height):
+                    img = img.resize((self.width, self.height), Image.LANCZOS)
+                return np.asarray(img)
+
+        frame = frame[:, :, :3]
+        if frame.shape[1] != self.width or frame.shape[0] != self.height:
+            from PIL import Image
+            img = Image.fromarray(np.ascontiguousarray(frame))
+            frame = np.asarray(img.resize((self.width, self.height), Image.LANCZOS))
+        return np.ascontiguousarray(frame)
+
+    def _load_audio(self, audio_path: str) -> np.ndarray:
+        """Decode an audio file to planar float32 stereo at AUDIO_RATE."""
+        resampler = self.av.AudioResampler(format='fltp', layout='stereo', rate=self.AUDIO_RATE)
+        chunks = []
+        with self.av.open(audio_path) as container:
+            for frame in container.decode(audio=0):
+                for resampled in resampler.resample(frame):
+                    chunks.append(resampled.to_ndarray())
+        for resampled in resampler.resample(None):
+            chunks.append(resampled.to_ndarray())
+
+        if not chunks:
+            return np.zeros((2, 0), dtype=np.float32)
+        return np.concatenate(chunks, axis=1).astype(np.float32, copy=False)
+
+    def _add_video_stream(self, container):
+        """Create the H.264 stream with the profile's settings."""
+        keyint = max(1, int(round(self.profile.gop_seconds * self.fps)))
+        options = {
+            'preset': self.profile.preset,
+            'crf': str(self.profile.crf),
+            'g': str(keyint),
+            'keyint_min': str(min(keyint, self.fps)),
+        }
+        if self.profile.tune:
+            options['tune'] = self.profile.tune
+
+        stream = container.add_stream('libx264', rate=self.fps, options=options)
+        stream.width = self.width
+        stream.height = self.height
+        stream.pix_fmt = 'yuv420p'
+        stream.codec_context.time_base = Fraction(1, self.fps)
+        if self.threads:
+            stream.codec_context.thread_count = self.threads
+        return stream
+
+    def _add_audio_stream(self, container):
+        """Create the AAC stream."""
+        stream = container.add_stream('aac', rate=self.AUDIO_RATE)
+        stream.layout = 'stereo'
+        bitrate = self.profile.audio_bitrate
+        stream.bit_rate = int(bitrate[:-1]) * 1000 if bitrate.endswith('k') else int(bitrate)
+        return stream
+
+    def _prepare_scene(self, scene: Dict) -> Dict:
+        """Load a scene's audio and frame source and fix its length in frames."""
+        animation = scene.get('animation')
+        shots = scene.get('shots') if animation is None else None
+        pixels = None if animation is not None or shots else self._load_frame(scene)
+        audio = np.zeros((2, 0), dtype=np.float32)
+        if scene.get('audio'):
+            audio = self._load_audio(scene['audio'])
+
+        duration = max(float(scene.get('duration', 5.0)), audio.shape[1] / self.AUDIO_RATE)
+        # Scene boundaries land on frame ticks; audio is padded to match
+        num_frames = max(1, int(round(duration * self.fps)))
+
+        if shots:
+            animation = ShotSequence.from_config(shots, num_frames / self.fps, self.fps, self._load_frame)
+        elif animation is None and scene.get('motion'):
+            animation = KenBurns(pixels, scene['motion'], num_frames / self.fps, self.fps)
+
+        if animation is not None:
+            # Sources with crop_at(t) (KenBurns) hand over an unscaled crop
+            # that is resized during pixel format conversion
+            render = getattr(animation, 'crop_at', animation.frame_at)
+            changed = changed_frames(animation, self.fps, num_frames)
+        else:
+            render = lambda t: pixels
+            changed = np.zeros(num_frames, dtype=bool)
+
+        captions = None
+        if self.caption_renderer is not None and scene.get('captions'):
+            captions = caption_track(parse_cues(scene['captions']), self.fps, num_frames)
+
+        return {
+            'title': scene.get('title', 'Untitled'),
+            'animation': animation,
+            'render': render,
+            'changed': changed,  # Frames whose picture differs from the frame before
+            'audio': audio,
+            'num_frames': num_frames,
+            'transition': parse_transition(scene.get('transition')),
+            'in_frames': 0,   # Frames of the incoming transition in this scene
+            'captions': captions,
+        }
+
+    def _video_frame(self, pixels: np.ndarray):
+        """Convert RGB pixels (any size) to an output-size yuv420p frame."""
+        frame = self.av.VideoFrame.from_ndarray(np.ascontiguousarray(pixels, dtype=np.uint8), format='rgb24')
+        return frame.reformat(width=self.width, height=self.height, format='yuv420p')
+
+    def _planes(self, frame) -> List[np.ndarray]:
+        """Y, U and V planes of a yuv420p frame."""
+        data = frame.to_ndarray()
+        h, w = self.height, self.width
+        return [
+            data[:h],
+            data[h:h + h // 4].reshape(h // 2, w // 2),
+            data[h + h // 4:].reshape(h // 2, w // 2),
+        ]
+
+    def _from_planes(self, planes: List[np.ndarray]):
+        """Pack Y, U and V planes back into a yuv420p frame."""
+        data = np.concatenate([planes[0], planes[1].reshape(-1, self.width), planes[2].reshape(-1, self.width)])
+        return self.av.VideoFrame.from_ndarray(data, format='yuv420p')
+
+    def _fill_planes(self, color: str) -> List[np.ndarray]:
+        """Per-plane YUV values of a solid color, converted like the scene pixels are."""
+        frame = self.av.VideoFrame.from_ndarray(
+            np.tile(rgb_color(color), (4, 4, 1)), format='rgb24'
+        ).reformat(format='yuv420p')
+        data = frame.to_ndarray()  # 4 Y rows, then U and V packed into one row each
+        return [data[0, :1].copy(), data[4, :1].copy(), data[5, :1].copy()]
+
+    def _encode_scene(self, scene: Dict, previous: Optional[Dict], following: Optional[Dict], first_pts: int, mux_video):
+        """
+        Encode one scene, including its halves of the adjacent transitions.
+
+        Still scenes are converted once and held; animated scenes are
+        streamed from their reused canvas until they are static, then
+        held; shot sequences are converted once per cut. Frames inside a transition window are composited on the
+        YUV planes with the neighbouring scene's edge frame, and the
+        scene's caption is blended on top. A caption change ends a hold.
+        """
+        num_frames, render = scene['num_frames'], scene['render']
+        transition = scene['transition']
+        fade_frames = 0
+        if transition is not None and not transition.at_boundary:
+            fade_frames = min(int(transition.duration * self.fps), num_frames // 2)
+        in_frames = scene['in_frames']
+        out_frames = following['in_frames'] if following else 0
+        track, texts = scene['captions'] if scene['captions'] is not None else (None, [])
+
+        changed = scene['changed']
+
+        def mixed(n: int) -> bool:
+            return n < max(fade_frames, in_frames) or n >= num_frames - max(fade_frames, out_frames)
+
+        def changes(n: int) -> bool:
+            # The frame differs from the one before it
+            return (n == 0 or changed[n] or mixed(n) or mixed(n - 1)
+                    or (track is not None and track[n] != track[n - 1]))
+
+        def build(n: int):
+            pixels = render(n / self.fps)
+            if n < fade_frames or n >= num_frames - fade_frames:
+                # Legacy fade to/from black within the scene
+                position = min(n + 1, num_frames - n) / (fade_frames + 1)
+                pixels = pixels * position
+            frame = self._video_frame(pixels)
+            if n < in_frames:
+                p = (in_frames + n + 0.5) / (2 * in_frames)
+                outgoing = previous['last_planes'] if previous else scene['fill']
+                frame = self._from_planes(transition.render(outgoing, self._planes(frame), p, scene['fill']))
+            elif n >= num_frames - out_frames:
+                p = (n - (num_frames - out_frames) + 0.5) / (2 * out_frames)
+                frame = self._from_planes(following['transition'].render(
+                    self._planes(frame), following['first_planes'], p, following['fill']
+                ))
+            if track is not None and track[n] >= 0:
+                data = frame.to_ndarray()
+                self.caption_renderer.draw_yuv(data, texts[track[n]])
+                frame = self.av.VideoFrame.from_ndarray(data, format='yuv420p')
+            return frame
+
+        held = None
+        for n in range(num_frames):
+            if changes(n):
+                held = mux_video(build(n), first_pts + n, keyframe=n == 0)
+            elif not self.profile.decimate or n == num_frames - 1 or changes(n + 1):
+                # CFR: re-submit the same frame buffer with a new timestamp.
+                # VFR: only the last tick of a hold, so it lasts until the next change.
+                mux_video(held, first_pts + n)
+
+        # The next scene's incoming transition mixes from this scene's own last frame
+        if following is not None and following['in_frames']:
+            scene['last_planes'] = self._planes(self._video_frame(render((num_frames - 1) / self.fps)))
+        if scene['animation'] is not None:
+            scene['animation'].close()
+
+    def _link_scenes(self, previous: Optional[Dict], scene: Dict):
+        """Size the transition into `scene` and grab its first frame for the outgoing side."""
+        transition = scene['transition']
+        if transition is None or not transition.at_boundary:
+            return
+        if previous is None and transition.kind != 'dip':
+            return  # Nothing to blend or slide from before the first scene
+
+        half = transition.half_frames(self.fps)
+        scene['fill'] = self._fill_planes(transition.color) if transition.kind == 'dip' else None
+        if previous is None:
+            # Dip in from the color: the solid color stands in for a previous scene
+            scene['in_frames'] = min(half, scene['num_frames'] // 2)
+            return
+        scene['in_frames'] = min(half, scene['num_frames'] // 2, previous['num_frames'] // 2)
+        scene['first_planes'] = self._planes(self._video_frame(scene['render'](0.0)))
+
+    def encode(self, scenes: List[Dict], output_path: str) -> float:
+        """
+        Encode scenes into a single MP4.
+
+        Scene durations follow the compositor rules: a scene lasts at
+        least its configured duration and is extended to fit its audio.
+        Transitions (see video.transitions) take their frames from both
+        sides of the cut and don't change scene timing.
+
+        Args:
+            scenes: Scene configurations ('animation', 'frame' or 'image',
+                'audio', 'duration', 'transition', 'motion', 'captions')
+            output_path: Output video path
+
+        Returns:
+            Duration of the encoded video in seconds
+        """
+        av = self.av
+        try:
+            key_picture = av.video.frame.PictureType.I
+        except AttributeError:
+            key_picture = 'I'  # Older PyAV
+
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        container = av.open(str(output_path), mode='w', options={'movflags': '+faststart'})
+        video_stream = self._add_video_stream(container)
+        audio_stream = self._add_audio_stream(container)
+        audio_frame_size = 1024
+
+        frame_index = 0
+        audio_position = 0  # Timeline position in samples
+        sample_index = 0    # Samples handed to the encoder
+        pending_audio = np.zeros((2, 0), dtype=np.float32)
+
+        def mux_audio(samples: np.ndarray, final: bool = False):
+            nonlocal sample_index, pending_audio
+            pending_audio = np.concatenate([pending_audio, samples], axis=1)
+            while pending_audio.shape[1] >= audio_frame_size or (final and pending_audio.shape[1]):
+                chunk = np.ascontiguousarray(pending_audio[:, :audio_frame_size])
+                pending_audio = pending_audio[:, audio_frame_size:]
+                frame = av.AudioFrame.from_ndarray(chunk, format='fltp', layout='stereo')
+                frame.sample_rate = self.AUDIO_RATE
+                frame.pts = sample_index
+                frame.time_base = Fraction(1, self.AUDIO_RATE)
+                sample_index += chunk.shape[1]
+                container.mux(audio_stream.encode(frame))
+
+        def mux_video(frame, pts: int, keyframe: bool = False):
+            # Frames are converted once per distinct image and re-stamped
+            frame.pts = pts
+            frame.time_base = Fraction(1, self.fps)
+            frame.pict_type = key_picture if keyframe else 0
+            container.mux(video_stream.encode(frame))
+            return frame
+
+        try:
+            # One scene of lookahead: the next scene's first frame feeds the
+            # outgoing half of its transition
+            current = self._prepare_scene(scenes[0]) if scenes else None
+            if current is not None:
+                self._link_scenes(None, current)
+            previous = None
+            for i in range(len(scenes)):
+                print(f"  [{i + 1}/{len(scenes)}] Encoding scene: {current['title']}")
+                following = None
+                if i + 1 < len(scenes):
+                    following = self._prepare_scene(scenes[i + 1])
+                    self._link_scenes(current, following)
+
+                num_frames = current['num_frames']
+                audio = current.pop('audio')
+                scene_end = int(round((frame_index + num_frames) * self.AUDIO_RATE / self.fps))
+                scene_samples = scene_end - audio_position
+                audio_position = scene_end
+                if audio.shape[1] < scene_samples:
+                    audio = np.pad(audio, ((0, 0), (0, scene_samples - audio.shape[1])))
+                mux_audio(audio[:, :scene_samples])
+
+                self._encode_scene(current, previous, following, frame_index, mux_video)
+                frame_index += num_frames
+                previous, current = current, following
+
+            mux_audio(np.zeros((2, 0), dtype=np.float32), final=True)
+            container.mux(video_stream.encode(None))
+            container.mux(audio_stream.encode(None))
+        finally:
+            container.close()
+
+        return frame_index / self.fps
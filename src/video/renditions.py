@@ -0,0 +1,117 @@
+"""
+Output renditions - one master timeline, many deliverables.
+
+A rendition is a target frame size for the final export. All renditions
+of a run are produced by a single ffmpeg process: the master frames are
+piped in once, split inside the filter graph and scaled per output, and
+every output reuses the same encoded audio track.
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+
+@dataclass
+class Rendition:
+    """A single output format of the final video."""
+    name: str
+    width: int
+    height: int
+    vertical: bool = False  # Re-frame the landscape master for 9:16
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        return self.width, self.height
+
+
+# Named presets accepted on the command line
+RENDITIONS = {
+    '1080p': Rendition('1080p', 1920, 1080),
+    '720p': Rendition('720p', 1280, 720),
+    '360p': Rendition('360p', 640, 360),
+    'vertical': Rendition('vertical', 1080, 1920, vertical=True),
+}
+
+
+def parse_renditions(spec: str) -> List[Rendition]:
+    """
+    Parse a comma-separated rendition list.
+
+    Args:
+        spec: e.g. "1080p,720p,vertical" or "1280x720,640x360"
+
+    Returns:
+        List of renditions, in the given order
+    """
+    renditions = []
+    for item in spec.split(','):
+        item = item.strip().lower()
+        if not item:
+            continue
+        if item in RENDITIONS:
+            renditions.append(RENDITIONS[item])
+            continue
+        try:
+            width, height = map(int, item.split('x'))
+        except ValueError:
+            raise ValueError(
+                f"Unknown rendition: {item} (use {', '.join(RENDITIONS)} or WIDTHxHEIGHT)"
+            )
+        renditions.append(Rendition(item, width, height, vertical=height > width))
+
+    if not renditions:
+        raise ValueError("No renditions given")
+    return renditions
+
+
+def master_resolution(renditions: List[Rendition]) -> Tuple[int, int]:
+    """Landscape (16:9) master size large enough for every rendition."""
+    width = max(r.width for r in renditions)
+    return width, int(round(width * 9 / 16 / 2)) * 2
+
+
+def build_filter_graph(
+    renditions: List[Rendition],
+    bg_color: str = '#0a0a0a',
+    post_filters: Optional[List[str]] = None
+) -> Tuple[str, List[str]]:
+    """
+    Build the split-and-scale filter graph for the master video input.
+
+    Landscape renditions are plain scales. Vertical renditions put the
+    scaled master in the middle of a blurred, darkened fill of itself so
+    charts are never cropped.
+
+    Args:
+        renditions: Target renditions
+        bg_color: Padding color for odd aspect ratios
+        post_filters: Filters appended to every output chain (e.g. mpdecimate)
+
+    Returns:
+        Tuple of (filter_complex string, output pad labels)
+    """
+    count = len(renditions)
+    splits = ''.join(f'[s{i}]' for i in range(count))
+    chains = [f'[0:v]split={count}{splits}' if count > 1 else '[0:v]null[s0]']
+    labels = []
+    tail = ''.join(f',{f}' for f in post_filters or [])
+
+    for i, rendition in enumerate(renditions):
+        w, h = rendition.size
+        label = f'v{i}'
+        if rendition.vertical:
+            chains.append(
+                f'[s{i}]split[bg{i}][fg{i}];'
+                f'[bg{i}]scale={w}:{h}:force_original_aspect_ratio=increase,crop={w}:{h},'
+                f'boxblur=20:2,eq=brightness=-0.2[bgb{i}];'
+                f'[fg{i}]scale={w}:-2[fgs{i}];'
+                f'[bgb{i}][fgs{i}]overlay=(W-w)/2:(H-h)/2,setsar=1{tail}[{label}]'
+            )
+        else:
+            chains.append(
+                f'[s{i}]scale={w}:{h}:force_original_aspect_ratio=decrease,'
+                f'pad={w}:{h}:(ow-iw)/2:(oh-ih)/2:color={bg_color},setsar=1{tail}[{label}]'
+            )
+        labels.append(label)
+
+    return ';'.join(chains), labels
@@ -0,0 +1,157 @@
+"""
+Shots - A scene cut into consecutive shots, one per [SCREEN] cue.
+
+A scene's 'shots' setting lists where each shot starts, relative to the
+scene, and what it shows:
+
+    [{'image': 'scene_reveal_1_chart.png', 'start': 0.0},
+     {'image': 'scene_reveal_2_text.png', 'start': 4.2, 'motion': 'zoom_in'}]
+
+The scene keeps one audio track, transition and caption list; only the
+picture cuts. Shot starts are snapped to frame ticks, and the sequence
+reports which frames actually change (changed_frames), so an encoder
+converts each still shot once and holds it until the next cut.
+"""
+
+from bisect import bisect_right
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .motion import KenBurns
+
+
+def changed_frames(source, fps: int, num_frames: int) -> np.ndarray:
+    """
+    Frames of a frame source that may differ from the frame before.
+
+    Uses the source's own changed_frames() when it has one, otherwise
+    every frame up to its static_after time. Frame 0 is always a change.
+
+    Args:
+        source: Frame source (frame_at, static_after)
+        fps: Frames per second
+        num_frames: Frames to report on
+
+    Returns:
+        Boolean mask (num_frames,)
+    """
+    if hasattr(source, 'changed_frames'):
+        return source.changed_frames(fps, num_frames)
+    mask = np.zeros(num_frames, dtype=bool)
+    mask[:int(np.ceil(getattr(source, 'static_after', num_frames / fps) * fps)) + 1] = True
+    return mask
+
+
+class ShotSequence:
+    """Frame source that cuts between shots at fixed times."""
+
+    def __init__(self, shots: Sequence[Tuple[float, object]], duration: float, fps: int):
+        """
+        Initialize shot sequence.
+
+        Args:
+            shots: (start in seconds, RGB(A) frame or frame source) in
+                time order; the first shot starts at 0
+            duration: Scene length in seconds
+            fps: Frames per second the shot starts are snapped to
+        """
+        if not shots:
+            raise ValueError("A shot sequence needs at least one shot")
+        self.duration = duration
+        self.fps = fps
+        # Cuts land on frame ticks, like scene boundaries
+        self.start_frames = [0] + [int(round(start * fps)) for start, _ in shots[1:]]
+        self.starts = [n / fps for n in self.start_frames]
+        # Still shots are handed to encoders as RGB
+        self.sources = [
+            source if hasattr(source, 'frame_at') else np.ascontiguousarray(np.asarray(source)[:, :, :3])
+            for _, source in shots
+        ]
+
+    @classmethod
+    def from_config(
+        cls,
+        shots: List[Dict],
+        duration: float,
+        fps: int,
+        load_frame: Callable[[Dict], np.ndarray],
+        size: Optional[Tuple[int, int]] = None
+    ) -> 'ShotSequence':
+        """
+        Build a sequence from a scene's 'shots' setting.
+
+        Args:
+            shots: [{'image': path, 'start': seconds, 'motion': optional}]
+            duration: Scene length in seconds
+            fps: Frames per second
+            load_frame: Loads a shot's RGB frame at the output size
+            size: Output size for Ken Burns shots rendered with frame_at()
+
+        Returns:
+            ShotSequence
+        """
+        shots = sorted(shots, key=lambda shot: float(shot.get('start', 0.0)))
+        ends = [float(shot.get('start', 0.0)) for shot in shots[1:]] + [duration]
+        sources = []
+        for shot, end in zip(shots, ends):
+            frame = load_frame(shot)
+            if shot.get('motion'):
+                length = max(end - float(shot.get('start', 0.0)), 1.0 / fps)
+                frame = KenBurns(frame, shot['motion'], length, fps, size=size)
+            sources.append((float(shot.get('start', 0.0)), frame))
+        return cls(sources, duration, fps)
+
+    def _shot(self, t: float) -> Tuple[object, float]:
+        """Source on screen at time t and the time within it."""
+        # Tolerance for t = n / fps landing a hair before a cut
+        k = max(bisect_right(self.starts, t + 1e-6) - 1, 0)
+        return self.sources[k], t - self.starts[k]
+
+    @property
+    def static_after(self) -> float:
+        """Time after which every frame is identical (the last cut, or later)."""
+        last = self.sources[-1]
+        return min(self.duration, self.starts[-1] + getattr(last, 'static_after', 0.0))
+
+    def changed_frames(self, fps: int, num_frames: int) -> np.ndarray:
+        """Cut frames, plus the frames of animated shots until they settle."""
+        mask = np.zeros(num_frames, dtype=bool)
+        ends = self.start_frames[1:] + [num_frames]
+        for start, end, source in zip(self.start_frames, ends, self.sources):
+            end = min(end, num_frames)
+            if start >= end:
+                continue
+            if hasattr(source, 'frame_at'):
+                mask[start:end] |= changed_frames(source, fps, end - start)
+            mask[start] = True
+        return mask
+
+    def frame_at(self, t: float) -> np.ndarray:
+        """Frame at time t."""
+        source, local = self._shot(t)
+        return source.frame_at(local) if hasattr(source, 'frame_at') else source
+
+    def crop_at(self, t: float) -> np.ndarray:
+        """
+        Unscaled picture at time t for encoders that scale while converting.
+
+        Ken Burns shots hand over their crop window, other shots their frame.
+        """
+        source, local = self._shot(t)
+        if hasattr(source, 'crop_at'):
+            return source.crop_at(local)
+        return source.frame_at(local) if hasattr(source, 'frame_at') else source
+
+    def final_frame(self) -> np.ndarray:
+        """A copy of the last frame."""
+        last = self.sources[-1]
+        if hasattr(last, 'final_frame'):
+            return last.final_frame()
+        return np.array(self.frame_at(self.duration))
+
+    def close(self):
+        """Close the shots' frame sources."""
+        for source in self.sources:
+            if hasattr(source, 'close'):
+                source.close()
@@ -0,0 +1,167 @@
+"""
+Transitions - scene-to-scene transition catalog.
+
+A scene's 'transition' setting describes how it enters from the previous
+scene, as a name or a dictionary:
+
+    'crossfade'
+    {'type': 'wipe', 'duration': 0.5, 'direction': 'left'}
+    {'type': 'dip', 'duration': 0.8, 'color': '#FFFFFF'}
+
+Catalog:
+- fade: fade this scene in from and out to black (at both ends)
+- crossfade: blend into the next scene
+- dip: fade through a solid color
+- wipe: the new scene is revealed behind a moving edge
+- slide: the new scene pushes the old one out
+
+Boundary transitions (everything but 'fade') are centered on the cut,
+half in each scene, so scene timing and audio are unchanged. Only the
+frames inside that window are composited; they are mixed plane by plane,
+so the encoder can run them on its own YUV planes without converting
+back to RGB.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+
+TRANSITIONS = ('fade', 'crossfade', 'dip', 'wipe', 'slide')
+
+DEFAULT_DURATIONS = {
+    'fade': 0.5,
+    'crossfade': 0.6,
+    'dip': 0.8,
+    'wipe': 0.5,
+    'slide': 0.5,
+}
+
+DIRECTIONS = ('left', 'right', 'up', 'down')
+
+
+@dataclass
+class Transition:
+    """How a scene enters from the previous one."""
+    kind: str
+    duration: float
+    direction: str = 'left'
+    color: str = '#000000'
+
+    @property
+    def at_boundary(self) -> bool:
+        """Whether the transition spans the cut (False for the legacy per-scene fade)."""
+        return self.kind != 'fade'
+
+    def half_frames(self, fps: int) -> int:
+        """Frames on each side of the cut."""
+        return max(1, int(round(self.duration * fps / 2)))
+
+    def render(
+        self,
+        a: Sequence[np.ndarray],
+        b: Sequence[np.ndarray],
+        p: float,
+        fill: Optional[Sequence[np.ndarray]] = None
+    ) -> List[np.ndarray]:
+        """
+        Composite one transition frame.
+
+        Args:
+            a: Outgoing frame planes (e.g. [Y, U, V] or a single RGB array)
+            b: Incoming frame planes, same shapes as `a`
+            p: Progress through the transition, 0..1
+            fill: Per-plane fill values for 'dip' (broadcastable)
+
+        Returns:
+            New list of planes
+        """
+        if self.kind == 'crossfade':
+            return [_mix(x, y, p) for x, y in zip(a, b)]
+        if self.kind in ('dip', 'fade'):
+            fill = fill if fill is not None else [np.zeros(1, dtype=np.uint8)] * len(a)
+            if p < 0.5:
+                return [_mix(x, c, 2 * p) for x, c in zip(a, fill)]
+            return [_mix(c, y, 2 * p - 1) for c, y in zip(fill, b)]
+        if self.kind == 'wipe':
+            return [_wipe(x, y, p, self.direction) for x, y in zip(a, b)]
+        return [_slide(x, y, p, self.direction) for x, y in zip(a, b)]
+
+
+def parse_transition(spec: Union[None, str, Dict]) -> Optional[Transition]:
+    """
+    Parse a scene's transition setting.
+
+    Args:
+        spec: None, a catalog name, or a dictionary with 'type' and
+            optional 'duration', 'direction' and 'color'
+
+    Returns:
+        Transition, or None for a hard cut
+    """
+    if not spec:
+        return None
+    if isinstance(spec, str):
+        spec = {'type': spec}
+
+    kind = spec.get('type', 'crossfade')
+    if kind not in TRANSITIONS:
+        raise ValueError(f"Unknown transition: {kind} (use {', '.join(TRANSITIONS)})")
+    direction = spec.get('direction', 'left')
+    if direction not in DIRECTIONS:
+        raise ValueError(f"Unknown transition direction: {direction} (use {', '.join(DIRECTIONS)})")
+
+    return Transition(
+        kind=kind,
+        duration=float(spec.get('duration', DEFAULT_DURATIONS[kind])),
+        direction=direction,
+        color=spec.get('color', '#000000')
+    )
+
+
+def rgb_color(color: str) -> np.ndarray:
+    """'#RRGGBB' as an RGB uint8 array."""
+    color = color.lstrip('#')
+    return np.array([int(color[i:i + 2], 16) for i in (0, 2, 4)], dtype=np.uint8)
+
+
+def _mix(x: np.ndarray, y: np.ndarray, p: float) -> np.ndarray:
+    """x * (1 - p) + y * p in 8-bit fixed point."""
+    w = int(round(min(max(p, 0.0), 1.0) * 256))
+    out = np.asarray(x, dtype=np.uint16) * (256 - w) + np.asarray(y, dtype=np.uint16) * w
+    out >>= 8
+    return out.astype(np.uint8)
+
+
+def _along(plane: np.ndarray, direction: str) -> np.ndarray:
+    """View of a plane with the motion axis first (columns for left/right)."""
+    return plane.swapaxes(0, 1) if direction in ('left', 'right') else plane
+
+
+def _wipe(a: np.ndarray, b: np.ndarray, p: float, direction: str) -> np.ndarray:
+    out = a.copy()
+    o, bb = _along(out, direction), _along(b, direction)
+    n = o.shape[0]
+    if direction in ('left', 'up'):
+        # Edge travels from the far side towards the origin
+        edge = int(round((1 - p) * n))
+        o[edge:] = bb[edge:]
+    else:
+        edge = int(round(p * n))
+        o[:edge] = bb[:edge]
+    return out
+
+
+def _slide(a: np.ndarray, b: np.ndarray, p: float, direction: str) -> np.ndarray:
+    out = np.empty_like(a)
+    o, aa, bb = _along(out, direction), _along(a, direction), _along(b, direction)
+    n = o.shape[0]
+    offset = int(round(p * n))
+    if direction in ('left', 'up'):
+        o[:n - offset] = aa[offset:]
+        o[n - offset:] = bb[:offset]
+    else:
+        o[offset:] = aa[:n - offset]
+        o[:offset] = bb[n - offset:]
+    return out
@@ -14,21 +14,52 @@ Usage:
     video_path = generator.generate_from_script("scripts/my_script.md")
 """
 
+import dataclasses
 import os
+import re
+import time
 from pathlib import Path
 from typing import Optional, Dict, List
 import json
 
-from parsers.script_parser import ScriptParser
+import numpy as np
+
+from parsers.script_parser import ScriptParser, segment_fingerprint
+from parsers.timeline import Timeline
+from visuals.captions import CaptionRenderer
 from visuals.scene_generator import SceneGenerator
+from audio.processing import AudioProcessor
 from audio.tts_generator import TTSGenerator
+from video.captions import CaptionCue, caption_lines, time_cues, write_sidecars
 from video.compositor import VideoCompositor
+from video.incremental import IncrementalRenderer
+from video.ffmpeg_utils import probe_duration
+from video.motion import KenBurns
+from video.shots import ShotSequence
+from video.renditions import Rendition, master_resolution
+from utils.catalog import AssetCatalog, wav_duration
+from utils.journal import JobJournal, input_hash
+from utils.scratch import ScratchSpace, partial_path, publish_file
 from utils.llm_client import LLMClient
+from market import MarketDataStore, minmax_indices, parse_date_range, resample_ohlc, sum_between
 
 
 class VideoGenerator:
     """Main video generation orchestrator."""
 
+    # Proxy settings for fast iteration on script edits
+    PREVIEW_RESOLUTION = (640, 360)
+    PREVIEW_FPS = 2
+
+    # [SCREEN] wording that turns a line chart into an animated one
+    ANIMATION_CUES = ("drop", "rising", "rally", "crash", "zoom", "over next", "animate")
+
+    # Ken Burns presets cycled across still scenes with motion enabled
+    MOTION_CYCLE = ("zoom_in", "pan_right", "zoom_out", "pan_left")
+
+    # [SCREEN] wording for HTML card scenes, checked in this order
+    CARD_CUES = {"tweet": "tweet", "twitter": "tweet", "headline": "headline", "quote": "quote"}
+
     def __init__(
         self,
         output_dir: str = "output",
@@ -36,7 +67,21 @@ class VideoGenerator:
         resolution: tuple = (1920, 1080),
         fps: int = 30,
         use_llm_for_scenes: bool = True,
-        llm_endpoint: Optional[str] = None
+        llm_endpoint: Optional[str] = None,
+        preview: bool = False,
+        contact_sheet: bool = False,
+        renditions: Optional[List[Rendition]] = None,
+        encoder_profile: str = "upload",
+        write_scene_files: bool = True,
+        encoder_backend: str = "moviepy",
+        market_data_dir: Optional[str] = "data/market",
+        narrator: bool = False,
+        motion: bool = False,
+        transition: Optional[str] = "fade",
+        burn_captions: bool = False,
+        normalize_audio: bool = True,
+        scratch_root: Optional[str] = None,
+        catalog_path: Optional[str] = None
     ):
         """
         Initialize video generator.
@@ -48,7 +93,46 @@ class VideoGenerator:
             fps: Frames per second
             use_llm_for_scenes: Use LLM to intelligently generate scenes
             llm_endpoint: LLM API endpoint for scene generation
+            preview: Render a low-resolution proxy (native 360p scenes,
+                very low frame rate, no fades) for fast iteration
+            contact_sheet: Also write a contact-sheet PNG of all scenes
+            renditions: Export several renditions in one encode pass;
+                scenes are rendered at a master size that covers them all
+            encoder_profile: Encoder profile ('draft', 'upload', 'compact', 'archive');
+                preview mode always uses 'draft'
+            write_scene_files: Write scene PNGs to output/scenes. Scenes are
+                handed to the compositor in memory either way.
+            encoder_backend: Video encoding backend ('moviepy', 'pyav')
+            market_data_dir: Directory of <SYMBOL>.csv/.parquet OHLCV files
+                used for chart scenes (None to always use placeholders)
+            narrator: Add a gesturing stickman narrator to every scene
+            motion: Slow Ken Burns pan/zoom on still scenes (not in preview)
+            transition: Transition into each scene (see video.transitions:
+                'fade', 'crossfade', 'dip', 'wipe', 'slide'; None for cuts).
+                Preview mode always cuts.
+            burn_captions: Draw the voiceover captions into the video.
+                SRT/VTT caption files are written either way.
+            normalize_audio: Trim silence from each voiceover and bring it
+                to a common loudness (cached by source audio hash)
+            scratch_root: Parent of each job's private scratch directory
+                for intermediates (default: /dev/shm when it has room,
+                else the system temp directory; see utils.scratch)
+            catalog_path: Asset catalog shared across episodes
+                (default: <output_dir>/catalog.db; see utils.catalog)
         """
+        self.preview = preview
+        self.narrator = narrator
+        self.motion = motion and not preview
+        self.transition = None if preview else transition
+        self.contact_sheet = contact_sheet or preview
+        self.renditions = renditions
+        if preview:
+            resolution = self.PREVIEW_RESOLUTION
+            fps = self.PREVIEW_FPS
+            encoder_profile = "draft"
+        elif renditions:
+            resolution = master_resolution(renditions)
+
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -60,7 +144,8 @@ class VideoGenerator:
         # Initialize components
         self.scene_generator = SceneGenerator(
             output_dir=str(self.scenes_dir),
-            resolution=resolution
+            resolution=resolution,
+            write_files=write_scene_files
         )
 
         self.tts_generator = TTSGenerator(
@@ -68,12 +153,58 @@ class VideoGenerator:
             output_dir=str(self.audio_dir)
         )
 
+        # Loudness/silence pass after TTS; segment timing uses its output
+        self.audio_processor = None
+        if normalize_audio:
+            self.audio_processor = AudioProcessor(cache_dir=str(self.audio_dir / "processed"))
+
         self.compositor = VideoCompositor(
             output_dir=str(self.video_dir),
             resolution=resolution,
-            fps=fps
+            fps=fps,
+            encoder_profile=encoder_profile,
+            backend=encoder_backend,
+            caption_renderer=CaptionRenderer(*resolution) if burn_captions else None
         )
 
+        # Caption sidecar paths by format ('srt', 'vtt') of the last video
+        self.caption_files: Dict[str, str] = {}
+
+        # [SCREEN] cues of the current script; one scene is rendered per cue
+        self.timeline: Optional[Timeline] = None
+
+        # Animated chart scenes by scene path, streamed to the encoder
+        self.scene_animations: Dict[str, object] = {}
+        self.scene_types: Dict[str, str] = {}
+        self.scene_labels: Dict[str, str] = {}
+
+        # Keep the card browser and other resources open between runs (watch mode)
+        self.keep_warm = False
+
+        # Private scratch directory of the current job (see generate_from_script)
+        self.scratch_root = scratch_root
+        self.scratch: Optional[ScratchSpace] = None
+
+        # Completed units of the current run (see generate_from_script)
+        self.journal: Optional[JobJournal] = None
+        # Input hash of every scene/voiceover file, for the video's own hash
+        self.unit_inputs: Dict[str, str] = {}
+
+        # Every rendered file, across episodes: reuse lookups, GC and reporting
+        self.catalog = AssetCatalog(catalog_path or str(self.output_dir / "catalog.db"))
+        self.episode: Optional[str] = None
+        # Seconds spent rendering each scene/voiceover file of the current run
+        self.render_times: Dict[str, float] = {}
+        # Input hash of the last video, its per-scene segments and the ones encoded
+        self.video_inputs: Optional[str] = None
+        self.video_segments: List[Dict] = []
+        self.encoded_segments: List[Dict] = []
+
+        # Real series for chart scenes (placeholder data when unavailable)
+        self.market_data = None
+        if market_data_dir and Path(market_data_dir).exists():
+            self.market_data = MarketDataStore(market_data_dir)
+
         # LLM client for intelligent scene generation
         self.use_llm_for_scenes = use_llm_for_scenes
         if use_llm_for_scenes:
@@ -87,7 +218,9 @@ class VideoGenerator:
         script_path: str,
         output_filename: Optional[str] = None,
         skip_audio: bool = False,
-        skip_video: bool = False
+        skip_video: bool = False,
+        resume: bool = False,
+        incremental: bool = False
     ) -> Dict[str, any]:
         """
         Generate video from a markdown script.
@@ -97,6 +230,13 @@ class VideoGenerator:
             output_filename: Optional custom output filename
             skip_audio: Skip audio generation (testing)
             skip_video: Skip video composition (testing)
+            resume: Reuse the scenes, voiceovers and video that the
+                journal of an earlier (e.g. crashed) run recorded for the
+                same inputs, instead of starting over
+            incremental: Encode the video as cached per-scene segments
+                and re-encode only changed scenes (see video.incremental;
+                used when scenes are written to disk and are all stills,
+                shots or fades)
 
         Returns:
             Dictionary with paths to generated assets
@@ -108,6 +248,155 @@ class VideoGenerator:
         print(f"Output: {self.output_dir}")
         print(f"{'='*70}\n")
 
+        # Every completed unit is journaled as it finishes. Per-episode files
+        # (journal, manifest, project, contact sheet) let several scripts
+        # share one output directory at the same time.
+        self.episode = Path(script_path).stem
+        self.journal = JobJournal(str(self.output_dir / f"{self.episode}.journal.jsonl"), resume=resume)
+        if resume:
+            print(f"♻️  Resuming: {self.journal.count('scene')} scenes, "
+                  f"{self.journal.count('voiceover')} voiceovers on record\n")
+
+        # Intermediates go to a private scratch directory, removed either way;
+        # only finished artifacts are published into the output tree
+        self.scratch = ScratchSpace(root=self.scratch_root)
+        self.compositor.scratch_dir = str(self.scratch.subdir("video"))
+        print(f"🧪 Scratch: {self.scratch.path}{' (RAM)' if self.scratch.in_memory else ''}\n")
+        try:
+            return self._run_pipeline(script_path, output_filename, skip_audio, skip_video, incremental)
+        finally:
+            self.compositor.scratch_dir = None
+            self.scratch.cleanup()
+            self.scratch = None
+            # Scene buffers are only needed until the video is composed; a
+            # later run (watch mode) reloads unchanged scenes from their PNGs
+            self.scene_generator.release_frames()
+            # A warm generator (watch mode) keeps its TTS processes for the next run
+            if not self.keep_warm:
+                self.tts_generator.close()
+
+    def render_project(self, project_path: str, output_filename: Optional[str] = None) -> Dict[str, any]:
+        """
+        Render a hand-edited project file without re-running the script pipeline.
+
+        Only scenes whose images, audio, timing, transition or captions
+        changed since the last render are re-encoded (see video.incremental).
+
+        Args:
+            project_path: Project file written by generate_from_script
+            output_filename: Optional custom output filename
+
+        Returns:
+            Dictionary with the video path and export stats
+        """
+        self.scratch = ScratchSpace(root=self.scratch_root)
+        self.compositor.scratch_dir = str(self.scratch.subdir("video"))
+        try:
+            video_path = self.compositor.render_project(project_path, output_filename)
+        finally:
+            self.compositor.scratch_dir = None
+            self.scratch.cleanup()
+            self.scratch = None
+
+        return {
+            'project': project_path,
+            'video': video_path,
+            'exports': list(self.compositor.export_stats),
+            'output_dir': str(self.output_dir)
+        }
+
+    def watch(self, script_path: str, output_filename: Optional[str] = None, interval: float = 0.5):
+        """
+        Re-render a script every time it is saved, until interrupted.
+
+        The generator stays warm between saves (fonts, sprites, card
+        browser, TTS processes). Each save re-parses the script, and the
+        journal (see generate_from_script's resume) plus the per-scene
+        video segments mean only changed sections get new scenes,
+        voiceovers and encoded segments. Meant for preview mode.
+
+        Args:
+            script_path: Markdown script to watch
+            output_filename: Optional custom output filename
+            interval: Seconds between checks of the file's modification time
+        """
+        self.keep_warm = True
+        sections = {}
+        mtime = None
+        try:
+            while True:
+                try:
+                    current = os.stat(script_path).st_mtime_ns
+                except FileNotFoundError:
+                    current = None
+                if current is None or current == mtime:
+                    time.sleep(interval)
+                    continue
+                mtime = current
+
+                start = time.perf_counter()
+                try:
+                    previous, sections = sections, self._section_fingerprints(script_path)
+                    if previous:
+                        self._print_section_changes(previous, sections)
+                    result = self.generate_from_script(
+                        script_path, output_filename=output_filename, resume=True, incremental=True
+                    )
+                except Exception as e:
+                    print(f"\n❌ Error: {e}")
+                else:
+                    print(f"\n⏱️  Preview updated in {time.perf_counter() - start:.1f}s: {result['video']}")
+                print(f"\n👀 Watching {script_path} (Ctrl+C to stop)")
+        finally:
+            self.keep_warm = False
+            self.scene_generator.close()
+            self.tts_generator.close()
+
+    def _section_fingerprints(self, script_path: str) -> Dict[str, tuple]:
+        """(title, content fingerprint) of each section of a script, by section ID."""
+        segments = ScriptParser(script_path).parse()
+        return {segment.id: (segment.title, segment_fingerprint(segment.title, segment.cues))
+                for segment in segments}
+
+    @staticmethod
+    def _print_section_changes(previous: Dict[str, tuple], current: Dict[str, tuple]):
+        """Print which sections a save added, changed or removed."""
+        added = [sid for sid in current if sid not in previous]
+        changed = [sid for sid in current if sid in previous and previous[sid] != current[sid]]
+        removed = [sid for sid in previous if sid not in current]
+
+        # Untagged sections get a new ID when edited; same title means changed
+        removed_titles = {previous[sid][0]: sid for sid in removed}
+        for sid in list(added):
+            old = removed_titles.pop(current[sid][0], None)
+            if old is not None:
+                added.remove(sid)
+                removed.remove(old)
+                changed.append(sid)
+        print(f"\n✏️  Script saved: {len(added)} added, {len(changed)} changed, {len(removed)} removed")
+        for label, ids in (("+", added), ("~", changed), ("-", removed)):
+            for sid in ids:
+                print(f"    {label} {sid}")
+
+    def _run_pipeline(
+        self,
+        script_path: str,
+        output_filename: Optional[str],
+        skip_audio: bool,
+        skip_video: bool,
+        incremental: bool = False
+    ) -> Dict[str, any]:
+        """Parse, render, voice and compose a script (see generate_from_script)."""
+        # Per-run state; a warm generator (watch mode) must not carry the
+        # previous run's scenes into this one
+        for animation in self.scene_animations.values():
+            animation.close()
+        self.scene_animations = {}
+        self.scene_types = {}
+        self.scene_labels = {}
+        self.unit_inputs = {}
+        self.render_times = {}
+
         # Step 1: Parse Script
         print("📜 STEP 1: Parsing Script")
         print("-" * 70)
@@ -117,12 +406,24 @@ class VideoGenerator:
 
         if not segments:
             raise Exception("No segments found in script")
+        # Nominal cue times from the script timestamps until audio exists
+        self.timeline = Timeline.from_segments(segments)
+        print(f"  🎞️  {len(self.timeline)} [SCREEN] cues")
 
         # Step 2: Generate Scenes
         print(f"\n🎨 STEP 2: Generating Visual Scenes")
         print("-" * 70)
         scene_paths = self._generate_scenes_for_segments(segments)
 
+        contact_sheet_path = None
+        if self.contact_sheet:
+            contact_sheet_path = self.scene_generator.generate_contact_sheet(
+                scene_paths,
+                output_path=str(self.output_dir / f"{self.episode}.contact_sheet.png"),
+                labels=[self._cue_label(segments[cue.segment], cue) for cue in self.timeline]
+            )
+            print(f"\n  🗂️  Contact sheet: {contact_sheet_path}")
+
         # Step 3: Generate Audio
         audio_paths = []
         if not skip_audio:
@@ -138,57 +439,232 @@ class VideoGenerator:
 
             if not output_filename:
                 script_name = Path(script_path).stem
-                output_filename = f"{script_name}_video.mp4"
+                suffix = "preview" if self.preview else "video"
+                output_filename = f"{script_name}_{suffix}.mp4"
+
+            video_path = self._compose_video(segments, scene_paths, audio_paths, output_filename, incremental)
 
-            video_path = self._compose_video(segments, scene_paths, audio_paths, output_filename)
+        # Scene PNGs are written in the background; make sure they're on disk.
+        # A warm generator (watch mode) keeps its card browser for the next run.
+        if self.keep_warm:
+            self.scene_generator.flush()
+        else:
+            self.scene_generator.close()
+        self._catalog_run(segments, scene_paths, audio_paths, video_path)
 
         # Summary
         print(f"\n{'='*70}")
         print(f"✅ VIDEO GENERATION COMPLETE")
         print(f"{'='*70}")
 
+        manifest_path = self.output_dir / f"{self.episode}.manifest.json"
         result = {
             'script': script_path,
             'segments': len(segments),
-            'scenes': scene_paths,
+            'segment_ids': [segment.id for segment in segments],
+            'scenes': scene_paths if self.scene_generator.write_files else [],
             'audio': audio_paths,
             'video': video_path,
+            'renditions': dict(self.compositor.rendition_outputs),
+            'captions': dict(self.caption_files),
+            'timeline': self.timeline.to_list(),
+            'exports': list(self.compositor.export_stats) if video_path else [],
+            'contact_sheet': contact_sheet_path,
+            'preview': self.preview,
+            'journal': str(self.journal.path),
+            'manifest': str(manifest_path),
             'output_dir': str(self.output_dir)
         }
 
         # Save manifest
-        manifest_path = self.output_dir / "manifest.json"
-        with open(manifest_path, 'w') as f:
+        partial = partial_path(manifest_path)
+        with open(partial, 'w') as f:
             json.dump(result, f, indent=2)
+        os.replace(partial, manifest_path)
         print(f"\n📋 Manifest saved: {manifest_path}")
 
         return result
 
     def _generate_scenes_for_segments(self, segments: List) -> List[str]:
-        """Generate visual scenes for all segments."""
+        """
+        Generate one visual scene per [SCREEN] cue, for all segments.
+
+        Returns:
+            Scene paths in timeline order (also stored on the timeline cues)
+        """
         scene_paths = []
+        pending_cards = []  # Rendered together in one browser batch
+        pending_records = []  # Journaled once the batch is rendered
 
         for i, segment in enumerate(segments, 1):
             print(f"\n  [{i}/{len(segments)}] {segment.title}")
+            cues = self.timeline.for_segment(i - 1)
+
+            for cue in cues:
+                # Each cue is rendered like a segment of its own
+                shot = self._cue_segment(segment, cue)
+                # Named by segment ID, so inserting a section renames nothing
+                label = segment.id if len(cues) == 1 else f"{segment.id}_{cue.index + 1}"
+
+                # Determine scene type from screen descriptions
+                scene_type = self._classify_scene_type(shot)
+                if len(cues) == 1:
+                    print(f"      Type: {scene_type}")
+                else:
+                    print(f"      Cue {cue.index + 1}/{len(cues)}: {scene_type}")
+
+                # Symbol and date hints carry over from earlier cues of the section
+                context = dataclasses.replace(
+                    segment, screen=[c.screen for c in cues[:cue.index + 1] if c.screen]
+                )
+                inputs = self._scene_inputs(shot, scene_type, context)
+                done = self._completed_scene(label, inputs, shot, scene_type)
+                start = time.perf_counter()
+
+                # Generate appropriate scene
+                if done:
+                    scene_path = self.scene_generator.load_scene(done['outputs'][0])
+                elif scene_type == "chart":
+                    scene_path = self._generate_chart_scene(shot, label, context)
+                elif scene_type == "diagram":
+                    scene_path = self._generate_diagram_scene(shot, label)
+                elif scene_type == "title":
+                    scene_path = self._generate_title_scene(shot, label)
+                elif scene_type == "character":
+                    scene_path = self._generate_character_scene(shot, label)
+                elif scene_type == "card":
+                    kind, fields = self._card_for_segment(shot)
+                    scene_path = str(self.scenes_dir / f"scene_{label}_{kind}.png")
+                    pending_cards.append((kind, fields, scene_path))
+                    pending_records.append((label, inputs, scene_path))
+                else:
+                    scene_path = self._generate_text_scene(shot, label)
+
+                cue.scene = scene_path
+                self.scene_types[scene_path] = scene_type
+                self.scene_labels[scene_path] = label
+                self.unit_inputs[scene_path] = inputs
+                scene_paths.append(scene_path)
+                if done:
+                    if done['kind'] == 'catalog':
+                        self._record_scene(label, inputs, scene_path)
+                    print(f"      ♻️  Reused: {Path(scene_path).name}")
+                elif scene_type == "card":
+                    print(f"      ⏳ Queued: {Path(scene_path).name}")
+                else:
+                    self.render_times[scene_path] = time.perf_counter() - start
+                    self._record_scene(label, inputs, scene_path)
+                    print(f"      ✓ Saved: {Path(scene_path).name}")
+
+        if pending_cards:
+            start = time.perf_counter()
+            self._generate_card_scenes(pending_cards)
+            # One browser batch; each card is charged an equal share
+            seconds = (time.perf_counter() - start) / len(pending_cards)
+            for label, inputs, scene_path in pending_records:
+                self.render_times[scene_path] = seconds
+                self._record_scene(label, inputs, scene_path)
 
-            # Determine scene type from screen descriptions
-            scene_type = self._classify_scene_type(segment)
-            print(f"      Type: {scene_type}")
-
-            # Generate appropriate scene
-            if scene_type == "chart":
-                scene_path = self._generate_chart_scene(segment, i)
-            elif scene_type == "diagram":
-                scene_path = self._generate_diagram_scene(segment, i)
-            elif scene_type == "title":
-                scene_path = self._generate_title_scene(segment, i)
-            else:
-                scene_path = self._generate_text_scene(segment, i)
+        return scene_paths
 
-            scene_paths.append(scene_path)
-            print(f"      ✓ Saved: {Path(scene_path).name}")
+    def _catalog_run(self, segments: List, scene_paths: List[str], audio_paths: List[str],
+                     video_path: Optional[str]):
+        """
+        Record this run's files in the asset catalog and link them to the video.
 
-        return scene_paths
+        Reused files are recorded too (keeping their earlier render time),
+        so the video references everything it was made from.
+        """
+        catalog, episode = self.catalog, self.episode
+        if self.scene_generator.write_files:
+            resolution = (self.scene_generator.width, self.scene_generator.height)
+            for path in scene_paths:
+                catalog.add('scene', path, inputs=self.unit_inputs.get(path), episode=episode,
+                            unit=self.scene_labels.get(path),
+                            provider=self.scene_types.get(path), resolution=resolution,
+                            render_seconds=self.render_times.get(path))
+
+        for segment, path in zip(segments, audio_paths):
+            if path:
+                catalog.add('voiceover', path, inputs=self.unit_inputs.get(path), episode=episode,
+                            unit=segment.id, provider=self.tts_generator.provider_name,
+                            duration=wav_duration(path), render_seconds=self.render_times.get(path))
+
+        compositor = self.compositor
+        for segment in self.encoded_segments:
+            catalog.add('segment', segment['path'], inputs=segment['fingerprint'], episode=episode,
+                        unit=segment['key'], provider=compositor.encoder_profile.name,
+                        resolution=compositor.resolution, duration=segment['duration'],
+                        render_seconds=segment['seconds'])
+
+        if not video_path:
+            return
+        sizes = {r.name: r.size for r in self.renditions or []}
+        stats = {stat['path']: stat for stat in compositor.export_stats}
+        outputs = dict(compositor.rendition_outputs) or {'main': video_path}
+        assets = scene_paths + audio_paths + [segment['path'] for segment in self.video_segments]
+        for name, path in outputs.items():
+            stat = stats.get(path, {})
+            video_id = catalog.add(
+                'video', path, inputs=self.video_inputs, episode=episode, unit=name,
+                provider=f"{compositor.backend}/{compositor.encoder_profile.name}",
+                resolution=sizes.get(name, compositor.resolution), duration=stat.get('duration'),
+                render_seconds=stat.get('encode_seconds')
+            )
+            if video_id is not None:
+                catalog.link(video_id, assets)
+        print(f"\n🗃️  Catalog: {catalog.path}")
+
+    def _scene_inputs(self, shot, scene_type: str, context) -> str:
+        """Hash of everything a scene is rendered from."""
+        return input_hash(
+            scene_type,
+            # Timing only matters to animated charts, which are never reused
+            {k: v for k, v in dataclasses.asdict(shot).items() if k not in ('start_time', 'end_time')},
+            context.screen if scene_type == "chart" else None,
+            (self.scene_generator.width, self.scene_generator.height)
+        )
+
+    def _completed_scene(self, label: str, inputs: str, shot, scene_type: str) -> Optional[Dict]:
+        """
+        Record of a scene that can be loaded instead of rendered.
+
+        The journal of this output directory is checked first, then the
+        catalog for the same scene rendered for another episode (e.g. a
+        shared intro card), which comes back as a record of kind 'catalog'.
+        """
+        # Animated charts need their animation object, which only rendering builds
+        if scene_type == "chart" and self._is_animated_chart(shot, *self._classify_chart(shot)):
+            return None
+        done = self.journal.completed('scene', label, inputs)
+        if done is None:
+            path = self.catalog.find('scene', inputs)
+            if path:
+                done = {'kind': 'catalog', 'key': label, 'inputs': inputs, 'outputs': [path]}
+        return done
+
+    def _record_scene(self, label: str, inputs: str, scene_path: str):
+        """Journal a rendered scene (only scenes written to disk can be resumed)."""
+        if self.scene_generator.write_files:
+            self.journal.record('scene', label, inputs, [scene_path])
+
+    def _cue_segment(self, segment, cue):
+        """A segment narrowed to one [SCREEN] cue and its voiceover."""
+        return dataclasses.replace(
+            segment,
+            start_time=segment.start_time + (cue.start - self.timeline.for_segment(cue.segment)[0].start),
+            end_time=segment.start_time + (cue.end - self.timeline.for_segment(cue.segment)[0].start),
+            screen=[cue.screen] if cue.screen else [],
+            voiceover=list(cue.voiceover),
+            cues=[(cue.screen, list(cue.voiceover))]
+        )
+
+    def _cue_label(self, segment, cue) -> str:
+        """Contact sheet label of a cue's scene."""
+        title = self._short_title(segment)
+        if len(self.timeline.for_segment(cue.segment)) > 1:
+            title += f" ({cue.index + 1})"
+        return title
 
     def _classify_scene_type(self, segment) -> str:
         """Classify what type of scene to generate based on screen descriptions."""
@@ -198,13 +674,29 @@ class VideoGenerator:
             return "chart"
         elif "diagram" in screen_text or "flow" in screen_text or "comparison" in screen_text or "split screen" in screen_text:
             return "diagram"
+        elif any(word in screen_text for word in self.CARD_CUES):
+            return "card"
+        elif any(word in screen_text for word in ("stickman", "character", "narrator", "shrug")):
+            return "character"
         elif "title card" in screen_text or segment.start_time == 0:
             return "title"
         else:
             return "text"
 
-    def _generate_chart_scene(self, segment, index: int) -> str:
-        """Generate a chart scene."""
+    def _short_title(self, segment) -> str:
+        """Section title without the timestamp prefix or script body."""
+        return segment.title.split("\n")[0].split("]")[-1].strip()
+
+    def _generate_chart_scene(self, segment, index: str, context=None) -> str:
+        """
+        Generate a chart scene.
+
+        Args:
+            segment: Segment (or cue) the chart is for
+            index: Scene file label
+            context: Segment whose [SCREEN] cues pick the market data
+                (defaults to `segment`)
+        """
         title = segment.title.split("]")[-1].strip() if "]" in segment.title else segment.title
 
         # Extract annotations from screen descriptions
@@ -213,15 +705,160 @@ class VideoGenerator:
             if len(screen) < 100:  # Short descriptions become annotations
                 annotations.append(screen)
 
-        scene_path = self.scenes_dir / f"scene_{index:02d}_chart.png"
+        scene_path = self.scenes_dir / f"scene_{index}_chart.png"
+        chart_type, panels = self._classify_chart(segment)
+        data = self._chart_data_for_segment(context or segment, chart_type)
+        if data is None:
+            data = self.scene_generator._placeholder_chart_data(ohlc=chart_type == "candlestick")
 
-        return self.scene_generator.generate_chart_scene(
+        # The still doubles as the poster frame of an animated chart
+        scene_path = self.scene_generator.generate_chart_scene(
             title=title,
+            data=data,
             annotations=annotations[:3],  # Max 3 annotations
-            output_path=str(scene_path)
+            output_path=str(scene_path),
+            chart_type=chart_type,
+            panels=panels
+        )
+
+        if self._is_animated_chart(segment, chart_type, panels):
+            self.scene_animations[scene_path] = self._chart_animation(segment, title, data, annotations[:3])
+            print("      Animated: draw-in" + (" + zoom" if self.scene_animations[scene_path].zoom_limits else ""))
+
+        return scene_path
+
+    def _is_animated_chart(self, segment, chart_type: str, panels: List[str]) -> bool:
+        """Single-panel line charts whose cues describe movement are animated."""
+        if self.preview or chart_type != "line" or panels != ['price']:
+            return False
+        screen_text = " ".join(segment.screen).lower()
+        return any(word in screen_text for word in self.ANIMATION_CUES)
+
+    def _chart_animation(self, segment, title: str, data: Dict, annotations: List[str]):
+        """
+        Build the animated version of a chart scene.
+
+        Annotations pop in at their [SCREEN] cue's share of the segment;
+        a cue mentioning "zoom" with a date hint sets the pan/zoom target.
+        """
+        duration = max(segment.duration, 1.0)
+        cues = [(duration * i / len(annotations), text) for i, text in enumerate(annotations)]
+
+        zoom_window = None
+        for screen in segment.screen:
+            if "zoom" in screen.lower():
+                window = parse_date_range(screen)
+                if window and np.issubdtype(np.asarray(data['x']).dtype, np.datetime64):
+                    zoom_window = window
+
+        return self.scene_generator.create_chart_animation(
+            title=title,
+            data=data,
+            duration=duration,
+            fps=self.compositor.fps,
+            zoom_window=zoom_window,
+            cues=cues
         )
 
-    def _generate_diagram_scene(self, segment, index: int) -> str:
+    def _classify_chart(self, segment):
+        """Pick chart type and stacked panels from the screen descriptions."""
+        screen_text = " ".join(segment.screen).lower()
+        chart_type = "candlestick" if "candle" in screen_text else "line"
+
+        panels = ['price']
+        if "volume" in screen_text or chart_type == "candlestick":
+            panels.append('volume')
+        if "funding" in screen_text:
+            panels.append('funding')
+        if "open interest" in screen_text:
+            panels.append('open_interest')
+
+        return chart_type, panels
+
+    def _chart_data_for_segment(self, segment, chart_type: str = "line") -> Optional[Dict]:
+        """
+        Look up real market data for a chart scene.
+
+        The symbol comes from the screen descriptions ("Bitcoin chart..."),
+        the window from their date hints ("July 18, 2025", "over next 4
+        months"). The series is reduced to the chart's pixel width before
+        it reaches matplotlib.
+
+        Returns:
+            Chart data dict, or None to use placeholder data
+        """
+        if not self.market_data:
+            return None
+
+        symbol = self.market_data.find_symbol(" ".join(segment.screen))
+        if not symbol:
+            return None
+
+        try:
+            series = self.market_data.load(symbol)
+        except (FileNotFoundError, ValueError) as e:
+            print(f"      ⚠️  Market data unavailable for {symbol}: {e}")
+            return None
+        if not len(series):
+            return None
+
+        window = self._date_window(segment.screen)
+        if window:
+            start, end = window
+            # Give the hinted dates some context on both sides
+            padding = max((end - start) * 0.15, np.timedelta64(7, 'D'))
+            series = series.slice(start - padding, end + padding)
+        else:
+            series = series.slice(series.timestamp[-1] - np.timedelta64(365, 'D'), None)
+
+        if not len(series):
+            return None
+
+        if chart_type == "candlestick" and 'open' in series.columns:
+            # Candles need a few pixels each to stay readable
+            x, columns = resample_ohlc(series.timestamp, series.columns,
+                                       n_buckets=self.scene_generator.width // 6)
+            data = dict(columns, x=x, y=columns['close'])
+        else:
+            # Panels share close's points so they line up with the price axis
+            indices = minmax_indices(series['close'], n_buckets=self.scene_generator.width // 2)
+            x = series.timestamp[indices]
+            data = {'x': x, 'y': series['close'][indices]}
+            if 'volume' in series.columns:
+                data['volume'] = sum_between(series['volume'], indices)
+            for name in ('funding', 'open_interest'):
+                if name in series.columns:
+                    data[name] = series[name][indices]
+
+        data['label'] = f"{symbol} close"
+        data['events'] = self._chart_events(segment.screen, series)
+        print(f"      Data: {symbol}, {len(series):,} points → {len(x):,}")
+        return data
+
+    def _chart_events(self, screens: List[str], series) -> List:
+        """Single-day date hints inside the charted window become event markers."""
+        events = []
+        for screen in screens:
+            window = parse_date_range(screen)
+            if not window or window[1] - window[0] > np.timedelta64(1, 'D'):
+                continue
+            if len(series) and series.timestamp[0] <= window[0] <= series.timestamp[-1]:
+                events.append((window[0], window[0].astype(object).strftime('%b %d, %Y')))
+        return events
+
+    def _date_window(self, screens: List[str]):
+        """Union of the date ranges hinted at in a list of screen descriptions."""
+        start = end = None
+        for screen in screens:
+            anchor = start.astype('datetime64[D]').astype(object) if start is not None else None
+            window = parse_date_range(screen, anchor=anchor)
+            if not window:
+                continue
+            start = window[0] if start is None else min(start, window[0])
+            end = window[1] if end is None else max(end, window[1])
+        return (start, end) if start is not None else None
+
+    def _generate_diagram_scene(self, segment, index: str) -> str:
         """Generate a diagram scene."""
         title = segment.title.split("]")[-1].strip() if "]" in segment.title else segment.title
 
@@ -241,7 +878,7 @@ class VideoGenerator:
             parts = screen.replace("→", "|").split("|")
             elements.extend([p.strip() for p in parts if p.strip()])
 
-        scene_path = self.scenes_dir / f"scene_{index:02d}_diagram.png"
+        scene_path = self.scenes_dir / f"scene_{index}_diagram.png"
 
         return self.scene_generator.generate_diagram_scene(
             title=title,
@@ -250,7 +887,7 @@ class VideoGenerator:
             output_path=str(scene_path)
         )
 
-    def _generate_title_scene(self, segment, index: int) -> str:
+    def _generate_title_scene(self, segment, index: str) -> str:
         """Generate a title card scene."""
         title = segment.title.split("]")[-1].strip() if "]" in segment.title else segment.title
 
@@ -259,7 +896,7 @@ class VideoGenerator:
         if segment.voiceover and len(segment.voiceover[0]) < 60:
             subtitle = segment.voiceover[0]
 
-        scene_path = self.scenes_dir / f"scene_{index:02d}_title.png"
+        scene_path = self.scenes_dir / f"scene_{index}_title.png"
 
         return self.scene_generator.generate_title_card(
             title=title,
@@ -267,7 +904,78 @@ class VideoGenerator:
             output_path=str(scene_path)
         )
 
-    def _generate_text_scene(self, segment, index: int) -> str:
+    def _generate_character_scene(self, segment, index: str) -> str:
+        """Generate a character scene with the stickman saying the first voiceover line."""
+        text = segment.voiceover[0] if segment.voiceover else self._short_title(segment)
+        pose, expression = self._character_pose(segment, line=text)
+
+        scene_path = self.scenes_dir / f"scene_{index}_character.png"
+
+        return self.scene_generator.generate_character_scene(
+            text=text,
+            pose=pose,
+            expression=expression,
+            output_path=str(scene_path)
+        )
+
+    def _character_pose(self, segment, scene_type: Optional[str] = None, line: Optional[str] = None):
+        """
+        Pick a (pose, expression) matching a cue.
+
+        Args:
+            segment: Section or cue segment; its [SCREEN] cues and editing
+                notes are the stage directions
+            scene_type: Type of the scene the character appears on
+            line: What the character itself says, if anything; a question
+                gets a shrug
+        """
+        screen_text = " ".join(segment.screen + segment.editing_notes).lower()
+        if "shrug" in screen_text or (line and line.rstrip().endswith("?")):
+            return "shrug", "confused"
+        if "think" in screen_text:
+            return "thinking", "thinking"
+        if scene_type == "chart":
+            return "pointing", "neutral"
+        if scene_type == "title":
+            return "wave", "happy"
+        return "explaining", "neutral"
+
+    def _card_for_segment(self, segment):
+        """Pick a card template and its fields from the segment's [SCREEN] cues."""
+        screen = " ".join(segment.screen)
+        screen_text = screen.lower()
+        kind = next(kind for word, kind in self.CARD_CUES.items() if word in screen_text)
+
+        # Quoted text in the cue is the card content, else the voiceover
+        quoted = [q.strip() for q in re.findall(r'["“]([^"”]+)["”]', screen) if q.strip()]
+        lines = quoted or list(segment.voiceover) or [self._short_title(segment)]
+
+        if kind == "headline":
+            return kind, {'headlines': lines[:4], 'source': self._short_title(segment)}
+        if kind == "tweet":
+            handle = re.search(r'@(\w+)', screen)
+            handle = handle.group(1) if handle else "marketwatcher"
+            return kind, {'name': handle.replace("_", " ").title(), 'handle': handle, 'text': lines[0]}
+        return kind, {'text': lines[0]}
+
+    def _generate_card_scenes(self, cards: List) -> List[str]:
+        """Render queued card scenes in one batch (text scenes without a browser)."""
+        print(f"\n  🃏 Rendering {len(cards)} card scene(s)")
+        try:
+            paths = self.scene_generator.generate_card_scenes(cards)
+        except (ImportError, RuntimeError) as e:
+            print(f"      ⚠️  {e}; using text scenes instead")
+            paths = []
+            for kind, fields, scene_path in cards:
+                text = fields.get('text') or fields['headlines'][0]
+                if len(text) > 80:
+                    text = text[:77] + "..."
+                paths.append(self.scene_generator.generate_text_overlay(text=text, output_path=scene_path))
+        for scene_path in paths:
+            print(f"      ✓ Saved: {Path(scene_path).name}")
+        return paths
+
+    def _generate_text_scene(self, segment, index: str) -> str:
         """Generate a text overlay scene."""
         # Use first screen description or segment title
         text = segment.screen[0] if segment.screen else segment.title
@@ -276,7 +984,7 @@ class VideoGenerator:
         if len(text) > 80:
             text = text[:77] + "..."
 
-        scene_path = self.scenes_dir / f"scene_{index:02d}_text.png"
+        scene_path = self.scenes_dir / f"scene_{index}_text.png"
 
         return self.scene_generator.generate_text_overlay(
             text=text,
@@ -286,15 +994,53 @@ class VideoGenerator:
 
     def _generate_audio_for_segments(self, segments: List) -> List[str]:
         """Generate voiceover audio for all segments."""
-        # Prepare batch
-        audio_segments = []
+        processing = self.audio_processor.settings() if self.audio_processor else None
+
+        # Prepare batch of the voiceovers not on record
+        audio_paths: List[Optional[str]] = []
+        audio_segments, pending = [], []
         for i, segment in enumerate(segments, 1):
-            segment_id = f"segment_{i:02d}"
-            text = segment.voiceover_text
-            audio_segments.append((segment_id, text))
+            segment_id = segment.id
+            # Keep line breaks: lines are sentences, blocks are paragraphs
+            text = "\n\n".join(segment.voiceover)
+            inputs = input_hash(self.tts_generator.provider_name, self.tts_generator.provider.settings(),
+                                text, processing)
+            done = self.journal.completed('voiceover', segment_id, inputs)
+            if done is None:
+                # The same line voiced for another episode (e.g. a shared outro)
+                path = self.catalog.find('voiceover', inputs)
+                if path:
+                    done = self.journal.record('voiceover', segment_id, inputs, [path])
+            audio_paths.append(done['outputs'][0] if done else None)
+            if done:
+                self.unit_inputs[done['outputs'][0]] = inputs
+            else:
+                audio_segments.append((segment_id, text))
+                pending.append((i - 1, inputs))
+
+        if not audio_segments:
+            print(f"  ♻️  Reused all {len(audio_paths)} voiceovers")
+            return audio_paths
+        if len(audio_segments) < len(segments):
+            print(f"  ♻️  Reused {len(segments) - len(audio_segments)} voiceovers")
+
+        # Generate batch; stitched voiceovers are intermediates in scratch
+        start = time.perf_counter()
+        generated = self.tts_generator.generate_batch(
+            audio_segments, show_progress=True, output_dir=str(self.scratch.subdir("audio"))
+        )
 
-        # Generate batch
-        audio_paths = self.tts_generator.generate_batch(audio_segments, show_progress=True)
+        if self.audio_processor:
+            generated = self.audio_processor.process_batch(generated, show_progress=True)
+        else:
+            generated = [publish_file(path, self.audio_dir / Path(path).name) for path in generated]
+        seconds = (time.perf_counter() - start) / len(generated) if generated else 0.0
+
+        for (index, inputs), (segment_id, _), path in zip(pending, audio_segments, generated):
+            audio_paths[index] = path
+            self.unit_inputs[path] = inputs
+            self.render_times[path] = seconds
+            self.journal.record('voiceover', segment_id, inputs, [path])
 
         return audio_paths
 
@@ -303,32 +1049,171 @@ class VideoGenerator:
         segments: List,
         scene_paths: List[str],
         audio_paths: List[str],
-        output_filename: str
+        output_filename: str,
+        incremental: bool = False
     ) -> str:
-        """Compose final video from scenes and audio."""
+        """
+        Compose final video from scenes and audio.
+
+        Each segment is one scene with its voiceover. A segment with
+        several [SCREEN] cues cuts between their scenes as still runs
+        (see video.shots), timed by the timeline.
+        """
+        fps = self.compositor.fps
+        lengths = [self._segment_lengths(segment, audio) for segment, audio in zip(segments, audio_paths)]
+        speech = [length[0] for length in lengths]
+        scene_lengths = [length[1] for length in lengths]
+
+        # Re-time the cues against the probed audio
+        timeline = Timeline.from_segments(segments[:len(lengths)], scene_lengths, speech)
+        for cue, rendered in zip(timeline, self.timeline):
+            cue.scene = rendered.scene
+        self.timeline = timeline
 
         # Build scene configurations
         scenes = []
-        for i, (segment, scene_path, audio_path) in enumerate(zip(segments, scene_paths, audio_paths)):
-            scenes.append({
+        timeline_cues: List[CaptionCue] = []
+        elapsed = 0.0
+        shot_number = 0
+        for i, (segment, audio_path) in enumerate(zip(segments, audio_paths)):
+            cues = timeline.for_segment(i)
+            scene_length = scene_lengths[i]
+            scene_path = cues[0].scene
+            scene_types = [self.scene_types.get(cue.scene) for cue in cues]
+
+            shots = None
+            motion = None
+            if len(cues) == 1:
+                frame = self.scene_generator.get_frame(scene_path)
+                animation = self.scene_animations.get(scene_path)
+                if self.motion and animation is None:
+                    motion = self.MOTION_CYCLE[shot_number % len(self.MOTION_CYCLE)]
+                shot_number += 1
+                if motion and self.narrator and frame is not None:
+                    # Move the scene under the narrator, not the narrator with it
+                    animation = KenBurns(frame, motion, segment.duration, fps)
+            else:
+                shots, sources = [], []
+                for cue in cues:
+                    source = self.scene_animations.get(cue.scene)
+                    shot = {'image': cue.scene, 'start': round(cue.start - elapsed, 3)}
+                    if source is None:
+                        source = self.scene_generator.get_frame(cue.scene)
+                        if self.motion:
+                            shot['motion'] = self.MOTION_CYCLE[shot_number % len(self.MOTION_CYCLE)]
+                            if source is not None:
+                                source = KenBurns(source, shot['motion'], cue.duration, fps)
+                    shot_number += 1
+                    shots.append(shot)
+                    sources.append((shot['start'], source))
+                frame = None
+                animation = None
+                if all(source is not None for _, source in sources):
+                    animation = ShotSequence(sources, scene_length, fps)
+
+            if (self.narrator and "character" not in scene_types
+                    and (frame is not None or animation is not None)):
+                pose, expression = self._character_pose(segment, scene_types[0])
+                animation = self.scene_generator.create_narrator_animation(
+                    animation if animation is not None else frame,
+                    duration=scene_length, pose=pose, expression=expression
+                )
+
+            captions = time_cues(caption_lines(segment.voiceover), speech[i] or scene_length)
+            timeline_cues.extend(CaptionCue(elapsed + c.start, elapsed + c.end, c.text) for c in captions)
+            elapsed += scene_length
+
+            scene = {
+                'id': segment.id,
                 'title': segment.title,
                 'image': scene_path,
+                'frame': frame,
+                'animation': animation,
                 'audio': audio_path,
                 'duration': segment.duration,
-                'transition': 'fade'
-            })
+                'transition': self.transition,
+                'motion': motion,
+                'captions': [cue.to_dict() for cue in captions]
+            }
+            if shots:
+                scene['shots'] = shots
+            scenes.append(scene)
 
         # Export project file for manual editing if needed
-        project_path = self.output_dir / "project.json"
-        self.compositor.export_project_file(scenes, str(project_path))
+        project_path = self.output_dir / f"{self.episode}.project.json"
+        self.compositor.export_project_file(scenes, str(project_path), output_filename)
+
+        # Compose video, unless this exact video was already encoded
+        renditions = None if self.preview else self.renditions
+        inputs = self._video_inputs(scenes, renditions)
+        self.video_inputs = inputs
+        self.video_segments, self.encoded_segments = [], []
+        done = self.journal.completed('video', output_filename, inputs)
+        if done:
+            video_path = done['outputs'][0]
+            self.compositor.rendition_outputs = dict(done.get('renditions', {}))
+            self.compositor.export_stats = []
+            print(f"  ♻️  Reused video: {video_path}")
+        elif incremental and self._can_render_incrementally(renditions):
+            # Segments are encoded from the scene PNGs
+            self.scene_generator.flush()
+            renderer = IncrementalRenderer(self.compositor)
+            video_path = renderer.render(scenes, output_filename)
+            self.video_segments, self.encoded_segments = renderer.segments, renderer.encoded
+            self.journal.record('video', output_filename, inputs, [video_path])
+        else:
+            video_path = self.compositor.compose_video(
+                scenes=scenes,
+                output_filename=output_filename,
+                renditions=renditions
+            )
+            outputs = [video_path] + [p for p in self.compositor.rendition_outputs.values() if p != video_path]
+            self.journal.record('video', output_filename, inputs, outputs,
+                                renditions=dict(self.compositor.rendition_outputs))
+
+        self.caption_files = write_sidecars(timeline_cues, str(self.video_dir / output_filename))
+        print(f"  💬 Captions: {', '.join(self.caption_files.values())}")
+
+        return video_path
 
-        # Compose video
-        video_path = self.compositor.compose_video(
-            scenes=scenes,
-            output_filename=output_filename
+    def _can_render_incrementally(self, renditions) -> bool:
+        """Whether every scene can be encoded from its project config alone."""
+        return (self.scene_generator.write_files and not renditions
+                and not self.narrator and not self.scene_animations)
+
+    def _video_inputs(self, scenes: List[Dict], renditions: Optional[List[Rendition]]) -> str:
+        """Hash of the scene configs, the inputs of their files and the encode settings."""
+        runtime = VideoCompositor.RUNTIME_KEYS
+        configs = [{k: v for k, v in scene.items() if k not in runtime} for scene in scenes]
+        files = sorted({path for scene in configs for path in
+                        [scene['image'], scene['audio']] + [shot['image'] for shot in scene.get('shots', [])]})
+        compositor = self.compositor
+        return input_hash(
+            configs,
+            [self.unit_inputs.get(path, path) for path in files],
+            compositor.resolution, compositor.fps, compositor.encoder_profile.name, compositor.backend,
+            [dataclasses.asdict(r) for r in renditions or []],
+            self.narrator, compositor.caption_renderer is not None
         )
 
-        return video_path
+    def _segment_lengths(self, segment, audio_path: Optional[str]):
+        """
+        Spoken audio length and scene length of a segment.
+
+        The audio length is probed from the file header (0 without audio).
+        The scene length follows the compositor rules (at least the segment
+        duration, extended to fit the audio, on whole frames) so cues and
+        captions line up across scenes.
+        """
+        fps = self.compositor.fps
+        speech = 0.0
+        if audio_path:
+            try:
+                speech = probe_duration(audio_path)
+            except Exception as e:
+                print(f"    ⚠️  Warning: {e}")
+        scene_length = max(1, int(round(max(segment.duration, speech) * fps))) / fps
+        return speech, scene_length
 
 
 if __name__ == "__main__":
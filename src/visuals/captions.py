@@ -0,0 +1,111 @@
+"""
+Captions - Burned-in caption overlay from a sprite cache.
+
+Each distinct caption text is rasterized once (white text on a rounded
+translucent box) and kept as an RGB Sprite and a YUVSprite. Drawing a
+caption on a frame is then a NumPy alpha blend over the pixels the box
+covers, on RGB frames (MoviePy) or directly on the encoder's yuv420p
+frames (PyAV).
+"""
+
+from typing import Dict, Tuple
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from .diagram_engine import LINE_SPACING, get_font, line_height, text_width
+from .sprites import Sprite, YUVSprite
+
+
+class CaptionRenderer:
+    """Rasterize caption texts once and blend them onto frames."""
+
+    # Sizes are designed against a 1080px short side
+    REFERENCE_HEIGHT = 1080
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        font_size: int = 46,
+        text_color: Tuple[int, int, int] = (255, 255, 255),
+        box_color: Tuple[int, int, int, int] = (0, 0, 0, 170),
+        bottom_margin: float = 0.07
+    ):
+        """
+        Initialize caption renderer.
+
+        Args:
+            width: Frame width in pixels
+            height: Frame height in pixels
+            font_size: Font size at 1080p (scaled with the frame)
+            text_color: RGB text color
+            box_color: RGBA color of the box behind the text
+            bottom_margin: Gap below the box as a fraction of the height
+        """
+        self.width, self.height = width, height
+        self.scale = min(width, height) / self.REFERENCE_HEIGHT
+        self.font_size = max(8, int(round(font_size * self.scale)))
+        self.text_color = text_color
+        self.box_color = box_color
+        # Captions hang from the bottom center
+        self.position = (width // 2, height - int(round(height * bottom_margin)))
+        self.max_width = width * 0.9
+
+        self._sprites: Dict[str, Sprite] = {}
+        self._yuv_sprites: Dict[str, YUVSprite] = {}
+
+    def render(self, text: str) -> np.ndarray:
+        """
+        Rasterize a caption.
+
+        Args:
+            text: Caption rows separated by newlines
+
+        Returns:
+            RGBA pixels of the box and text
+        """
+        rows = text.split('\n')
+        size = self.font_size
+        widest = max(text_width(row, size) for row in rows)
+        if widest > self.max_width:
+            # Shrink rather than re-wrap, cue rows match the sidecar files
+            size = max(8, int(size * self.max_width / widest))
+            widest = max(text_width(row, size) for row in rows)
+
+        font = get_font(size)
+        row_height = int(round(line_height(size) * LINE_SPACING))
+        pad_x, pad_y = int(size * 0.6), int(size * 0.3)
+        box_w = int(np.ceil(widest)) + 2 * pad_x
+        box_h = row_height * len(rows) + 2 * pad_y
+
+        img = Image.new('RGBA', (box_w, box_h), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(img)
+        draw.rounded_rectangle((0, 0, box_w - 1, box_h - 1), radius=int(size * 0.3), fill=self.box_color)
+        for i, row in enumerate(rows):
+            x = (box_w - text_width(row, size)) / 2
+            draw.text((x, pad_y + i * row_height), row, font=font, fill=self.text_color + (255,))
+        return np.asarray(img)
+
+    def sprite(self, text: str) -> Sprite:
+        """Cached RGB sprite of a caption, anchored at its bottom center."""
+        if text not in self._sprites:
+            rgba = self.render(text)
+            self._sprites[text] = Sprite(rgba, anchor=(-(rgba.shape[1] // 2), -rgba.shape[0]))
+        return self._sprites[text]
+
+    def yuv_sprite(self, text: str) -> YUVSprite:
+        """Cached yuv420p sprite of a caption, anchored at its bottom center."""
+        if text not in self._yuv_sprites:
+            # Same pixels and placement as the RGB sprite (already cropped)
+            sprite = self.sprite(text)
+            self._yuv_sprites[text] = YUVSprite(sprite.rgba, anchor=sprite.anchor)
+        return self._yuv_sprites[text]
+
+    def draw(self, frame: np.ndarray, text: str):
+        """Blend a caption onto a writable RGB(A) frame in place."""
+        self.sprite(text).blit(frame, *self.position)
+
+    def draw_yuv(self, data: np.ndarray, text: str):
+        """Blend a caption onto a writable packed yuv420p frame in place."""
+        self.yuv_sprite(text).blit(data, *self.position)
@@ -0,0 +1,325 @@
+"""
+Character - Sprite-cached stickman narrator.
+
+Poses are joint positions on a 10x10 grid (y up), expressions are face
+strokes relative to the head. Each (pose, expression, size) is drawn once
+with a hand-drawn wobble into an RGBA Sprite and cached; placing the
+character on a frame afterwards is a NumPy alpha blend over the sprite's
+bounding box only.
+
+Gestures interpolate joint positions between pose keyframes. The blend
+factor is quantized, so a gesture is a handful of cached sprites no
+matter how many frames it spans.
+"""
+
+import hashlib
+from typing import Dict, List, Sequence, Tuple, Union
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from .chart_animator import ease_in_out
+from .sprites import Sprite
+
+
+Joints = Dict[str, Tuple[float, float]]
+
+# Limbs as joint chains; the head is a circle around 'head'
+SKELETON = [
+    ('neck', 'hip'),
+    ('shoulder', 'l_elbow', 'l_hand'),
+    ('shoulder', 'r_elbow', 'r_hand'),
+    ('hip', 'l_knee', 'l_foot'),
+    ('hip', 'r_knee', 'r_foot'),
+]
+
+HEAD_RADIUS = 1.0
+
+_BASE = {
+    'head': (5.0, 8.0), 'neck': (5.0, 7.0), 'shoulder': (5.0, 6.5), 'hip': (5.0, 4.0),
+    'l_knee': (4.5, 2.5), 'l_foot': (4.0, 1.0), 'r_knee': (5.5, 2.5), 'r_foot': (6.0, 1.0),
+}
+
+POSES: Dict[str, Joints] = {
+    'neutral': {**_BASE, 'l_elbow': (4.25, 5.25), 'l_hand': (3.5, 4.0),
+                'r_elbow': (5.75, 5.25), 'r_hand': (6.5, 4.0)},
+    'shrug': {**_BASE, 'l_elbow': (3.8, 5.8), 'l_hand': (3.0, 7.0),
+              'r_elbow': (6.2, 5.8), 'r_hand': (7.0, 7.0)},
+    'thinking': {**_BASE, 'l_elbow': (4.5, 5.2), 'l_hand': (4.0, 4.0),
+                 'r_elbow': (6.5, 5.6), 'r_hand': (5.6, 7.3),
+                 'l_knee': (4.5, 2.75), 'l_foot': (4.0, 1.5), 'r_knee': (5.0, 2.75), 'r_foot': (5.0, 1.5)},
+    'pointing': {**_BASE, 'l_elbow': (4.25, 5.25), 'l_hand': (3.5, 4.0),
+                 'r_elbow': (6.8, 6.7), 'r_hand': (8.5, 6.8)},
+    'pointing_left': {**_BASE, 'l_elbow': (3.2, 6.7), 'l_hand': (1.5, 6.8),
+                      'r_elbow': (5.75, 5.25), 'r_hand': (6.5, 4.0)},
+    'wave': {**_BASE, 'l_elbow': (4.25, 5.25), 'l_hand': (3.5, 4.0),
+             'r_elbow': (6.6, 7.0), 'r_hand': (7.2, 8.6)},
+    'explaining': {**_BASE, 'l_elbow': (4.2, 5.0), 'l_hand': (3.2, 5.8),
+                   'r_elbow': (5.8, 5.0), 'r_hand': (6.8, 5.8)},
+}
+
+# Face strokes as polylines, offsets from the head center
+EXPRESSIONS: Dict[str, List[List[Tuple[float, float]]]] = {
+    'neutral': [[(-0.3, 0.2), (-0.3, 0.4)], [(0.3, 0.2), (0.3, 0.4)], [(-0.3, -0.2), (0.3, -0.2)]],
+    'confused': [[(-0.3, 0.1), (-0.3, 0.3)], [(0.3, 0.3), (0.3, 0.5)], [(-0.2, -0.2), (0.2, -0.1)]],
+    'happy': [[(-0.3, 0.2), (-0.3, 0.4)], [(0.3, 0.2), (0.3, 0.4)],
+              [(-0.4, -0.1), (-0.2, -0.3), (0.2, -0.3), (0.4, -0.1)]],
+    'surprised': [[(-0.3, 0.25), (-0.3, 0.5)], [(0.3, 0.25), (0.3, 0.5)],
+                  [(0.12 * np.cos(a), -0.3 + 0.15 * np.sin(a)) for a in np.linspace(0, 2 * np.pi, 9)]],
+    'thinking': [[(-0.2, 0.35), (-0.2, 0.55)], [(0.4, 0.35), (0.4, 0.55)], [(0.0, -0.25), (0.35, -0.2)]],
+}
+
+PoseSpec = Union[str, Joints]
+
+
+def interpolate_pose(a: Joints, b: Joints, t: float) -> Joints:
+    """Blend two poses joint by joint (t=0 gives a, t=1 gives b)."""
+    return {name: (a[name][0] + (b[name][0] - a[name][0]) * t,
+                   a[name][1] + (b[name][1] - a[name][1]) * t) for name in a}
+
+
+class Character:
+    """Stickman renderer with a sprite cache."""
+
+    SUPERSAMPLE = 2
+
+    def __init__(self, color: str = '#FFD700', line_width: float = 0.3, wobble: float = 0.035):
+        """
+        Initialize character.
+
+        Args:
+            color: Stroke color
+            line_width: Stroke width in grid units (the figure is 10 units tall)
+            wobble: Hand-drawn jitter in grid units (0 for clean lines)
+        """
+        self.color = color
+        self.line_width = line_width
+        self.wobble = wobble
+        self._sprites: Dict[Tuple, Sprite] = {}
+
+    @staticmethod
+    def _joints(pose: PoseSpec) -> Joints:
+        if isinstance(pose, str):
+            if pose not in POSES:
+                raise ValueError(f"Unknown pose: {pose}. Available: {', '.join(POSES)}")
+            return POSES[pose]
+        return pose
+
+    def sprite(self, pose: PoseSpec, expression: str = 'neutral', height: int = 400) -> Sprite:
+        """
+        Get the sprite for a pose and expression, rendering it on first use.
+
+        Args:
+            pose: Pose name (see POSES) or joint positions
+            expression: Expression name (see EXPRESSIONS)
+            height: Sprite height in pixels (the full 10-unit grid)
+
+        Returns:
+            Sprite anchored at its bottom center
+        """
+        key = (pose if isinstance(pose, str) else tuple(sorted(pose.items())), expression, height)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = self._render(self._joints(pose), expression, height, seed=repr(key))
+            self._sprites[key] = sprite
+        return sprite
+
+    def gesture_sprite(
+        self,
+        from_pose: str,
+        to_pose: str,
+        t: float,
+        expression: str = 'neutral',
+        height: int = 400,
+        steps: int = 8
+    ) -> Sprite:
+        """
+        Sprite part way through a gesture between two named poses.
+
+        t is quantized to `steps` positions so in-between sprites are
+        reused across frames and scenes.
+        """
+        step = int(round(min(max(t, 0.0), 1.0) * steps))
+        if step == 0:
+            return self.sprite(from_pose, expression, height)
+        if step == steps:
+            return self.sprite(to_pose, expression, height)
+
+        key = ('gesture', from_pose, to_pose, step, steps, expression, height)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            joints = interpolate_pose(self._joints(from_pose), self._joints(to_pose), step / steps)
+            # Seed from the endpoints so the wobble doesn't flicker mid-gesture
+            sprite = self._render(joints, expression, height, seed=repr((from_pose, expression, height)))
+            self._sprites[key] = sprite
+        return sprite
+
+    def _render(self, joints: Joints, expression: str, height: int, seed: str) -> Sprite:
+        """Draw one pose into an RGBA sprite."""
+        if expression not in EXPRESSIONS:
+            raise ValueError(f"Unknown expression: {expression}. Available: {', '.join(EXPRESSIONS)}")
+
+        s = self.SUPERSAMPLE
+        size = height * s
+        unit = size / 10.0
+        rng = np.random.default_rng(int(hashlib.md5(seed.encode()).hexdigest()[:8], 16))
+        width = max(1, int(round(self.line_width * unit)))
+
+        img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(img)
+
+        def to_px(point):
+            return np.array([point[0] * unit, (10.0 - point[1]) * unit])
+
+        def stroke(points: Sequence[Tuple[float, float]], stroke_width: int):
+            # Subdivide and jitter perpendicular to each segment for a hand-drawn line
+            path = [to_px(points[0])]
+            for a, b in zip(points, points[1:]):
+                pa, pb = to_px(a), to_px(b)
+                length = np.hypot(*(pb - pa))
+                pieces = max(1, int(length / (unit * 0.8)))
+                normal = np.array([-(pb - pa)[1], (pb - pa)[0]]) / max(length, 1e-9)
+                for i in range(1, pieces + 1):
+                    point = pa + (pb - pa) * i / pieces
+                    if i < pieces:
+                        point = point + normal * rng.normal(0, self.wobble) * unit
+                    path.append(point)
+            draw.line([tuple(p) for p in path], fill=self.color, width=stroke_width, joint='curve')
+            r = stroke_width / 2
+            for p in (path[0], path[-1]):
+                draw.ellipse([p[0] - r, p[1] - r, p[0] + r, p[1] + r], fill=self.color)
+
+        for chain in SKELETON:
+            stroke([joints[name] for name in chain], width)
+
+        # Head: a slightly irregular closed loop
+        hx, hy = joints['head']
+        angles = np.linspace(0, 2 * np.pi, 41)
+        radii = HEAD_RADIUS * (1 + rng.normal(0, self.wobble * 0.3, len(angles)))
+        radii[-1] = radii[0]
+        stroke([(hx + r * np.cos(a), hy + r * np.sin(a)) for a, r in zip(angles, radii)], width)
+
+        for line in EXPRESSIONS[expression]:
+            stroke([(hx + dx, hy + dy) for dx, dy in line], max(1, int(width * 0.8)))
+
+        if s > 1:
+            img = img.resize((height, height), Image.LANCZOS)
+        return Sprite(np.asarray(img), anchor=(-height // 2, -height))
+
+
+class CharacterAnimation:
+    """
+    Frame source placing a gesturing character over a background.
+
+    The background is a still frame or another frame source (anything
+    with frame_at(t), e.g. AnimatedChart). Only the character's bounding
+    box is restored and re-blended per frame for still backgrounds.
+    """
+
+    def __init__(
+        self,
+        character: Character,
+        background,
+        keyframes: List[Tuple[float, str]],
+        duration: float,
+        position: Tuple[int, int],
+        height: int,
+        expression: str = 'neutral',
+        gesture_time: float = 0.5
+    ):
+        """
+        Initialize character animation.
+
+        Args:
+            character: Character whose sprites are used
+            background: RGB(A) frame, or a frame source with frame_at(t)
+            keyframes: (time in seconds, pose name) pairs in time order;
+                the character moves into each pose over gesture_time
+            duration: Animation length in seconds
+            position: Bottom-center placement of the character in pixels
+            height: Character height in pixels
+            expression: Expression name
+            gesture_time: Seconds each pose change takes
+        """
+        self.character = character
+        self.background = background
+        self.keyframes = keyframes or [(0.0, 'neutral')]
+        self.duration = duration
+        self.position = position
+        self.height = height
+        self.expression = expression
+        self.gesture_time = gesture_time
+
+        self._source = background if hasattr(background, 'frame_at') else None
+        self._work = None
+        self._dirty = None  # Frame slices touched by the last blit
+
+    @property
+    def static_after(self) -> float:
+        """Time after which every frame is identical."""
+        pose_done = self.keyframes[-1][0] + self.gesture_time
+        if self._source is not None:
+            pose_done = max(pose_done, getattr(self._source, 'static_after', self.duration))
+        return min(self.duration, pose_done)
+
+    def changed_frames(self, fps: int, num_frames: int) -> np.ndarray:
+        """Frames that may differ from the one before: gestures, plus the background's changes."""
+        mask = np.zeros(num_frames, dtype=bool)
+        pose_done = min(self.duration, self.keyframes[-1][0] + self.gesture_time)
+        mask[:int(np.ceil(pose_done * fps)) + 1] = True
+        if hasattr(self._source, 'changed_frames'):
+            # E.g. a shot sequence: only its cuts change the background
+            mask |= self._source.changed_frames(fps, num_frames)
+        elif self._source is not None:
+            settled = getattr(self._source, 'static_after', self.duration)
+            mask[:int(np.ceil(settled * fps)) + 1] = True
+        return mask
+
+    def sprite_at(self, t: float) -> Sprite:
+        """Character sprite for time t."""
+        times = [time for time, _ in self.keyframes]
+        index = max(0, int(np.searchsorted(times, t, side='right')) - 1)
+        pose = self.keyframes[index][1]
+        if index > 0 and self.gesture_time > 0:
+            progress = (t - times[index]) / self.gesture_time
+            if progress < 1.0:
+                previous = self.keyframes[index - 1][1]
+                return self.character.gesture_sprite(previous, pose, float(ease_in_out(progress)),
+                                                     self.expression, self.height)
+        return self.character.sprite(pose, self.expression, self.height)
+
+    def frame_at(self, t: float) -> np.ndarray:
+        """
+        Render the frame at time t.
+
+        Returns:
+            RGB view into a reused buffer; valid until the next call
+        """
+        t = min(max(t, 0.0), self.duration)
+        if self._source is not None:
+            background = self._source.frame_at(t)
+            if self._work is None:
+                self._work = np.empty(background.shape[:2] + (3,), dtype=np.uint8)
+            self._work[...] = background[:, :, :3]
+        elif self._work is None:
+            self._work = np.ascontiguousarray(self.background[:, :, :3]).copy()
+        elif self._dirty is not None:
+            # Still background: undo only the previous sprite
+            fy, fx = self._dirty
+            self._work[fy, fx] = self.background[fy, fx, :3]
+
+        sprite = self.sprite_at(t)
+        self._dirty = sprite.bounds(self.position[0], self.position[1], self._work.shape)
+        sprite.blit(self._work, *self.position)
+        return self._work
+
+    def final_frame(self) -> np.ndarray:
+        """A copy of the last frame."""
+        return self.frame_at(self.duration).copy()
+
+    def close(self):
+        """Release the work buffer (and the background source's resources)."""
+        self._work = None
+        self._dirty = None
+        if self._source is not None and hasattr(self._source, 'close'):
+            self._source.close()
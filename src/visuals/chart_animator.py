@@ -0,0 +1,273 @@
+"""
+Chart Animator - Animated line charts rendered frame by frame on demand.
+
+An AnimatedChart is a frame source for the compositor: frame_at(t)
+returns the RGB pixels for time t, rendered into one reused Agg canvas.
+Nothing is saved to disk and memory stays constant for any length.
+
+Timeline of an animation:
+1. Draw-in: the line grows from left to right (blitted: the axes are
+   rendered once, each frame only restores that background and draws
+   the partial line)
+2. Pan/zoom (optional): the view eases into a date window. The axes
+   are the only thing that changes besides the line: each frame draws
+   their ticks and grid for the new view, and blits every tick label
+   from a cache of labels already rendered (tick labels sit on plain
+   background outside the plot, and rendering their text is most of
+   the cost of a frame)
+3. Hold: the final frame is reused as-is
+
+Annotations pop in at their cue times during any phase.
+"""
+
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+from .chart_renderer import to_plot_x
+
+
+def ease_in_out(p: np.ndarray) -> np.ndarray:
+    """Smoothstep easing on [0, 1]."""
+    p = np.clip(p, 0.0, 1.0)
+    return p * p * (3 - 2 * p)
+
+
+class AnimatedChart:
+    """Progressive line chart with pan/zoom and timed annotations."""
+
+    def __init__(
+        self,
+        scene_generator,
+        title: str,
+        data: Dict,
+        duration: float,
+        fps: int = 30,
+        zoom_window: Optional[Tuple] = None,
+        cues: Optional[List[Tuple[float, str]]] = None,
+        draw_in: float = 0.6,
+        zoom_time: float = 0.2
+    ):
+        """
+        Initialize animated chart.
+
+        Args:
+            scene_generator: SceneGenerator providing resolution and style
+            title: Chart title
+            data: Chart data with 'x' (numbers or datetime64) and 'y'/'close'
+            duration: Animation length in seconds (the last frame is held
+                for any time beyond it)
+            fps: Frame rate frames are requested at
+            zoom_window: Optional (start, end) x range to pan/zoom into
+                after the draw-in
+            cues: (time in seconds, text) annotations to pop in
+            draw_in: Fraction of the duration spent drawing the line in
+            zoom_time: Fraction of the duration spent panning/zooming
+        """
+        self.generator = scene_generator
+        self.title = title
+        self.duration = max(float(duration), 1.0 / fps)
+        self.fps = fps
+        self.cues = sorted(cues or [], key=lambda cue: cue[0])
+
+        self.x, _ = to_plot_x(data['x'])
+        self.y = np.asarray(data['y'] if 'y' in data else data['close'], dtype=np.float64)
+        self.is_date = np.issubdtype(np.asarray(data['x']).dtype, np.datetime64)
+
+        self.draw_in_end = self.duration * draw_in
+        self.zoom_start = self.draw_in_end
+        self.zoom_end = self.draw_in_end
+        self.full_limits = self._limits(self.x[0], self.x[-1])
+        self.zoom_limits = None
+        if zoom_window is not None:
+            zoom_x, _ = to_plot_x(np.asarray(zoom_window))
+            self.zoom_limits = self._limits(zoom_x[0], zoom_x[1])
+            self.zoom_end = min(self.duration, self.zoom_start + self.duration * zoom_time)
+
+        # Rendering state, created lazily on the first frame
+        self._fig = None
+        self._background = None
+        self._background_limits = None
+        self._chrome = None
+        self._tick_labels: Dict[Tuple[str, str], Tuple] = {}
+
+    def _limits(self, x0: float, x1: float) -> Tuple[float, float, float, float]:
+        """Axis limits showing the data in [x0, x1] with some headroom."""
+        mask = (self.x >= x0) & (self.x <= x1)
+        ys = self.y[mask] if mask.any() else self.y
+        pad = (ys.max() - ys.min()) * 0.08 or 1.0
+        return x0, x1, ys.min() - pad, ys.max() + pad
+
+    @property
+    def num_frames(self) -> int:
+        return max(1, int(round(self.duration * self.fps)))
+
+    @property
+    def static_after(self) -> float:
+        """Time after which every frame is identical."""
+        last_cue = self.cues[-1][0] if self.cues else 0.0
+        return min(self.duration, max(self.draw_in_end, self.zoom_end, last_cue))
+
+    def _setup(self):
+        """Build the figure and its animated artists once."""
+        g = self.generator
+        with plt.style.context('dark_background'):
+            fig, ax = g._create_figure()
+            fig.patch.set_facecolor(g.bg_color)
+            ax.set_facecolor(g.bg_color)
+            ax.set_title(self.title, fontsize=32, color=g.text_color, pad=20, fontweight='bold')
+            ax.grid(True, alpha=0.2, color=g.grid_color)
+            for side in ('top', 'right'):
+                ax.spines[side].set_visible(False)
+            for side in ('left', 'bottom'):
+                ax.spines[side].set_color(g.grid_color)
+            ax.tick_params(colors=g.text_color, labelsize=14)
+            if self.is_date:
+                ax.xaxis_date()
+            self._fig, self._ax = fig, ax
+
+            # Animated artists are skipped by canvas.draw() and drawn by hand
+            (self._line,) = ax.plot([], [], color=g.primary_color, linewidth=3, animated=True)
+            (self._head,) = ax.plot([], [], 'o', color=g.primary_color, markersize=10, animated=True)
+            self._labels = [
+                ax.text(0.05, 0.95 - i * 0.08, text, transform=ax.transAxes, fontsize=18,
+                        color=g.accent_color, verticalalignment='top', animated=True,
+                        bbox=dict(boxstyle='round', facecolor=g.bg_color, alpha=0.8, edgecolor=g.accent_color))
+                for i, (_, text) in enumerate(self.cues)
+            ]
+
+            self._set_limits(self.full_limits)
+            fig.tight_layout()
+        self._background = None
+        self._chrome = None
+        self._tick_labels = {}
+
+    def _set_axes_animated(self, animated: bool):
+        """Take the axes (ticks, labels, grid) out of canvas.draw() or put them back."""
+        self._ax.xaxis.set_animated(animated)
+        self._ax.yaxis.set_animated(animated)
+
+    def _set_limits(self, limits):
+        x0, x1, y0, y1 = limits
+        self._ax.set_xlim(x0, x1)
+        self._ax.set_ylim(y0, y1)
+
+    def _view_at(self, t: float):
+        """
+        Axis limits at time t (None while the full view is shown).
+
+        From the frame the zoom ends on, this is zoom_limits itself, so
+        hold frames take the static path.
+        """
+        if self.zoom_limits is None or t <= self.zoom_start:
+            return None
+        if int(round(t * self.fps)) >= int(round(self.zoom_end * self.fps)):
+            return self.zoom_limits
+        p = ease_in_out((t - self.zoom_start) / max(self.zoom_end - self.zoom_start, 1e-9))
+        return tuple(a + (b - a) * p for a, b in zip(self.full_limits, self.zoom_limits))
+
+    def frame_at(self, t: float) -> np.ndarray:
+        """
+        Render the frame at time t.
+
+        Returns:
+            RGB view into the reused canvas buffer; valid until the next
+            call, so consumers must encode or copy it right away
+        """
+        if self._fig is None:
+            self._setup()
+
+        t = min(max(t, 0.0), self.duration)
+        canvas = self._fig.canvas
+        view = self._view_at(t)
+
+        if view is None or view is self.zoom_limits:
+            # Static axes: render them once per view, then blit
+            limits = view or self.full_limits
+            if self._background is None or self._background_limits != limits:
+                self._set_axes_animated(False)
+                self._set_limits(limits)
+                canvas.draw()
+                self._background = canvas.copy_from_bbox(self._fig.bbox)
+                self._background_limits = limits
+            canvas.restore_region(self._background)
+        else:
+            # Limits change every frame: blit everything but the axes,
+            # whose ticks, labels and grid are redrawn for the new view
+            if self._chrome is None:
+                self._set_axes_animated(True)
+                canvas.draw()
+                self._chrome = canvas.copy_from_bbox(self._fig.bbox)
+            canvas.restore_region(self._chrome)
+            self._set_limits(view)
+            self._draw_axis(self._ax.xaxis)
+            self._draw_axis(self._ax.yaxis)
+
+        progress = 1.0 if self.draw_in_end <= 0 else min(t / self.draw_in_end, 1.0)
+        count = max(2, int(np.ceil(progress * len(self.x))))
+        self._line.set_data(self.x[:count], self.y[:count])
+        self._ax.draw_artist(self._line)
+        if progress < 1.0:
+            self._head.set_data(self.x[count - 1:count], self.y[count - 1:count])
+            self._ax.draw_artist(self._head)
+
+        for (cue_time, _), label in zip(self.cues, self._labels):
+            if t >= cue_time:
+                self._ax.draw_artist(label)
+
+        return np.asarray(canvas.buffer_rgba())[:, :, :3]
+
+    def _draw_axis(self, axis):
+        """Draw an axis's ticks and grid for the current view, blitting cached tick labels."""
+        formatter = axis.get_major_formatter()
+        if not hasattr(axis, '_update_ticks') or (hasattr(formatter, 'get_offset') and formatter.get_offset()):
+            # Offset text ('1e6') changes with the view; let matplotlib draw it all
+            self._ax.draw_artist(axis)
+            return
+
+        canvas = self._fig.canvas
+        renderer = canvas.get_renderer()
+        width, height = canvas.get_width_height()
+        is_x = axis is self._ax.xaxis
+        for tick in axis._update_ticks():
+            tick.gridline.draw(renderer)
+            tick.tick1line.draw(renderer)
+            tick.tick2line.draw(renderer)
+            label = tick.label1
+            if not label.get_visible() or not label.get_text():
+                continue
+
+            # Labels follow their tick along the axis
+            point = (tick.get_loc(), 0) if is_x else (0, tick.get_loc())
+            anchor = self._ax.transData.transform(point)[0 if is_x else 1]
+            key = (axis.axis_name, label.get_text())
+            cached = self._tick_labels.get(key)
+            if cached is not None:
+                region, drawn_at = cached
+                x0, y0, x1, y1 = region.get_extents()
+                shift = int(round(anchor - drawn_at))
+                # Region coordinates run top-down
+                dx, dy = (shift, 0) if is_x else (0, -shift)
+                if 0 <= x0 + dx and x1 + dx <= width and 0 <= y0 + dy and y1 + dy <= height:
+                    canvas.restore_region(region, (x0, y0, x1, y1), (x0 + dx, y0 + dy))
+                    continue
+            label.draw(renderer)
+            if cached is None:
+                self._tick_labels[key] = (canvas.copy_from_bbox(label.get_window_extent(renderer)), anchor)
+
+    def iter_frames(self) -> Iterator[np.ndarray]:
+        """Yield every frame of the animation in order."""
+        for n in range(self.num_frames):
+            yield self.frame_at(n / self.fps)
+
+    def final_frame(self) -> np.ndarray:
+        """A copy of the last frame (e.g. as the scene's still image)."""
+        return self.frame_at(self.duration).copy()
+
+    def close(self):
+        """Release the canvas; it is rebuilt if more frames are requested."""
+        self._fig = None
+        self._background = None
+        self._chrome = None
+        self._tick_labels = {}
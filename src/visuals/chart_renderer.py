@@ -0,0 +1,181 @@
+"""
+Chart Renderer - Vectorized financial chart layers for matplotlib.
+
+Every layer is a single collection, never one artist per candle:
+- Candle bodies: one PolyCollection
+- Wicks: one LineCollection
+- Volume bars: one PolyCollection
+- Event markers: one LineCollection per panel
+
+Vertices are built with NumPy in one shot, so thousands of candles cost
+about as much to draw as a single line.
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+import matplotlib.dates as mdates
+from matplotlib.collections import LineCollection, PolyCollection
+
+
+def to_plot_x(x: np.ndarray) -> Tuple[np.ndarray, bool]:
+    """
+    Convert x values to matplotlib's float axis.
+
+    Returns:
+        Tuple of (float x values, whether they are dates)
+    """
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        return mdates.date2num(x), True
+    return x.astype(np.float64), False
+
+
+def candle_width(x: np.ndarray, fill: float = 0.7) -> float:
+    """Body width as a fraction of the typical spacing between candles."""
+    if len(x) < 2:
+        return 1.0 * fill
+    return float(np.median(np.diff(x))) * fill
+
+
+def _bar_vertices(x: np.ndarray, bottom: np.ndarray, top: np.ndarray, width: float) -> np.ndarray:
+    """Rectangle vertices for every bar at once, shape (n, 4, 2)."""
+    left = x - width / 2
+    right = x + width / 2
+    return np.stack([
+        np.column_stack([left, bottom]),
+        np.column_stack([left, top]),
+        np.column_stack([right, top]),
+        np.column_stack([right, bottom]),
+    ], axis=1)
+
+
+def draw_candlesticks(
+    ax,
+    x: np.ndarray,
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    up_color: str,
+    down_color: str,
+    width: Optional[float] = None,
+    linewidth: float = 1.0
+) -> Tuple[PolyCollection, LineCollection]:
+    """
+    Draw OHLC candles as one body collection and one wick collection.
+
+    Args:
+        ax: Matplotlib axes
+        x: Candle x positions (matplotlib float axis, see to_plot_x)
+        open_, high, low, close: Price arrays
+        up_color: Color of candles closing at or above their open
+        down_color: Color of candles closing below their open
+        width: Body width in x units (default: 70% of the spacing)
+        linewidth: Wick line width
+
+    Returns:
+        Tuple of (bodies, wicks) collections
+    """
+    open_, high, low, close = (np.asarray(a, dtype=np.float64) for a in (open_, high, low, close))
+    width = width or candle_width(x)
+    up = close >= open_
+    colors = np.where(up, up_color, down_color)
+
+    bottom = np.minimum(open_, close)
+    top = np.maximum(open_, close)
+    # Keep doji candles visible as a thin bar
+    min_height = (np.nanmax(high) - np.nanmin(low)) * 0.001 if len(high) else 0.0
+    top = np.maximum(top, bottom + min_height)
+
+    bodies = PolyCollection(
+        _bar_vertices(x, bottom, top, width),
+        facecolors=colors, edgecolors=colors, linewidths=0.5
+    )
+    wicks = LineCollection(
+        np.stack([np.column_stack([x, low]), np.column_stack([x, high])], axis=1),
+        colors=colors, linewidths=linewidth
+    )
+
+    # Wicks under the bodies
+    ax.add_collection(wicks)
+    ax.add_collection(bodies)
+    ax.update_datalim(np.column_stack([np.concatenate([x - width, x + width]),
+                                       np.concatenate([low, high])]))
+    ax.autoscale_view()
+    return bodies, wicks
+
+
+def draw_volume(
+    ax,
+    x: np.ndarray,
+    volume: np.ndarray,
+    colors,
+    width: Optional[float] = None
+) -> PolyCollection:
+    """
+    Draw volume bars as a single PolyCollection.
+
+    Args:
+        ax: Matplotlib axes
+        x: Bar x positions (matplotlib float axis)
+        volume: Volume per bar
+        colors: One color, or one color per bar
+        width: Bar width in x units (default: 70% of the spacing)
+
+    Returns:
+        Bars collection
+    """
+    volume = np.asarray(volume, dtype=np.float64)
+    width = width or candle_width(x)
+    bars = PolyCollection(
+        _bar_vertices(x, np.zeros_like(volume), volume, width),
+        facecolors=colors, edgecolors='none', alpha=0.6
+    )
+    ax.add_collection(bars)
+    ax.update_datalim([(float(x.min() - width), 0.0), (float(x.max() + width), float(np.nanmax(volume)))])
+    ax.autoscale_view()
+    return bars
+
+
+def draw_event_markers(
+    axes: Sequence,
+    x_events: np.ndarray,
+    labels: List[str],
+    color: str,
+    fontsize: float = 14
+):
+    """
+    Mark event dates with a vertical line through every panel.
+
+    Lines are one LineCollection per panel; labels go on the top panel.
+
+    Args:
+        axes: Panels sharing the x axis (top panel first)
+        x_events: Event x positions (matplotlib float axis)
+        labels: Label per event
+        color: Marker color
+        fontsize: Label font size
+    """
+    if len(x_events) == 0:
+        return
+
+    for ax in axes:
+        segments = np.stack([
+            np.column_stack([x_events, np.zeros_like(x_events)]),
+            np.column_stack([x_events, np.ones_like(x_events)]),
+        ], axis=1)
+        # x in data coordinates, y spanning the panel
+        ax.add_collection(LineCollection(
+            segments, colors=color, linewidths=2, linestyles='--', alpha=0.8,
+            transform=ax.get_xaxis_transform()
+        ))
+
+    top = axes[0]
+    for x_event, label in zip(x_events, labels):
+        if label:
+            top.annotate(
+                label, xy=(x_event, 1.0), xycoords=('data', 'axes fraction'),
+                xytext=(6, -6), textcoords='offset points',
+                fontsize=fontsize, color=color, va='top', ha='left'
+            )
@@ -0,0 +1,500 @@
+"""
+Diagram Engine - Layout-first 2D renderer for diagram scenes.
+
+Diagrams are built in two passes:
+1. Layout: boxes, circles, connectors and text blocks are placed in
+   pixel coordinates. Text is wrapped and shrunk to fit its shape using
+   cached glyph metrics, and shapes are sized from the number of
+   elements, so nothing runs off the canvas.
+2. Raster: the layout is drawn with PIL primitives at output size.
+   Shapes and connectors are antialiased by supersampling a coverage
+   mask around each one; text is antialiased by FreeType.
+
+Layouts:
+- flow: a column of boxes, or rows in reading (snake) order past 4 boxes
+- comparison: two panels with "VS" between them
+- framework: a center circle with the other elements on a ring
+"""
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+
+# Regular / bold font candidates as (path, face index), first match wins
+FONT_CANDIDATES = {
+    False: [
+        ("/System/Library/Fonts/Helvetica.ttc", 0),
+        ("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 0),
+        ("DejaVuSans.ttf", 0),
+        ("Arial.ttf", 0),
+    ],
+    True: [
+        ("/System/Library/Fonts/Helvetica.ttc", 1),
+        ("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 0),
+        ("DejaVuSans-Bold.ttf", 0),
+        ("Arial Bold.ttf", 0),
+    ],
+}
+
+LINE_SPACING = 1.15
+
+
+@lru_cache(maxsize=None)
+def get_font(size: int, bold: bool = False) -> ImageFont.ImageFont:
+    """Load a font once per (size, weight)."""
+    for path, index in FONT_CANDIDATES[bold]:
+        try:
+            return ImageFont.truetype(path, size, index=index)
+        except OSError:
+            continue
+    try:
+        return ImageFont.load_default(size)
+    except TypeError:
+        return ImageFont.load_default()  # Pillow < 10.1: fixed size bitmap font
+
+
+@lru_cache(maxsize=65536)
+def text_width(text: str, size: int, bold: bool = False) -> float:
+    """Advance width of a string in pixels."""
+    return get_font(size, bold).getlength(text)
+
+
+@lru_cache(maxsize=None)
+def line_height(size: int, bold: bool = False) -> int:
+    """Height of one line of text, ascender to descender."""
+    font = get_font(size, bold)
+    try:
+        ascent, descent = font.getmetrics()
+        return ascent + descent
+    except AttributeError:
+        return size
+
+
+def wrap_text(
+    text: str,
+    size: int,
+    max_width: float,
+    bold: bool = False,
+    break_words: bool = True
+) -> Optional[List[str]]:
+    """
+    Greedy word wrap using cached metrics.
+
+    Words wider than max_width are broken between characters, or make
+    the wrap fail (None) when break_words is False.
+    """
+    space = text_width(" ", size, bold)
+    lines: List[str] = []
+    current, current_width = "", 0.0
+
+    for word in text.split():
+        width = text_width(word, size, bold)
+        if width > max_width and not break_words:
+            return None
+        while width > max_width and len(word) > 1:
+            # Split an overlong word at the last character that still fits
+            cut = len(word) - 1
+            while cut > 1 and text_width(word[:cut], size, bold) > max_width:
+                cut -= 1
+            if current:
+                lines.append(current)
+                current, current_width = "", 0.0
+            lines.append(word[:cut])
+            word = word[cut:]
+            width = text_width(word, size, bold)
+
+        if current and current_width + space + width <= max_width:
+            current += " " + word
+            current_width += space + width
+        else:
+            if current:
+                lines.append(current)
+            current, current_width = word, width
+
+    if current:
+        lines.append(current)
+    return lines
+
+
+def _text_height(num_lines: int, size: int, bold: bool) -> float:
+    return num_lines * line_height(size, bold) * LINE_SPACING
+
+
+def fit_text(
+    text: str,
+    max_width: float,
+    max_height: float,
+    max_size: int,
+    min_size: int,
+    bold: bool = False
+) -> Tuple[int, List[str]]:
+    """
+    Find the largest font size at which wrapped text fits a box.
+
+    Sizes that keep every word on one line win over larger sizes that
+    would break a word. If even min_size doesn't fit, the text is cut at
+    the last line that fits and ends with an ellipsis.
+
+    Returns:
+        Tuple of (font size, wrapped lines)
+    """
+    min_size = max(1, min(min_size, max_size))
+
+    # Prefer keeping words whole; break them only if nothing else fits
+    for break_words in (False, True):
+        lo, hi = min_size, max_size
+        best = None
+        while lo <= hi:
+            size = (lo + hi) // 2
+            lines = wrap_text(text, size, max_width, bold, break_words)
+            if lines is not None and _text_height(len(lines), size, bold) <= max_height:
+                best = (size, lines)
+                lo = size + 1
+            else:
+                hi = size - 1
+        if best:
+            return best
+
+    lines = wrap_text(text, min_size, max_width, bold)
+    max_lines = max(1, int(max_height // (line_height(min_size, bold) * LINE_SPACING)))
+    if len(lines) > max_lines:
+        lines = lines[:max_lines]
+        last = lines[-1]
+        while last and text_width(last + "…", min_size, bold) > max_width:
+            last = last[:-1]
+        lines[-1] = last.rstrip() + "…"
+    return min_size, lines
+
+
+@dataclass
+class Shape:
+    """Outlined rectangle or ellipse, filled with the background."""
+    kind: str  # 'rect' or 'ellipse'
+    box: Tuple[float, float, float, float]
+    outline: str
+    width: float
+    radius: float = 0.0
+
+
+@dataclass
+class Connector:
+    """Straight line between two points, optionally dashed or with an arrowhead."""
+    start: Tuple[float, float]
+    end: Tuple[float, float]
+    color: str
+    width: float
+    arrow: bool = False
+    dashed: bool = False
+
+
+@dataclass
+class TextBlock:
+    """Wrapped lines centered on a point."""
+    lines: List[str]
+    size: int
+    center: Tuple[float, float]
+    color: str
+    bold: bool = False
+
+
+@dataclass
+class DiagramLayout:
+    """Everything needed to rasterize a diagram, in output pixels."""
+    shapes: List[Shape] = field(default_factory=list)
+    connectors: List[Connector] = field(default_factory=list)
+    texts: List[TextBlock] = field(default_factory=list)
+
+
+class DiagramEngine:
+    """Lay out and rasterize diagram scenes without matplotlib."""
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        palette: Dict[str, str],
+        scale: Optional[float] = None,
+        supersample: int = 2
+    ):
+        """
+        Initialize diagram engine.
+
+        Args:
+            width: Output width in pixels
+            height: Output height in pixels
+            palette: Colors with keys 'bg', 'primary', 'secondary',
+                'accent', 'text' and 'grid'
+            scale: Size multiplier for a 1080px reference layout
+                (default: min(width, height) / 1080)
+            supersample: Shape coverage masks are drawn at this multiple
+                and reduced (1 = no antialiasing, fastest)
+        """
+        self.width = width
+        self.height = height
+        self.palette = palette
+        self.scale = scale or min(width, height) / 1080
+        self.supersample = max(1, supersample)
+
+    def _px(self, value: float) -> float:
+        return value * self.scale
+
+    def _font_px(self, value: float) -> int:
+        return max(6, int(round(value * self.scale)))
+
+    def _add_text(self, layout: DiagramLayout, text: str, box: Tuple[float, float, float, float],
+                  max_size: float, min_size: float, color: str, bold: bool = False):
+        """Fit text into a box and add it to the layout."""
+        x0, y0, x1, y1 = box
+        if not text or x1 <= x0 or y1 <= y0:
+            return
+        size, lines = fit_text(text, x1 - x0, y1 - y0, self._font_px(max_size), self._font_px(min_size), bold)
+        layout.texts.append(TextBlock(lines, size, ((x0 + x1) / 2, (y0 + y1) / 2), color, bold))
+
+    def layout(self, diagram_type: str, title: str, elements: List[str]) -> DiagramLayout:
+        """
+        Compute the layout of a diagram.
+
+        Args:
+            diagram_type: 'flow', 'comparison' or 'framework'
+            title: Diagram title
+            elements: Element labels
+
+        Returns:
+            DiagramLayout in output pixel coordinates
+        """
+        layout = DiagramLayout()
+        margin = self._px(60)
+
+        # Title band at the top; the rest of the canvas is the content area
+        title_box = (margin, margin * 0.75, self.width - margin, margin * 0.75 + self._px(140))
+        size, lines = fit_text(title, title_box[2] - title_box[0], title_box[3] - title_box[1],
+                               self._font_px(64), self._font_px(30), bold=True)
+        title_height = _text_height(len(lines), size, True)
+        layout.texts.append(TextBlock(lines, size, (self.width / 2, title_box[1] + title_height / 2),
+                                      self.palette['primary'], bold=True))
+
+        area = (margin, title_box[1] + title_height + self._px(50), self.width - margin, self.height - margin)
+        elements = [e for e in elements if e]
+
+        if diagram_type == "comparison":
+            self._layout_comparison(layout, elements, area)
+        elif diagram_type == "framework" and len(elements) >= 3:
+            self._layout_framework(layout, elements, area)
+        else:
+            self._layout_flow(layout, elements, area)
+        return layout
+
+    def _layout_flow(self, layout: DiagramLayout, elements: List[str], area):
+        """Boxes joined by arrows: one column up to 4 boxes, snake rows beyond."""
+        n = len(elements)
+        if not n:
+            return
+        x0, y0, x1, y1 = area
+        area_w, area_h = x1 - x0, y1 - y0
+
+        if n <= 4:
+            rows, cols = n, 1
+            gap_x, gap_y = 0.0, self._px(60)
+            box_w = min(area_w * 0.6, self._px(1000))
+        else:
+            rows = -(-n // 4)
+            cols = -(-n // rows)
+            gap_x, gap_y = self._px(90), self._px(80)
+            box_w = (area_w - (cols - 1) * gap_x) / cols
+        box_h = min(self._px(150), (area_h - (rows - 1) * gap_y) / rows)
+
+        # Center the grid in the content area
+        grid_w = cols * box_w + (cols - 1) * gap_x
+        grid_h = rows * box_h + (rows - 1) * gap_y
+        left = x0 + (area_w - grid_w) / 2
+        top = y0 + (area_h - grid_h) / 2
+        pad = self._px(20)
+
+        boxes = []
+        for i, element in enumerate(elements):
+            row, col = divmod(i, cols)
+            if row % 2:
+                col = cols - 1 - col  # Odd rows run right to left
+            bx = left + col * (box_w + gap_x)
+            by = top + row * (box_h + gap_y)
+            box = (bx, by, bx + box_w, by + box_h)
+            boxes.append(box)
+            layout.shapes.append(Shape('rect', box, self.palette['primary'], self._px(3), radius=self._px(16)))
+            self._add_text(layout, element, (bx + pad, by + pad / 2, bx + box_w - pad, by + box_h - pad / 2),
+                           max_size=34, min_size=14, color=self.palette['text'])
+
+        arrow_gap = self._px(10)
+        for a, b in zip(boxes, boxes[1:]):
+            if abs(a[1] - b[1]) < 1:
+                # Same row: edge to edge horizontally
+                y = (a[1] + a[3]) / 2
+                if b[0] > a[0]:
+                    start, end = (a[2] + arrow_gap, y), (b[0] - arrow_gap, y)
+                else:
+                    start, end = (a[0] - arrow_gap, y), (b[2] + arrow_gap, y)
+            else:
+                x = (a[0] + a[2]) / 2
+                start, end = (x, a[3] + arrow_gap), (x, b[1] - arrow_gap)
+            layout.connectors.append(Connector(start, end, self.palette['accent'], self._px(4), arrow=True))
+
+    def _layout_comparison(self, layout: DiagramLayout, elements: List[str], area):
+        """Two outlined panels with VS between them."""
+        elements = (elements[:2] + [''] * 2)[:2]
+        x0, y0, x1, y1 = area
+        center_x = (x0 + x1) / 2
+        gap = self._px(110)
+        panel_h = min(y1 - y0, self._px(560))
+        top = y0 + (y1 - y0 - panel_h) / 2
+        pad = self._px(36)
+
+        panels = [
+            ((x0, top, center_x - gap, top + panel_h), self.palette['secondary']),
+            ((center_x + gap, top, x1, top + panel_h), self.palette['accent']),
+        ]
+        for (box, color), element in zip(panels, elements):
+            layout.shapes.append(Shape('rect', box, color, self._px(3), radius=self._px(24)))
+            self._add_text(layout, element, (box[0] + pad, box[1] + pad, box[2] - pad, box[3] - pad),
+                           max_size=48, min_size=18, color=self.palette['text'])
+
+        vs_size = self._font_px(64)
+        layout.texts.append(TextBlock(["VS"], vs_size, (center_x, top + panel_h / 2),
+                                      self.palette['primary'], bold=True))
+
+    def _layout_framework(self, layout: DiagramLayout, elements: List[str], area):
+        """Center circle with the remaining elements evenly spaced on a ring."""
+        x0, y0, x1, y1 = area
+        cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+        outer = min(x1 - x0, y1 - y0) / 2
+        m = len(elements) - 1
+
+        # Satellites as large as possible without touching their neighbours
+        k = np.sin(np.pi / m) / 1.15
+        r = min(outer * k / (1 + k), outer * 0.3, self._px(150))
+        ring = outer - r
+        rc = min(ring - r - self._px(30), self._px(170))
+
+        def inner_box(x, y, radius):
+            half = radius * 0.68  # Square inscribed in the circle, with a margin
+            return (x - half, y - half, x + half, y + half)
+
+        angles = -np.pi / 2 + np.arange(m) * 2 * np.pi / m
+        for angle, element in zip(angles, elements[1:]):
+            x, y = cx + ring * np.cos(angle), cy + ring * np.sin(angle)
+            # Dashed spoke between the circle edges
+            ux, uy = np.cos(angle), np.sin(angle)
+            layout.connectors.append(Connector(
+                (cx + ux * rc, cy + uy * rc), (x - ux * r, y - uy * r),
+                self.palette['grid'], self._px(2), dashed=True
+            ))
+            layout.shapes.append(Shape('ellipse', (x - r, y - r, x + r, y + r), self.palette['accent'], self._px(2)))
+            self._add_text(layout, element, inner_box(x, y, r), max_size=30, min_size=12, color=self.palette['text'])
+
+        layout.shapes.append(Shape('ellipse', (cx - rc, cy - rc, cx + rc, cy + rc), self.palette['primary'], self._px(3)))
+        self._add_text(layout, elements[0], inner_box(cx, cy, rc), max_size=36, min_size=14,
+                       color=self.palette['text'], bold=True)
+
+    def render(self, layout: DiagramLayout) -> np.ndarray:
+        """
+        Rasterize a layout.
+
+        Returns:
+            RGB pixels (height, width, 3)
+        """
+        img = Image.new('RGB', (self.width, self.height), self.palette['bg'])
+
+        # Connectors first, so shapes cover their ends
+        for c in layout.connectors:
+            pad = c.width * 4
+            bbox = (min(c.start[0], c.end[0]) - pad, min(c.start[1], c.end[1]) - pad,
+                    max(c.start[0], c.end[0]) + pad, max(c.start[1], c.end[1]) + pad)
+            self._stamp(img, bbox, c.color, lambda draw, xy, s, c=c: self._draw_connector(draw, c, xy, s))
+
+        for shape in layout.shapes:
+            pad = shape.width
+            bbox = (shape.box[0] - pad, shape.box[1] - pad, shape.box[2] + pad, shape.box[3] + pad)
+            # Background fill hides connectors underneath, then the outline
+            self._stamp(img, bbox, self.palette['bg'], lambda draw, xy, s, shape=shape: self._draw_shape(draw, shape, xy, s, fill=True))
+            self._stamp(img, bbox, shape.outline, lambda draw, xy, s, shape=shape: self._draw_shape(draw, shape, xy, s, fill=False))
+
+        # FreeType text is already antialiased: draw it at output size
+        draw = ImageDraw.Draw(img)
+        for block in layout.texts:
+            font = get_font(block.size, block.bold)
+            step = line_height(block.size, block.bold) * LINE_SPACING
+            cx, cy = block.center
+            y = cy - step * (len(block.lines) - 1) / 2
+            for line in block.lines:
+                draw.text((cx, y), line, fill=block.color, font=font, anchor='mm')
+                y += step
+
+        return np.asarray(img)
+
+    def _stamp(self, img: Image.Image, bbox, color: str, draw_fn):
+        """
+        Composite one antialiased primitive onto the image.
+
+        draw_fn draws with fill 255 into a coverage mask covering only
+        bbox at supersample scale; the mask is reduced and used to paste
+        a solid color, so the full frame is never supersampled.
+        """
+        s = self.supersample
+        x0 = max(0, int(np.floor(bbox[0])))
+        y0 = max(0, int(np.floor(bbox[1])))
+        x1 = min(self.width, int(np.ceil(bbox[2])) + 1)
+        y1 = min(self.height, int(np.ceil(bbox[3])) + 1)
+        if x1 <= x0 or y1 <= y0:
+            return
+
+        mask = Image.new('L', ((x1 - x0) * s, (y1 - y0) * s), 0)
+
+        def xy(x, y):
+            return ((x - x0) * s, (y - y0) * s)
+
+        draw_fn(ImageDraw.Draw(mask), xy, s)
+        if s > 1:
+            mask = mask.reduce(s)
+        img.paste(color, (x0, y0, x1, y1), mask)
+
+    def _draw_shape(self, draw: ImageDraw.ImageDraw, shape: Shape, xy, s: int, fill: bool):
+        """Draw a shape's interior or outline into a coverage mask."""
+        box = [*xy(shape.box[0], shape.box[1]), *xy(shape.box[2], shape.box[3])]
+        width = max(1, int(round(shape.width * s)))
+        if fill:
+            kwargs = dict(fill=255)
+        else:
+            kwargs = dict(outline=255, width=width)
+        if shape.kind == 'ellipse':
+            draw.ellipse(box, **kwargs)
+        else:
+            draw.rounded_rectangle(box, radius=shape.radius * s, **kwargs)
+
+    def _draw_connector(self, draw: ImageDraw.ImageDraw, c: Connector, xy, s: int):
+        """Draw a solid or dashed line, with an arrowhead at the end if requested."""
+        start = np.array(xy(*c.start))
+        end = np.array(xy(*c.end))
+        width = max(1, int(round(c.width * s)))
+        vector = end - start
+        length = float(np.hypot(*vector))
+        if length < 1:
+            return
+        direction = vector / length
+
+        head = 0.0
+        if c.arrow:
+            head = min(width * 4.0, length / 2)
+            base = end - direction * head
+            normal = np.array([-direction[1], direction[0]]) * head * 0.6
+            draw.polygon([tuple(end), tuple(base + normal), tuple(base - normal)], fill=255)
+
+        if c.dashed:
+            dash = width * 5.0
+            for d in np.arange(0, max(length - head, 0), dash * 2):
+                a = start + direction * d
+                b = start + direction * min(d + dash, length - head)
+                draw.line([tuple(a), tuple(b)], fill=255, width=width)
+        else:
+            draw.line([tuple(start), tuple(end - direction * head)], fill=255, width=width)
@@ -0,0 +1,325 @@
+"""
+HTML Cards - Tweet, headline and quote scenes rendered from Jinja templates.
+
+Cards are laid out by headless Chromium (Playwright), so they get real
+text shaping, emoji and CSS. Instead of one browser launch per card:
+- The browser is launched once and a small pool of pages is kept open
+- Each page load holds a batch of cards stacked vertically and is
+  captured with a single screenshot, then split into frames
+- HTML goes in with set_content(), no temp files
+- Templates are compiled once by a shared Jinja environment
+
+Extra or replacement templates can be dropped into a template directory
+as <kind>.html; they are rendered with the card's fields plus `palette`.
+"""
+
+import asyncio
+import io
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+# Card fragments; each is placed inside a full-frame <section class="frame">
+CARD_TEMPLATES = {
+    'tweet': """
+<div class="card tweet">
+  <div class="author">
+    <div class="avatar">{{ (name or handle or '?')[:1] | upper }}</div>
+    <div>
+      <div class="name">{{ name }}</div>
+      <div class="handle">@{{ handle }}</div>
+    </div>
+  </div>
+  <div class="body">{{ text }}</div>
+  {% if timestamp %}<div class="meta">{{ timestamp }}</div>{% endif %}
+</div>
+""",
+    'headline': """
+<div class="card headline">
+  {% if source %}<div class="source">{{ source }}</div>{% endif %}
+  {% for line in headlines %}
+  <div class="item{% if loop.first %} lead{% endif %}">{{ line }}</div>
+  {% endfor %}
+  {% if date %}<div class="meta">{{ date }}</div>{% endif %}
+</div>
+""",
+    'quote': """
+<div class="card quote">
+  <div class="mark">&ldquo;</div>
+  <div class="body">{{ text }}</div>
+  {% if author %}<div class="author">&mdash; {{ author }}</div>{% endif %}
+</div>
+""",
+}
+
+DOCUMENT_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<style>
+  html, body { margin: 0; padding: 0; background: {{ palette.bg }}; }
+  .frame {
+    width: {{ width }}px; height: {{ height }}px; overflow: hidden;
+    display: flex; align-items: center; justify-content: center;
+    background: {{ palette.bg }}; color: {{ palette.text }};
+    font-family: -apple-system, "Helvetica Neue", Helvetica, "DejaVu Sans", Arial, sans-serif;
+  }
+  .card { box-sizing: border-box; max-width: 1400px; max-height: 960px; overflow: hidden; }
+  .meta { color: #8b98a5; font-size: 30px; margin-top: 36px; }
+
+  .tweet { width: 1100px; padding: 56px 64px; background: #15181c;
+           border: 2px solid {{ palette.grid }}; border-radius: 32px; }
+  .tweet .author { display: flex; align-items: center; gap: 28px; }
+  .tweet .avatar { width: 96px; height: 96px; border-radius: 50%; background: {{ palette.accent }};
+                   color: {{ palette.bg }}; font-size: 52px; font-weight: 700;
+                   display: flex; align-items: center; justify-content: center; }
+  .tweet .name { font-size: 40px; font-weight: 700; }
+  .tweet .handle { font-size: 32px; color: #8b98a5; }
+  .tweet .body { font-size: 52px; line-height: 1.3; margin-top: 40px; }
+
+  .headline { width: 1400px; padding: 0 40px; }
+  .headline .source { font-size: 30px; font-weight: 700; letter-spacing: 6px;
+                      text-transform: uppercase; color: {{ palette.secondary }}; margin-bottom: 28px; }
+  .headline .item { font-size: 56px; font-weight: 700; line-height: 1.2; padding: 24px 0;
+                    border-top: 2px solid {{ palette.grid }}; }
+  .headline .item.lead { font-size: 84px; color: {{ palette.primary }}; border-top: none; }
+
+  .quote { width: 1300px; text-align: center; }
+  .quote .mark { font-size: 220px; line-height: 0.6; color: {{ palette.primary }}; font-family: Georgia, serif; }
+  .quote .body { font-size: 68px; line-height: 1.3; font-style: italic; }
+  .quote .author { font-size: 40px; color: {{ palette.accent }}; margin-top: 40px; }
+</style>
+</head>
+<body>
+{% for card in cards %}<section class="frame">{{ card | safe }}</section>
+{% endfor %}
+</body>
+</html>
+"""
+
+
+class BrowserPool:
+    """A long-lived headless Chromium with a fixed set of open pages."""
+
+    # Chromium's screenshot surface limit, in device pixels
+    MAX_CAPTURE_HEIGHT = 16384
+
+    def __init__(self, viewport: Tuple[int, int], size: int = 2, device_scale_factor: float = 1.0):
+        """
+        Initialize browser pool. The browser starts on first use.
+
+        Args:
+            viewport: Page viewport (width, height) in CSS pixels
+            size: Number of pages rendering concurrently
+            device_scale_factor: Device pixels per CSS pixel
+        """
+        try:
+            from playwright.async_api import async_playwright
+            self._async_playwright = async_playwright
+        except ImportError:
+            raise ImportError(
+                "Playwright not installed: pip install playwright && playwright install chromium"
+            )
+
+        self.viewport = viewport
+        self.size = max(1, size)
+        self.device_scale_factor = device_scale_factor
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._playwright = None
+        self._browser = None
+        self._pages = []
+
+    async def _start(self):
+        self._playwright = await self._async_playwright().start()
+        self._browser = await self._playwright.chromium.launch()
+        context = await self._browser.new_context(
+            viewport={'width': self.viewport[0], 'height': self.viewport[1]},
+            device_scale_factor=self.device_scale_factor
+        )
+        self._pages = [await context.new_page() for _ in range(self.size)]
+
+    async def _capture(self, page, html: str) -> bytes:
+        await page.set_content(html, wait_until='load')
+        await page.evaluate("document.fonts.ready.then(() => true)")
+        return await page.screenshot(full_page=True, type='png')
+
+    async def _capture_all(self, documents: List[str]) -> List[bytes]:
+        queue = asyncio.Queue()
+        for i, html in enumerate(documents):
+            queue.put_nowait((i, html))
+        results: List[Optional[bytes]] = [None] * len(documents)
+        errors: List[Exception] = []
+
+        async def worker(page):
+            # Stop every page at the first failure, but let each finish its
+            # current capture so no task is left running on the loop
+            while not queue.empty() and not errors:
+                i, html = queue.get_nowait()
+                try:
+                    results[i] = await self._capture(page, html)
+                except Exception as e:
+                    errors.append(e)
+
+        await asyncio.gather(*(worker(page) for page in self._pages))
+        if errors:
+            raise errors[0]
+        return results
+
+    def screenshot(self, documents: List[str]) -> List[bytes]:
+        """
+        Render HTML documents as full-page PNG screenshots.
+
+        Documents are spread over the pool's pages and load concurrently.
+
+        Args:
+            documents: Complete HTML documents
+
+        Returns:
+            PNG bytes per document, in order
+
+        Raises:
+            RuntimeError: If the browser cannot be started or a page fails
+                to load or capture (the browser is then shut down, so the
+                next call starts a fresh one)
+        """
+        if self._loop is None:
+            loop = asyncio.new_event_loop()
+            try:
+                loop.run_until_complete(self._start())
+            except Exception as e:
+                if self._playwright is not None:
+                    loop.run_until_complete(self._playwright.stop())
+                    self._playwright = None
+                loop.close()
+                raise RuntimeError(f"Could not start Chromium ({str(e).splitlines()[0]}): "
+                                   "run `playwright install chromium`") from e
+            self._loop = loop
+        try:
+            return self._loop.run_until_complete(self._capture_all(documents))
+        except Exception as e:
+            # A crashed or hung page can leave the browser unusable
+            try:
+                self.close()
+            except Exception:
+                self._loop = None
+                self._pages = []
+            raise RuntimeError(f"Card capture failed ({str(e).splitlines()[0] if str(e) else type(e).__name__})") from e
+
+    def close(self):
+        """Close the browser and its event loop."""
+        if self._loop is None:
+            return
+
+        async def stop():
+            await self._browser.close()
+            await self._playwright.stop()
+
+        try:
+            self._loop.run_until_complete(stop())
+        finally:
+            self._loop.close()
+            self._loop = None
+            self._pages = []
+
+
+class CardRenderer:
+    """Render card scenes from Jinja templates through a BrowserPool."""
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        palette: Dict[str, str],
+        scale: float = 1.0,
+        template_dir: Optional[str] = None,
+        pool_size: int = 2
+    ):
+        """
+        Initialize card renderer.
+
+        Cards are laid out on a CSS canvas of (width, height) / scale
+        (1920x1080 for 16:9) and captured at the output resolution.
+
+        Args:
+            width: Scene width in pixels
+            height: Scene height in pixels
+            palette: Colors ('bg', 'primary', 'secondary', 'accent', 'text', 'grid')
+            scale: Output pixels per CSS pixel
+            template_dir: Directory with extra/override <kind>.html templates
+            pool_size: Browser pages rendering concurrently
+        """
+        try:
+            import jinja2
+        except ImportError:
+            raise ImportError("Jinja2 not installed: pip install jinja2")
+
+        loaders = [jinja2.DictLoader({f"{kind}.html": source for kind, source in CARD_TEMPLATES.items()})]
+        if template_dir:
+            loaders.insert(0, jinja2.FileSystemLoader(template_dir))
+        # The environment compiles each template once and caches it
+        self.env = jinja2.Environment(loader=jinja2.ChoiceLoader(loaders), autoescape=True)
+        self.document = self.env.from_string(DOCUMENT_TEMPLATE)
+
+        self.width, self.height = width, height
+        self.palette = palette
+        self.scale = scale
+        self.css_size = (int(round(width / scale)), int(round(height / scale)))
+        self.pool_size = pool_size
+        self._pool: Optional[BrowserPool] = None
+
+    @property
+    def kinds(self) -> List[str]:
+        """Available card kinds."""
+        return sorted(name[:-len(".html")] for name in self.env.list_templates() if name.endswith(".html"))
+
+    def render_html(self, cards: List[Tuple[str, Dict]]) -> str:
+        """Render cards into one HTML document, one full frame per card."""
+        fragments = [
+            self.env.get_template(f"{kind}.html").render(palette=self.palette, **fields)
+            for kind, fields in cards
+        ]
+        return self.document.render(
+            cards=fragments, palette=self.palette, width=self.css_size[0], height=self.css_size[1]
+        )
+
+    def render_batch(self, cards: List[Tuple[str, Dict]]) -> List[np.ndarray]:
+        """
+        Render cards to RGB frames.
+
+        Args:
+            cards: (kind, fields) per card, e.g. ('quote', {'text': ..., 'author': ...})
+
+        Returns:
+            RGB frame (height, width, 3) per card, in order
+        """
+        from PIL import Image
+
+        if not cards:
+            return []
+        if self._pool is None:
+            self._pool = BrowserPool(self.css_size, size=self.pool_size, device_scale_factor=self.scale)
+
+        # As many frames per page load as fit in one screenshot
+        per_document = max(1, BrowserPool.MAX_CAPTURE_HEIGHT // self.height)
+        batches = [cards[i:i + per_document] for i in range(0, len(cards), per_document)]
+        shots = self._pool.screenshot([self.render_html(batch) for batch in batches])
+
+        frames = []
+        for batch, png in zip(batches, shots):
+            with Image.open(io.BytesIO(png)) as shot:
+                shot = shot.convert('RGB')
+                # Fractional scale factors can be off by a pixel
+                size = (self.width, self.height * len(batch))
+                if shot.size != size:
+                    shot = shot.resize(size, Image.LANCZOS)
+                strip = np.asarray(shot)
+            frames.extend(strip[i * self.height:(i + 1) * self.height] for i in range(len(batch)))
+        return frames
+
+    def close(self):
+        """Shut down the browser pool."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
@@ -6,26 +6,64 @@ Generates:
 - Diagram scenes (frameworks, flow diagrams)
 - Text scenes (title cards, quotes)
 - Split screen scenes (comparisons)
+- Character scenes (stickman narrator)
+- Card scenes (tweets, headlines, quotes from HTML templates)
 """
 
 import numpy as np
 import matplotlib.pyplot as plt
-import matplotlib.patches as patches
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 from matplotlib.path import Path as MplPath
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+import os
 import re
 
+from .chart_animator import AnimatedChart
+from .chart_renderer import draw_candlesticks, draw_event_markers, draw_volume, to_plot_x
+from .character import Character, CharacterAnimation
+from .diagram_engine import DiagramEngine, fit_text, get_font, line_height, LINE_SPACING
+from .html_cards import CardRenderer
+from utils.scratch import partial_path
+
 
 class SceneGenerator:
     """Generate visual scenes for video production."""
 
-    def __init__(self, output_dir: str = "output/scenes", resolution: Tuple[int, int] = (1920, 1080)):
+    # Layouts are designed against a 1080px short side; everything else scales
+    REFERENCE_HEIGHT = 1080
+
+    def __init__(
+        self,
+        output_dir: str = "output/scenes",
+        resolution: Tuple[int, int] = (1920, 1080),
+        write_files: bool = True
+    ):
+        """
+        Initialize scene generator.
+
+        Every scene is kept in memory as a raw RGB(A) buffer (see
+        get_frame()) that the compositor consumes directly. PNG files are
+        only written when write_files is set, on a background thread, so
+        PNG encoding never sits on the render path.
+
+        Args:
+            output_dir: Directory for scene PNGs
+            resolution: Scene resolution (width, height)
+            write_files: Also write each scene to a PNG file
+        """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.width, self.height = resolution
 
+        # Render natively at the target resolution (no full-HD render + downscale)
+        self.scale = min(self.width, self.height) / self.REFERENCE_HEIGHT
+        self.dpi = 100 * self.scale
+        self.figsize = (self.width / self.dpi, self.height / self.dpi)
+
         # Style settings
         self.bg_color = '#0a0a0a'  # Dark background
         self.primary_color = '#FFD700'  # Gold
@@ -34,12 +72,114 @@ class SceneGenerator:
         self.text_color = '#FFFFFF'  # White
         self.grid_color = '#2a2a2a'  # Dark gray
 
+        self.diagram_engine = DiagramEngine(self.width, self.height, {
+            'bg': self.bg_color,
+            'primary': self.primary_color,
+            'secondary': self.secondary_color,
+            'accent': self.accent_color,
+            'text': self.text_color,
+            'grid': self.grid_color,
+        }, scale=self.scale)
+
+        # Narrator character; pose sprites are rendered once and cached
+        self.character = Character(color=self.primary_color)
+        self.narrator_height = int(self.height * 0.32)
+        self.narrator_position = (int(self.width - self.narrator_height * 0.35), int(self.height * 0.98))
+
+        # HTML card renderer; starts a headless browser on first use
+        self._cards: Optional[CardRenderer] = None
+
+        # Rendered scene buffers, keyed by output path
+        self.write_files = write_files
+        self.frames: Dict[str, np.ndarray] = {}
+        self._writer: Optional[ThreadPoolExecutor] = None
+        self._pending_writes: List[Future] = []
+
     def _create_base_image(self, bg_color: Optional[str] = None) -> Image.Image:
         """Create base image with background."""
         bg = bg_color or self.bg_color
         img = Image.new('RGB', (self.width, self.height), bg)
         return img
 
+    def _create_figure(self, rows: int = 1, height_ratios: Optional[List[float]] = None):
+        """
+        Create an off-screen Agg figure at the scene resolution.
+
+        Returns (fig, ax) for a single panel, or (fig, [axes]) with panels
+        stacked on a shared x axis when rows > 1.
+        """
+        fig = Figure(figsize=self.figsize, dpi=self.dpi)
+        FigureCanvasAgg(fig)
+        if rows == 1:
+            return fig, fig.add_subplot()
+        axes = fig.subplots(rows, 1, sharex=True, gridspec_kw={'height_ratios': height_ratios})
+        return fig, list(axes)
+
+    def _figure_buffer(self, fig) -> np.ndarray:
+        """Rasterize a figure and return its RGBA pixels as a view (no copy)."""
+        fig.canvas.draw()
+        return np.asarray(fig.canvas.buffer_rgba())
+
+    def _finish_scene(self, frame: np.ndarray, output_path) -> str:
+        """
+        Register a rendered scene buffer and queue its PNG write.
+
+        Args:
+            frame: RGB(A) pixel buffer (height, width, channels)
+            output_path: Path the scene is (or would be) saved to
+
+        Returns:
+            Output path, used as the scene's key
+        """
+        output_path = str(output_path)
+        self.frames[output_path] = frame
+
+        if self.write_files:
+            if self._writer is None:
+                self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scene-png")
+            self._pending_writes.append(self._writer.submit(self._write_png, frame, output_path))
+
+        return output_path
+
+    @staticmethod
+    def _write_png(frame: np.ndarray, output_path: str):
+        """Write a scene PNG via a temporary file, so a crash never leaves a torn one."""
+        partial = partial_path(output_path)
+        Image.fromarray(frame).save(partial, format='PNG')
+        os.replace(partial, output_path)
+
+    def get_frame(self, scene_path: str) -> Optional[np.ndarray]:
+        """Return the in-memory buffer of a rendered scene, if available."""
+        return self.frames.get(str(scene_path))
+
+    def load_scene(self, scene_path: str) -> str:
+        """Load a previously written scene PNG back into memory (no re-render)."""
+        scene_path = str(scene_path)
+        with Image.open(scene_path) as image:
+            self.frames[scene_path] = np.asarray(image.convert('RGBA' if 'A' in image.getbands() else 'RGB'))
+        return scene_path
+
+    def release_frames(self):
+        """Drop all in-memory scene buffers."""
+        self.frames.clear()
+
+    def flush(self):
+        """Wait for queued PNG writes to finish (re-raises write errors)."""
+        pending, self._pending_writes = self._pending_writes, []
+        for future in pending:
+            future.result()
+
+    def close(self):
+        """Wait for PNG writes and shut down the card browser, if running."""
+        self.flush()
+        if self._cards is not None:
+            self._cards.close()
+            self._cards = None
+
+    def _font_size(self, size: int) -> int:
+        """Scale a font size designed for 1080p to the current resolution."""
+        return max(8, int(round(size * self.scale)))
+
     def generate_title_card(
         self,
         title: str,
@@ -62,8 +202,8 @@ class SceneGenerator:
 
         # Try to use a nice font, fall back to default
         try:
-            title_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 120)
-            subtitle_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 60)
+            title_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", self._font_size(120))
+            subtitle_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", self._font_size(60))
         except:
             title_font = ImageFont.load_default()
             subtitle_font = ImageFont.load_default()
@@ -73,7 +213,7 @@ class SceneGenerator:
         title_w = title_bbox[2] - title_bbox[0]
         title_h = title_bbox[3] - title_bbox[1]
         title_x = (self.width - title_w) // 2
-        title_y = (self.height - title_h) // 2 - 50
+        title_y = (self.height - title_h) // 2 - int(50 * self.scale)
 
         draw.text((title_x, title_y), title, fill=self.primary_color, font=title_font)
 
@@ -82,16 +222,14 @@ class SceneGenerator:
             subtitle_bbox = draw.textbbox((0, 0), subtitle, font=subtitle_font)
             subtitle_w = subtitle_bbox[2] - subtitle_bbox[0]
             subtitle_x = (self.width - subtitle_w) // 2
-            subtitle_y = title_y + title_h + 40
+            subtitle_y = title_y + title_h + int(40 * self.scale)
 
             draw.text((subtitle_x, subtitle_y), subtitle, fill=self.text_color, font=subtitle_font)
 
-        # Save
         if not output_path:
             output_path = self.output_dir / "title_card.png"
-        img.save(output_path)
 
-        return str(output_path)
+        return self._finish_scene(np.asarray(img), output_path)
 
     def generate_chart_scene(
         self,
@@ -99,53 +237,93 @@ class SceneGenerator:
         data: Optional[Dict] = None,
         annotations: Optional[List[str]] = None,
         output_path: Optional[str] = None,
-        chart_type: str = "line"
+        chart_type: str = "line",
+        panels: Optional[List[str]] = None
     ) -> str:
         """
         Generate a chart scene (Bitcoin price chart, etc.).
 
         Args:
             title: Chart title
-            data: Chart data (if None, generates placeholder)
+            data: Chart data (if None, generates placeholder). Keys:
+                'x' (numbers or datetime64), 'y' or 'close', optional
+                'open'/'high'/'low' for candles, one array per extra panel
+                (e.g. 'volume', 'funding', 'open_interest'), and 'events'
+                as a list of (x, label) markers
             annotations: Text annotations to overlay
             output_path: Output file path
             chart_type: Type of chart ('line', 'candlestick', 'area')
+            panels: Stacked panels sharing the x axis, top first, e.g.
+                ['price', 'volume', 'open_interest']. Defaults to price,
+                plus volume for candlestick charts when available.
 
         Returns:
             Path to generated image
         """
+        # Generate placeholder data if none provided
+        if data is None:
+            data = self._placeholder_chart_data(ohlc=chart_type == "candlestick")
+
+        if panels is None:
+            panels = ['price']
+            if chart_type == "candlestick" and 'volume' in data:
+                panels.append('volume')
+        panels = [p for p in panels if p == 'price' or p in data]
+
         with plt.style.context('dark_background'):
-            fig, ax = plt.subplots(figsize=(19.2, 10.8), dpi=100)
+            fig, axes = self._create_figure(rows=len(panels), height_ratios=[3] + [1] * (len(panels) - 1))
+            if len(panels) == 1:
+                axes = [axes]
             fig.patch.set_facecolor(self.bg_color)
-            ax.set_facecolor(self.bg_color)
+            ax = axes[0]
 
-            # Generate placeholder data if none provided
-            if data is None:
-                x = np.arange(0, 100)
-                y = 90000 + np.cumsum(np.random.randn(100) * 1000)
-                data = {'x': x, 'y': y, 'label': 'BTC Price'}
+            x, is_date = to_plot_x(data['x'])
+            y = data['y'] if 'y' in data else data['close']
 
             # Plot based on chart type
-            if chart_type == "line":
-                ax.plot(data['x'], data['y'], color=self.primary_color, linewidth=3, label=data.get('label', ''))
+            if chart_type == "candlestick" and all(k in data for k in ('open', 'high', 'low', 'close')):
+                draw_candlesticks(ax, x, data['open'], data['high'], data['low'], data['close'],
+                                  up_color=self.accent_color, down_color=self.secondary_color)
             elif chart_type == "area":
-                ax.fill_between(data['x'], data['y'], alpha=0.3, color=self.primary_color)
-                ax.plot(data['x'], data['y'], color=self.primary_color, linewidth=2)
+                ax.fill_between(x, y, alpha=0.3, color=self.primary_color)
+                ax.plot(x, y, color=self.primary_color, linewidth=2)
+            else:
+                ax.plot(x, y, color=self.primary_color, linewidth=3, label=data.get('label', ''))
+
+            for panel_ax, panel in zip(axes[1:], panels[1:]):
+                if panel == 'volume':
+                    colors = self.grid_color
+                    if 'open' in data:
+                        colors = np.where(np.asarray(data['close']) >= np.asarray(data['open']),
+                                          self.accent_color, self.secondary_color)
+                    draw_volume(panel_ax, x, data['volume'], colors)
+                else:
+                    panel_ax.plot(x, data[panel], color=self.accent_color, linewidth=2)
+                panel_ax.set_ylabel(panel.replace('_', ' ').title(), fontsize=14, color=self.text_color)
 
             # Styling
             ax.set_title(title, fontsize=32, color=self.text_color, pad=20, fontweight='bold')
-            ax.grid(True, alpha=0.2, color=self.grid_color)
-            ax.spines['top'].set_visible(False)
-            ax.spines['right'].set_visible(False)
-            ax.spines['left'].set_color(self.grid_color)
-            ax.spines['bottom'].set_color(self.grid_color)
-            ax.tick_params(colors=self.text_color, labelsize=14)
+            for panel_ax in axes:
+                panel_ax.set_facecolor(self.bg_color)
+                panel_ax.grid(True, alpha=0.2, color=self.grid_color)
+                panel_ax.spines['top'].set_visible(False)
+                panel_ax.spines['right'].set_visible(False)
+                panel_ax.spines['left'].set_color(self.grid_color)
+                panel_ax.spines['bottom'].set_color(self.grid_color)
+                panel_ax.tick_params(colors=self.text_color, labelsize=14)
+            if is_date:
+                axes[-1].xaxis_date()
+
+            events = data.get('events') or []
+            if events:
+                event_x, _ = to_plot_x(np.array([e[0] for e in events]))
+                draw_event_markers(axes, event_x, [e[1] for e in events], color=self.primary_color)
 
             # Add annotations if provided
             if annotations:
                 for i, annotation in enumerate(annotations):
                     ax.text(
-                        0.05, 0.95 - (i * 0.08),
+                        0.05, 0.95 - (i * 0.08 * len(panels) ** 0.5),
                         annotation,
                         transform=ax.transAxes,
                         fontsize=18,
@@ -154,15 +332,59 @@ class SceneGenerator:
                         bbox=dict(boxstyle='round', facecolor=self.bg_color, alpha=0.8, edgecolor=self.accent_color)
                     )
 
-            plt.tight_layout()
+            fig.tight_layout()
 
             if not output_path:
                 output_path = self.output_dir / f"chart_{title.lower().replace(' ', '_')}.png"
 
-            plt.savefig(output_path, facecolor=self.bg_color, dpi=100)
-            plt.close()
+            return self._finish_scene(self._figure_buffer(fig), output_path)
 
-            return str(output_path)
+    def create_chart_animation(
+        self,
+        title: str,
+        data: Optional[Dict] = None,
+        duration: float = 5.0,
+        fps: int = 30,
+        zoom_window: Optional[Tuple] = None,
+        cues: Optional[List[Tuple[float, str]]] = None
+    ) -> AnimatedChart:
+        """
+        Create an animated line chart scene.
+
+        Nothing is rendered here: the compositor pulls frames from the
+        returned AnimatedChart while it encodes.
+
+        Args:
+            title: Chart title
+            data: Chart data (if None, generates placeholder), as for
+                generate_chart_scene
+            duration: Animation length in seconds
+            fps: Output frame rate
+            zoom_window: Optional (start, end) x range to pan/zoom into
+            cues: (time in seconds, text) annotations to pop in
+
+        Returns:
+            AnimatedChart frame source
+        """
+        if data is None:
+            data = self._placeholder_chart_data()
+        return AnimatedChart(self, title, data, duration, fps=fps, zoom_window=zoom_window, cues=cues)
+
+    def _placeholder_chart_data(self, ohlc: bool = False, points: int = 100) -> Dict:
+        """Random-walk series for charts without real data."""
+        x = np.arange(0, points)
+        close = 90000 + np.cumsum(np.random.randn(points) * 1000)
+        data = {'x': x, 'y': close, 'label': 'BTC Price'}
+        if ohlc:
+            open_ = np.concatenate([[close[0]], close[:-1]])
+            spread = np.abs(np.random.randn(points)) * 500
+            data.update({
+                'open': open_, 'close': close,
+                'high': np.maximum(open_, close) + spread,
+                'low': np.minimum(open_, close) - spread,
+                'volume': np.abs(np.random.randn(points)) * 1000 + 500,
+            })
+        return data
 
     def generate_diagram_scene(
         self,
@@ -174,6 +396,9 @@ class SceneGenerator:
         """
         Generate a diagram scene (flow chart, comparison, framework).
 
+        Layout and text fitting are done by DiagramEngine, which sizes
+        shapes and wraps/shrinks labels so any number of elements fits.
+
         Args:
             title: Diagram title
             diagram_type: Type ('flow', 'comparison', 'framework')
@@ -183,138 +408,141 @@ class SceneGenerator:
         Returns:
             Path to generated image
         """
-        with plt.style.context('dark_background'):
-            fig, ax = plt.subplots(figsize=(19.2, 10.8), dpi=100)
-            fig.patch.set_facecolor(self.bg_color)
-            ax.set_facecolor(self.bg_color)
-            ax.set_xlim(0, 10)
-            ax.set_ylim(0, 10)
-            ax.axis('off')
+        layout = self.diagram_engine.layout(diagram_type, title, elements)
+        frame = self.diagram_engine.render(layout)
 
-            # Title
-            ax.text(5, 9.5, title, ha='center', va='top', fontsize=36,
-                   color=self.primary_color, fontweight='bold')
+        if not output_path:
+            output_path = self.output_dir / f"diagram_{title.lower().replace(' ', '_')}.png"
 
-            if diagram_type == "flow":
-                self._draw_flow_diagram(ax, elements)
-            elif diagram_type == "comparison":
-                self._draw_comparison_diagram(ax, elements)
-            elif diagram_type == "framework":
-                self._draw_framework_diagram(ax, elements)
+        return self._finish_scene(frame, output_path)
 
-            plt.tight_layout()
+    def generate_character_scene(
+        self,
+        text: str,
+        pose: str = "explaining",
+        expression: str = "neutral",
+        output_path: Optional[str] = None
+    ) -> str:
+        """
+        Generate a character scene: the stickman on the left, text on the right.
 
-            if not output_path:
-                output_path = self.output_dir / f"diagram_{title.lower().replace(' ', '_')}.png"
-
-            plt.savefig(output_path, facecolor=self.bg_color, dpi=100)
-            plt.close()
-
-            return str(output_path)
-
-    def _draw_flow_diagram(self, ax, elements: List[str]):
-        """Draw a flow diagram."""
-        y_start = 7
-        y_step = 2
-        box_height = 0.8
-
-        for i, element in enumerate(elements):
-            y = y_start - (i * y_step)
-
-            # Box
-            rect = patches.FancyBboxPatch(
-                (2, y - box_height/2), 6, box_height,
-                boxstyle="round,pad=0.1",
-                edgecolor=self.primary_color,
-                facecolor=self.bg_color,
-                linewidth=3
-            )
-            ax.add_patch(rect)
-
-            # Text
-            ax.text(5, y, element, ha='center', va='center',
-                   fontsize=20, color=self.text_color, wrap=True)
-
-            # Arrow to next element
-            if i < len(elements) - 1:
-                ax.annotate('', xy=(5, y - box_height/2 - 0.2),
-                           xytext=(5, y - box_height/2 - y_step + 0.2),
-                           arrowprops=dict(arrowstyle='->', lw=3, color=self.accent_color))
-
-    def _draw_comparison_diagram(self, ax, elements: List[str]):
-        """Draw a comparison diagram (split screen)."""
-        if len(elements) != 2:
-            elements = elements[:2] + [''] * (2 - len(elements))
-
-        # Left side
-        rect_left = patches.FancyBboxPatch(
-            (0.5, 2), 4, 5,
-            boxstyle="round,pad=0.2",
-            edgecolor=self.secondary_color,
-            facecolor=self.bg_color,
-            linewidth=3
-        )
-        ax.add_patch(rect_left)
-        ax.text(2.5, 4.5, elements[0], ha='center', va='center',
-               fontsize=24, color=self.text_color, wrap=True)
-
-        # Right side
-        rect_right = patches.FancyBboxPatch(
-            (5.5, 2), 4, 5,
-            boxstyle="round,pad=0.2",
-            edgecolor=self.accent_color,
-            facecolor=self.bg_color,
-            linewidth=3
+        Args:
+            text: What the character is saying
+            pose: Pose name (see visuals.character.POSES)
+            expression: Expression name (see visuals.character.EXPRESSIONS)
+            output_path: Output file path
+
+        Returns:
+            Path to generated image
+        """
+        img = self._create_base_image()
+        draw = ImageDraw.Draw(img)
+
+        # Text panel on the right 55% of the frame
+        margin = int(80 * self.scale)
+        box = (int(self.width * 0.42), margin, self.width - margin, self.height - margin)
+        size, lines = fit_text(text, box[2] - box[0], box[3] - box[1],
+                               self._font_size(72), self._font_size(28))
+        font = get_font(size)
+        step = line_height(size) * LINE_SPACING
+        y = (box[1] + box[3]) / 2 - step * (len(lines) - 1) / 2
+        for line in lines:
+            draw.text((box[0], y), line, fill=self.text_color, font=font, anchor='lm')
+            y += step
+
+        frame = np.array(img)
+        height = int(self.height * 0.75)
+        self.character.sprite(pose, expression, height).blit(frame, int(self.width * 0.2), int(self.height * 0.92))
+
+        if not output_path:
+            output_path = self.output_dir / f"character_{pose}.png"
+
+        return self._finish_scene(frame, output_path)
+
+    def create_narrator_animation(
+        self,
+        background,
+        duration: float,
+        pose: str = "explaining",
+        expression: str = "neutral"
+    ) -> CharacterAnimation:
+        """
+        Place the narrator in the bottom-right corner of a scene.
+
+        The narrator starts neutral and gestures into `pose`, then holds
+        it. Each frame is a sprite blend over the character's bounding
+        box; no drawing happens after the first use of a pose.
+
+        Args:
+            background: Scene frame, or a frame source such as AnimatedChart
+            duration: Scene duration in seconds
+            pose: Pose to gesture into
+            expression: Expression name
+
+        Returns:
+            CharacterAnimation frame source
+        """
+        if pose == 'pointing':
+            pose = 'pointing_left'  # Narrator stands at the right edge
+        keyframes = [(0.0, 'neutral')]
+        if pose != 'neutral':
+            keyframes.append((0.3, pose))
+        return CharacterAnimation(
+            self.character, background, keyframes, duration,
+            position=self.narrator_position, height=self.narrator_height,
+            expression=expression
         )
-        ax.add_patch(rect_right)
-        ax.text(7.5, 4.5, elements[1], ha='center', va='center',
-               fontsize=24, color=self.text_color, wrap=True)
-
-        # VS text
-        ax.text(5, 4.5, "VS", ha='center', va='center',
-               fontsize=48, color=self.primary_color, fontweight='bold')
-
-    def _draw_framework_diagram(self, ax, elements: List[str]):
-        """Draw a framework diagram (circular or hierarchical)."""
-        # Simple 3-layer circular framework
-        center_x, center_y = 5, 4.5
-
-        if len(elements) >= 3:
-            # Center element
-            circle_center = patches.Circle(
-                (center_x, center_y), 0.8,
-                edgecolor=self.primary_color,
-                facecolor=self.bg_color,
-                linewidth=3
-            )
-            ax.add_patch(circle_center)
-            ax.text(center_x, center_y, elements[0], ha='center', va='center',
-                   fontsize=16, color=self.text_color)
-
-            # Surrounding elements
-            radius = 2.5
-            angles = np.linspace(0, 2*np.pi, len(elements[1:]), endpoint=False)
-
-            for i, (angle, element) in enumerate(zip(angles, elements[1:])):
-                x = center_x + radius * np.cos(angle)
-                y = center_y + radius * np.sin(angle)
-
-                circle = patches.Circle(
-                    (x, y), 0.7,
-                    edgecolor=self.accent_color,
-                    facecolor=self.bg_color,
-                    linewidth=2
-                )
-                ax.add_patch(circle)
-
-                # Wrap text
-                wrapped = element[:15] + '...' if len(element) > 15 else element
-                ax.text(x, y, wrapped, ha='center', va='center',
-                       fontsize=14, color=self.text_color)
-
-                # Line to center
-                ax.plot([center_x, x], [center_y, y],
-                       color=self.grid_color, linewidth=2, linestyle='--', alpha=0.5)
+
+    def _card_renderer(self) -> CardRenderer:
+        if self._cards is None:
+            self._cards = CardRenderer(self.width, self.height, {
+                'bg': self.bg_color,
+                'primary': self.primary_color,
+                'secondary': self.secondary_color,
+                'accent': self.accent_color,
+                'text': self.text_color,
+                'grid': self.grid_color,
+            }, scale=self.scale)
+        return self._cards
+
+    def generate_card_scenes(self, cards: List[Tuple[str, Dict, str]]) -> List[str]:
+        """
+        Generate card scenes (tweet, headline, quote) in one batch.
+
+        All cards go through the same browser: several cards per page
+        load, pages rendering concurrently. Requires Jinja2 and
+        Playwright with Chromium installed.
+
+        Args:
+            cards: (kind, fields, output_path) per card. Fields by kind:
+                tweet: name, handle, text, timestamp
+                headline: headlines (list), source, date
+                quote: text, author
+
+        Returns:
+            Paths to generated images, in order
+        """
+        frames = self._card_renderer().render_batch([(kind, fields) for kind, fields, _ in cards])
+        return [
+            self._finish_scene(frame, output_path or self.output_dir / f"card_{i:02d}_{kind}.png")
+            for i, (frame, (kind, _, output_path)) in enumerate(zip(frames, cards), 1)
+        ]
+
+    def generate_card_scene(self, kind: str, fields: Dict, output_path: Optional[str] = None) -> str:
+        """
+        Generate a single card scene (see generate_card_scenes()).
+
+        Args:
+            kind: Card template ('tweet', 'headline', 'quote')
+            fields: Template fields
+            output_path: Output file path
+
+        Returns:
+            Path to generated image
+        """
+        if not output_path:
+            output_path = self.output_dir / f"card_{kind}.png"
+        return self.generate_card_scenes([(kind, fields, output_path)])[0]
 
     def generate_text_overlay(
         self,
@@ -345,7 +573,7 @@ class SceneGenerator:
         draw = ImageDraw.Draw(img)
 
         try:
-            font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 80)
+            font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", self._font_size(80))
         except:
             font = ImageFont.load_default()
 
@@ -363,7 +591,7 @@ class SceneGenerator:
             text_y = (self.height - text_h) // 2
 
         # Draw text with shadow for better visibility
-        shadow_offset = 4
+        shadow_offset = max(1, int(4 * self.scale))
         draw.text((text_x + shadow_offset, text_y + shadow_offset), text,
                  fill='#000000', font=font)
         draw.text((text_x, text_y), text, fill=self.primary_color, font=font)
@@ -371,7 +599,67 @@ class SceneGenerator:
         if not output_path:
             output_path = self.output_dir / "text_overlay.png"
 
-        img.save(output_path)
+        return self._finish_scene(np.asarray(img), output_path)
+
+    def generate_contact_sheet(
+        self,
+        scene_paths: List[str],
+        output_path: Optional[str] = None,
+        columns: int = 4,
+        thumb_width: int = 480,
+        labels: Optional[List[str]] = None
+    ) -> str:
+        """
+        Tile all scenes into a single overview image for quick review.
+
+        Args:
+            scene_paths: Scene image paths, in timeline order
+            output_path: Output file path
+            columns: Thumbnails per row
+            thumb_width: Width of each thumbnail in pixels
+            labels: Optional caption per scene (defaults to the file name)
+
+        Returns:
+            Path to generated image
+        """
+        if not scene_paths:
+            raise ValueError("No scenes to put on the contact sheet")
+
+        thumb_height = int(thumb_width * self.height / self.width)
+        label_height = 24
+        gap = 8
+        columns = max(1, min(columns, len(scene_paths)))
+        rows = (len(scene_paths) + columns - 1) // columns
+
+        sheet = Image.new(
+            'RGB',
+            (columns * (thumb_width + gap) + gap, rows * (thumb_height + label_height + gap) + gap),
+            self.grid_color
+        )
+        draw = ImageDraw.Draw(sheet)
+        font = ImageFont.load_default()
+
+        for i, scene_path in enumerate(scene_paths):
+            row, col = divmod(i, columns)
+            x = gap + col * (thumb_width + gap)
+            y = gap + row * (thumb_height + label_height + gap)
+
+            frame = self.get_frame(scene_path)
+            if frame is not None:
+                scene = Image.fromarray(frame)
+            else:
+                scene = Image.open(scene_path)
+            thumb = scene.convert('RGB').resize((thumb_width, thumb_height), Image.BILINEAR)
+            sheet.paste(thumb, (x, y))
+
+            label = labels[i] if labels and i < len(labels) else Path(scene_path).name
+            draw.text((x + 4, y + thumb_height + 4), f"{i + 1:02d}  {label}"[:70],
+                      fill=self.text_color, font=font)
+
+        if not output_path:
+            output_path = self.output_dir / "contact_sheet.png"
+        sheet.save(output_path)
+
         return str(output_path)
 
 
@@ -403,4 +691,6 @@ if __name__ == "__main__":
     )
     print("✅ Diagram scene generated")
 
+    generator.flush()
+
     print("\n✨ All test scenes generated in output/scenes/")
@@ -0,0 +1,190 @@
+"""
+Sprites - Pre-rendered RGBA overlays blended onto frames with NumPy.
+
+A Sprite stores the pixels it covers, premultiplied by alpha, together
+with their inverse alpha, so drawing it onto a frame is one gather,
+multiply-add and scatter over just those pixels:
+
+    out = dst * (255 - a) / 255 + src * a / 255
+
+YUVSprite does the same on packed yuv420p frames (as the PyAV encoder
+holds them), so overlays can be drawn after the RGB to YUV conversion.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+class Sprite:
+    """RGBA image prepared for fast repeated alpha blending."""
+
+    def __init__(self, rgba: np.ndarray, anchor: Tuple[int, int] = (0, 0)):
+        """
+        Initialize sprite.
+
+        Args:
+            rgba: RGBA pixels (height, width, 4), uint8, straight alpha
+            anchor: Position of the sprite's top-left corner relative to
+                the point it is placed at (e.g. (-w // 2, -h) to place by
+                the bottom center)
+        """
+        rgba = np.asarray(rgba, dtype=np.uint8)
+        alpha = rgba[:, :, 3]
+
+        # Crop to the visible pixels; the anchor keeps the placement stable
+        rows = np.flatnonzero(alpha.any(axis=1))
+        cols = np.flatnonzero(alpha.any(axis=0))
+        if len(rows) == 0:
+            rows = cols = np.array([0])
+        top, bottom = rows[0], rows[-1] + 1
+        left, right = cols[0], cols[-1] + 1
+        rgba = rgba[top:bottom, left:right]
+
+        self.anchor = (anchor[0] + int(left), anchor[1] + int(top))
+        self.height, self.width = rgba.shape[:2]
+        self.rgba = rgba
+
+        # Only covered pixels take part in blending (line art is mostly empty)
+        self.rows, self.cols = np.nonzero(rgba[:, :, 3])
+        alpha = rgba[self.rows, self.cols, 3:4].astype(np.uint16)
+        self.premultiplied = ((rgba[self.rows, self.cols, :3].astype(np.uint16) * alpha + 127) // 255).ravel()
+        self.inverse_alpha = np.repeat(255 - alpha.ravel(), 3)
+
+        # Byte offsets into the last frame layout/position drawn to
+        self._placement = None
+        self._offsets = None
+        self._keep = None
+
+    def _covered_offsets(self, frame_shape, x0: int, y0: int):
+        """Flat byte offsets of the covered values in a frame, and a mask of the ones kept."""
+        fh, fw, channels = frame_shape
+        rows, cols = self.rows + y0, self.cols + x0
+        keep = None
+        if x0 < 0 or y0 < 0 or x0 + self.width > fw or y0 + self.height > fh:
+            # Partly off-frame: keep the pixels that land inside
+            inside = (rows >= 0) & (rows < fh) & (cols >= 0) & (cols < fw)
+            rows, cols = rows[inside], cols[inside]
+            keep = np.repeat(inside, 3)
+        pixel = (rows.astype(np.intp) * fw + cols) * channels
+        return (pixel[:, None] + np.arange(3)).ravel(), keep
+
+    def _frame_offsets(self, frame_shape, x0: int, y0: int):
+        """Covered offsets, cached per frame layout and placement."""
+        key = (frame_shape, x0, y0)
+        if key != self._placement:
+            self._offsets, self._keep = self._covered_offsets(frame_shape, x0, y0)
+            self._placement = key
+        return self._offsets, self._keep
+
+    def blit(self, frame: np.ndarray, x: int, y: int):
+        """
+        Alpha-blend the sprite onto a frame in place.
+
+        Args:
+            frame: Writable, C-contiguous RGB or RGBA uint8 frame (alpha
+                is left as is)
+            x, y: Placement point (see anchor)
+        """
+        offsets, keep = self._frame_offsets(frame.shape, x + self.anchor[0], y + self.anchor[1])
+        premultiplied, inverse_alpha = self.premultiplied, self.inverse_alpha
+        if keep is not None:
+            premultiplied, inverse_alpha = premultiplied[keep], inverse_alpha[keep]
+
+        values = frame.reshape(-1)
+        blended = np.take(values, offsets).astype(np.uint16)
+        blended *= inverse_alpha
+        blended += 127
+        blended //= 255
+        blended += premultiplied
+        values[offsets] = blended
+
+    def bounds(self, x: int, y: int, frame_shape) -> Optional[Tuple[slice, slice]]:
+        """Frame rows and columns covered by the sprite when placed at (x, y)."""
+        fh, fw = frame_shape[:2]
+        x0, y0 = x + self.anchor[0], y + self.anchor[1]
+        fx0, fy0 = max(x0, 0), max(y0, 0)
+        fx1, fy1 = min(x0 + self.width, fw), min(y0 + self.height, fh)
+        if fx1 <= fx0 or fy1 <= fy0:
+            return None
+        return slice(fy0, fy1), slice(fx0, fx1)
+
+
+class YUVSprite(Sprite):
+    """
+    RGBA image prepared for alpha blending onto packed yuv420p frames.
+
+    Frames are the (height * 3 / 2, width) arrays of VideoFrame.to_ndarray():
+    the Y plane, then the U and V planes packed row after row. Luma is
+    blended per pixel, chroma with the alpha averaged over each 2x2 block,
+    all in one gather/scatter. Colors are converted with the BT.601
+    limited-range matrix libswscale uses for RGB input.
+    """
+
+    def __init__(self, rgba: np.ndarray, anchor: Tuple[int, int] = (0, 0)):
+        """
+        Initialize sprite.
+
+        Args:
+            rgba: RGBA pixels (height, width, 4), uint8, straight alpha
+            anchor: Position of the top-left corner relative to the
+                placement point; placements snap to even coordinates
+        """
+        sprite = Sprite(rgba, anchor)
+        rgba = sprite.rgba
+        # Chroma is subsampled 2x2: pad to whole blocks
+        rgba = np.pad(rgba, ((0, rgba.shape[0] % 2), (0, rgba.shape[1] % 2), (0, 0)))
+
+        self.anchor = sprite.anchor
+        self.height, self.width = rgba.shape[:2]
+        self.rgba = rgba
+
+        r, g, b = (rgba[:, :, i].astype(np.float32) for i in range(3))
+        alpha = rgba[:, :, 3].astype(np.float32) / 255
+        y = 16 + 0.256788 * r + 0.504129 * g + 0.097906 * b
+        u = 128 - 0.148223 * r - 0.290993 * g + 0.439216 * b
+        v = 128 + 0.439216 * r - 0.367788 * g - 0.071427 * b
+
+        def blocks(plane):
+            h, w = plane.shape
+            return plane.reshape(h // 2, 2, w // 2, 2).mean(axis=(1, 3))
+
+        chroma_alpha = blocks(alpha)
+        planes = [
+            (y * alpha, alpha),
+            (blocks(u * alpha), chroma_alpha),
+            (blocks(v * alpha), chroma_alpha),
+        ]
+
+        # Covered samples per plane: (plane index, rows, cols)
+        self._samples = []
+        premultiplied, inverse_alpha = [], []
+        for i, (values, a) in enumerate(planes):
+            rows, cols = np.nonzero(a > 0)
+            self._samples.append((i, rows, cols))
+            premultiplied.append(np.round(values[rows, cols]))
+            inverse_alpha.append(255 - np.round(a[rows, cols] * 255))
+        self.premultiplied = np.concatenate(premultiplied).astype(np.uint16)
+        self.inverse_alpha = np.concatenate(inverse_alpha).astype(np.uint16)
+
+        self._placement = None
+        self._offsets = None
+        self._keep = None
+
+    def _covered_offsets(self, frame_shape, x0: int, y0: int):
+        rows_total, fw = frame_shape
+        fh = rows_total * 2 // 3
+        x0, y0 = x0 & ~1, y0 & ~1
+        offsets, keeps = [], []
+        for i, rows, cols in self._samples:
+            if i == 0:
+                base, width, height = 0, fw, fh
+                rows, cols = rows + y0, cols + x0
+            else:
+                base, width, height = fh * fw + (i - 1) * (fh * fw // 4), fw // 2, fh // 2
+                rows, cols = rows + y0 // 2, cols + x0 // 2
+            inside = (rows >= 0) & (rows < height) & (cols >= 0) & (cols < width)
+            offsets.append(base + (rows[inside].astype(np.intp) * width + cols[inside]))
+            keeps.append(inside)
+        keep = np.concatenate(keeps)
+        return np.concatenate(offsets), None if keep.all() else keep
@@ -0,0 +1,124 @@
+"""
+Tests for video.incremental: cached per-scene segments joined by stream copy.
+
+Needs MoviePy, Pillow and an ffmpeg binary (skipped otherwise).
+"""
+
+import re
+import subprocess
+import sys
+import wave
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+np = pytest.importorskip("numpy")
+Image = pytest.importorskip("PIL.Image")
+pytest.importorskip("moviepy")
+
+from video.compositor import VideoCompositor  # noqa: E402
+from video.ffmpeg_utils import get_ffmpeg_binary  # noqa: E402
+from video.incremental import IncrementalRenderer  # noqa: E402
+
+
+def write_tone(path: Path, seconds: float, rate: int = 22050):
+    t = np.arange(int(seconds * rate)) / rate
+    samples = (0.3 * np.sin(2 * np.pi * 440 * t) * 32767).astype(np.int16)
+    with wave.open(str(path), 'wb') as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(samples.tobytes())
+
+
+def stream_duration(path: str, stream: str) -> float:
+    """Length of one stream of a file ('v' or 'a'), read by demuxing it."""
+    result = subprocess.run(
+        [get_ffmpeg_binary(), '-hide_banner', '-i', str(path), '-map', f'0:{stream}',
+         '-c', 'copy', '-f', 'null', '-'],
+        capture_output=True
+    )
+    times = re.findall(r'time=(\d+):(\d+):(\d+(?:\.\d+)?)', result.stderr.decode(errors='replace'))
+    assert times, result.stderr.decode(errors='replace')
+    hours, minutes, seconds = times[-1]
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+
+def make_scenes(tmp_path: Path, resolution, count: int = 3, seconds: float = 4.5, transition='crossfade'):
+    scenes = []
+    for i in range(count):
+        image = tmp_path / f"scene_{i}.png"
+        Image.new('RGB', resolution, (60 * i, 80, 160)).save(image)
+        audio = tmp_path / f"voiceover_{i}.wav"
+        write_tone(audio, seconds)
+        scenes.append({'id': f"s{i}", 'title': f"Scene {i}", 'image': str(image), 'audio': str(audio),
+                       'duration': 1.0, 'transition': transition})
+    return scenes
+
+
+@pytest.mark.parametrize("profile, fps, transition", [
+    ('upload', 30, 'crossfade'),
+    # Watch mode: preview proxy settings, cuts only
+    ('draft', 2, None),
+])
+def test_joined_video_track_matches_audio(tmp_path, profile, fps, transition):
+    resolution = (320, 180)
+    compositor = VideoCompositor(output_dir=str(tmp_path / "video"), resolution=resolution,
+                                 fps=fps, encoder_profile=profile)
+    scenes = make_scenes(tmp_path, resolution, transition=transition)
+
+    video_path = IncrementalRenderer(compositor).render(scenes, "inc.mp4")
+
+    audio = stream_duration(video_path, 'a')
+    video = stream_duration(video_path, 'v')
+    assert audio == pytest.approx(13.5, abs=0.1)
+    assert video == pytest.approx(audio, abs=max(0.1, 1.5 / fps))
+
+
+def test_unchanged_scenes_are_reused(tmp_path):
+    resolution = (320, 180)
+    compositor = VideoCompositor(output_dir=str(tmp_path / "video"), resolution=resolution,
+                                 fps=10, encoder_profile='draft')
+    scenes = make_scenes(tmp_path, resolution, seconds=1.0)
+
+    renderer = IncrementalRenderer(compositor)
+    renderer.render(scenes, "inc.mp4")
+    # Every scene, cut at its crossfade windows
+    assert [(segment['key'], segment['part']) for segment in renderer.encoded] == [
+        ('s0', 'body'), ('s0', 'out'), ('s1', 'in'), ('s1', 'body'), ('s1', 'out'), ('s2', 'in'), ('s2', 'body')
+    ]
+
+    Image.new('RGB', resolution, (255, 255, 255)).save(scenes[0]['image'])
+    renderer = IncrementalRenderer(compositor)
+    renderer.render(scenes, "inc.mp4")
+    # The edited scene and the crossfade window it mixes into
+    assert [(segment['key'], segment['part']) for segment in renderer.encoded] == [
+        ('s0', 'body'), ('s0', 'out'), ('s1', 'in')
+    ]
+
+
+def test_revoiced_scene_keeps_neighbour_segments(tmp_path):
+    resolution = (320, 180)
+    compositor = VideoCompositor(output_dir=str(tmp_path / "video"), resolution=resolution,
+                                 fps=10, encoder_profile='draft')
+    scenes = make_scenes(tmp_path, resolution, seconds=1.0)
+    IncrementalRenderer(compositor).render(scenes, "inc.mp4")
+
+    # New voiceover, new length; the neighbours only see its edge frames
+    write_tone(Path(scenes[1]['audio']), 1.6)
+    renderer = IncrementalRenderer(compositor)
+    video_path = renderer.render(scenes, "inc.mp4")
+    assert {segment['key'] for segment in renderer.encoded} == {'s1'}
+    assert stream_duration(video_path, 'v') == pytest.approx(3.6, abs=0.15)
+
+
+def test_fingerprint_ignores_runtime_objects(tmp_path):
+    resolution = (320, 180)
+    compositor = VideoCompositor(output_dir=str(tmp_path / "video"), resolution=resolution, fps=10)
+    scene = make_scenes(tmp_path, resolution, count=1, seconds=1.0)[0]
+
+    renderer = IncrementalRenderer(compositor)
+    fingerprint = renderer.scene_fingerprint(scene)
+    assert renderer.scene_fingerprint(dict(scene, frame=object(), animation=object())) == fingerprint
@@ -0,0 +1,59 @@
+"""
+Tests for market.market_data: date hints in [SCREEN] descriptions and the column cache.
+"""
+
+import sys
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+np = pytest.importorskip("numpy")
+
+from market.market_data import MarketDataStore, parse_date_range  # noqa: E402
+
+
+def days(window):
+    return tuple(str(t.astype('datetime64[D]')) for t in window)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Nifty 50 chart, July 18, 2025 - dramatic drop", ("2025-07-18", "2025-07-18")),
+    ("Bitcoin chart, May-June 2025", ("2025-05-01", "2025-06-30")),
+    ("Gold price, November-February 2024", ("2024-11-01", "2025-02-28")),
+    ("Oil chart, June 2025", ("2025-06-01", "2025-06-30")),
+    ("Dollar index in 2022", ("2022-01-01", "2022-12-31")),
+    ("S&P 500 2020-2022", ("2020-01-01", "2022-12-31")),
+    ("Chart from 2021 to 2023", ("2021-01-01", "2023-12-31")),
+    ("Nasdaq from March 2020 to June 2021", ("2020-03-01", "2021-06-30")),
+    ("Yields, Sept 2019 – Feb 2020", ("2019-09-01", "2020-02-29")),
+])
+def test_parse_date_range(text, expected):
+    assert days(parse_date_range(text)) == expected
+
+
+def test_parse_date_range_relative_to_anchor():
+    window = parse_date_range("Price over next 4 months", anchor=date(2025, 7, 18))
+    assert days(window) == ("2025-07-18", "2025-11-18")
+    assert parse_date_range("A chart with no dates") is None
+
+
+def write_csv(path: Path, closes):
+    rows = [f"2025-01-{day:02d},{close}" for day, close in enumerate(closes, 1)]
+    path.write_text("timestamp,close\n" + "\n".join(rows) + "\n")
+
+
+def test_cache_rebuild_leaves_mapped_columns_intact(tmp_path):
+    source = tmp_path / "BTC.csv"
+    write_csv(source, [100.0 + i for i in range(20)])
+    series = MarketDataStore(str(tmp_path), cache_dir=str(tmp_path / "cache")).load("BTC")
+
+    # The source shrinks; another store rebuilds the cache under the first one's maps
+    write_csv(source, [5.0, 6.0])
+    rebuilt = MarketDataStore(str(tmp_path), cache_dir=str(tmp_path / "cache")).load("BTC")
+
+    assert list(rebuilt['close']) == [5.0, 6.0]
+    assert list(series['close']) == [100.0 + i for i in range(20)]
+    assert not list((tmp_path / "cache" / "BTC").glob("*.partial"))
@@ -0,0 +1,39 @@
+"""
+Tests for audio.processing: BS.1770 loudness against reference tones.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+np = pytest.importorskip("numpy")
+
+from audio.processing import integrated_loudness, normalize_loudness  # noqa: E402
+
+
+def tone(dbfs: float, seconds: float, rate: int, freq: float = 997.0):
+    t = np.arange(int(seconds * rate)) / rate
+    return 10 ** (dbfs / 20) * np.sin(2 * np.pi * freq * t)
+
+
+@pytest.mark.parametrize("rate", [22050, 44100, 48000])
+def test_reference_sine_reads_within_tolerance(rate):
+    # BS.1770: a full-scale 997 Hz sine in one channel reads -3.01 LKFS
+    assert integrated_loudness(tone(-20.0, 10.0, rate), rate) == pytest.approx(-23.01, abs=0.1)
+
+
+def test_quiet_passages_are_gated_out():
+    # EBU Tech 3341 case 3, one channel: 10 s at -36, 60 s at -23, 10 s at -36 (LUFS)
+    rate = 48000
+    samples = np.concatenate([tone(-33.0, 10, rate, 1000), tone(-20.0, 60, rate, 1000), tone(-33.0, 10, rate, 1000)])
+    assert integrated_loudness(samples, rate) == pytest.approx(-23.0, abs=0.1)
+
+
+def test_normalized_audio_hits_target():
+    rate = 44100
+    samples, _ = normalize_loudness(tone(-30.0, 5.0, rate), rate, target_lufs=-16.0)
+    assert integrated_loudness(samples, rate) == pytest.approx(-16.0, abs=0.1)
+    assert integrated_loudness(np.zeros(rate), rate) == float('-inf')
@@ -0,0 +1,69 @@
+"""
+Tests for VideoGenerator runs on a warm generator (as in watch mode).
+
+Needs MoviePy, Matplotlib, Pillow and an ffmpeg binary (skipped otherwise).
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+pytest.importorskip("numpy")
+pytest.importorskip("PIL.Image")
+pytest.importorskip("matplotlib")
+pytest.importorskip("moviepy")
+
+from video_generator import VideoGenerator  # noqa: E402
+
+
+SCRIPT = """# Test
+
+### [0:00-0:04] HOOK {{#hook}}
+
+```
+[SCREEN]: {hook_screen}
+(VOICEOVER):
+Markets moved before the news.
+```
+
+### [0:04-0:08] CLOSE {{#close}}
+
+```
+[SCREEN]: Text: regimes, not reactions
+(VOICEOVER):
+That is the whole idea.
+```
+"""
+
+
+def test_second_run_does_not_inherit_previous_run_state(tmp_path):
+    script = tmp_path / "episode.md"
+    script.write_text(SCRIPT.format(hook_screen="Price chart showing a sharp drop"))
+
+    generator = VideoGenerator(
+        output_dir=str(tmp_path / "out"), tts_provider="synthetic", resolution=(320, 180), fps=5,
+        use_llm_for_scenes=False, encoder_profile="draft", market_data_dir=None,
+        normalize_audio=False, transition=None
+    )
+    generator.keep_warm = True
+    try:
+        generator.generate_from_script(str(script), resume=True, incremental=True)
+        assert len(generator.scene_animations) == 1
+        first_run_scenes = set(generator.scene_types)
+
+        # The hook is no longer an animated chart
+        script.write_text(SCRIPT.format(hook_screen="Text: the pattern interrupt"))
+        generator.generate_from_script(str(script), resume=True, incremental=True)
+    finally:
+        generator.keep_warm = False
+        generator.scene_generator.close()
+        generator.tts_generator.close()
+
+    assert generator.scene_animations == {}
+    assert set(generator.scene_types) != first_run_scenes
+    assert len(generator.scene_types) == 2
+    # Without a leftover animation the run takes the per-scene segment path
+    assert [segment['key'] for segment in generator.video_segments] == ['hook', 'close']